@@ -0,0 +1,165 @@
+from __future__ import annotations
+import asyncio
+import sys
+from typing import Iterable
+from player_list import PlayerList
+from player_node import PlayerNode
+
+
+class AsyncPlayerList:
+    """An asyncio facade over PlayerList for use from coroutines.
+
+    Operations that touch many nodes (iteration, display, bulk inserts) hand
+    control back to the event loop every yield_every nodes, so a long scan
+    never stalls other tasks. Mutations are serialised by an asyncio.Lock.
+    Iteration and display read an O(1) snapshot() of the list rather than
+    the list itself. A suspended iteration therefore never sees the list
+    change under it, never blocks writers, and may itself insert or delete;
+    it yields the view's detached copies of the nodes. Keyed lookups are
+    O(1) and need no lock.
+    """
+
+    def __init__(self, nodes: Iterable[PlayerNode] = (), yield_every: int = 1000) -> None:
+        if yield_every < 1:
+            raise ValueError("yield_every must be a positive integer")
+        self._list = PlayerList.from_iterable(nodes)
+        self._yield_every = yield_every
+        self._lock = asyncio.Lock()
+
+    @property
+    def length(self) -> int:
+        """Gets the number of nodes in the list.
+
+        Returns:
+            int: The current length of the list.
+        """
+        return self._list.length
+
+    @property
+    def is_empty(self) -> bool:
+        """Checks if the list contains no nodes.
+
+        Returns:
+            bool: True if the list is empty, False otherwise.
+        """
+        return self._list.is_empty
+
+    async def insert_at_head(self, node: PlayerNode) -> None:
+        """Inserts a PlayerNode at the front of the list.
+
+        Args:
+            node: The PlayerNode to insert.
+        """
+        async with self._lock:
+            self._list.insert_at_head(node)
+
+    async def insert_at_tail(self, node: PlayerNode) -> None:
+        """Inserts a PlayerNode at the end of the list.
+
+        Args:
+            node: The PlayerNode to insert.
+        """
+        async with self._lock:
+            self._list.insert_at_tail(node)
+
+    async def extend(self, nodes: Iterable[PlayerNode]) -> None:
+        """Appends a batch of PlayerNodes, yielding to the event loop between slices.
+
+        Each slice of yield_every nodes is linked with PlayerList.extend, so a
+        key clash only rejects the slice it is in.
+
+        Args:
+            nodes: The PlayerNodes to append.
+
+        Raises:
+            ValueError: If a key is already in the list or repeated in a slice.
+        """
+        nodes = list(nodes)
+        step = self._yield_every
+        async with self._lock:
+            for start in range(0, len(nodes), step):
+                self._list.extend(nodes[start:start + step])
+                await asyncio.sleep(0)
+
+    async def find_node_with_key(self, key: str) -> PlayerNode | None:
+        """Finds the node with the specified key.
+
+        Args:
+            key: The key to search for.
+
+        Returns:
+            PlayerNode or None: The node with the specified key, or None if not found.
+        """
+        return self._list.find_node_with_key(key)
+
+    async def delete_node_with_key(self, key: str) -> bool:
+        """Deletes the node with the specified key.
+
+        Args:
+            key: The key to search for and delete.
+
+        Returns:
+            bool: True if a node was found and deleted, False otherwise.
+        """
+        async with self._lock:
+            return self._list.delete_node_with_key(key)
+
+    async def display(self, forward: bool = True) -> None:
+        """Prints the list contents to console in the format of PlayerList.render.
+
+        The list is read from a snapshot taken when the call starts, so the
+        output is consistent, and written yield_every nodes at a time with
+        a return to the event loop after each piece.
+
+        Args:
+            forward: If True, prints from head to tail; if False, tail to head.
+        """
+        if self._list.is_empty:
+            sys.stdout.write("Empty list\n")
+            return
+        separator = ""
+        pieces = []
+        with self._list.snapshot() as view:
+            for node in view if forward else reversed(view):
+                pieces.append(f"{node.key}'{node.name}'")
+                if len(pieces) == self._yield_every:
+                    sys.stdout.write(separator + " -> ".join(pieces))
+                    separator = " -> "
+                    pieces.clear()
+                    await asyncio.sleep(0)
+        sys.stdout.write((separator + " -> ".join(pieces) if pieces else "") + "\n")
+
+    async def reversed(self):
+        """Iterates over a snapshot from tail to head, yielding to the event loop every yield_every nodes.
+
+        Yields:
+            PlayerNode: A copy of each node in the list from tail to head.
+        """
+        with self._list.snapshot() as view:
+            for count, node in enumerate(reversed(view), 1):
+                yield node
+                if count % self._yield_every == 0:
+                    await asyncio.sleep(0)
+
+    def __contains__(self, key: str) -> bool:
+        """Checks whether a node with the given key is in the list.
+
+        Args:
+            key: The key to look for.
+
+        Returns:
+            bool: True if a node with the key is in the list, False otherwise.
+        """
+        return key in self._list
+
+    async def __aiter__(self):
+        """Iterates over a snapshot from head to tail, yielding to the event loop every yield_every nodes.
+
+        Yields:
+            PlayerNode: A copy of each node in the list from head to tail.
+        """
+        with self._list.snapshot() as view:
+            for count, node in enumerate(view, 1):
+                yield node
+                if count % self._yield_every == 0:
+                    await asyncio.sleep(0)
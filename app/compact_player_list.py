@@ -0,0 +1,483 @@
+from __future__ import annotations
+from array import array
+from typing import Iterable
+from player import Player
+from player_list import PlayerList
+from player_node import PlayerNode
+
+# Marks a missing link in the next/prev index arrays.
+_NIL = -1
+# The largest uid an array('q') slot can hold.
+_MAX_UID = 2 ** 63 - 1
+
+
+def _checked_uid(key) -> int:
+    """Converts a node key to the int stored in the uid array.
+
+    Args:
+        key: The node's key.
+
+    Returns:
+        int: The uid.
+
+    Raises:
+        ValueError: If the key is not a uid string, e.g. an IntUIDPlayer's
+            int, or does not fit in a signed 64-bit integer.
+    """
+    if not isinstance(key, str):
+        raise ValueError(f"CompactPlayerList is keyed by uid strings, not {type(key).__name__}")
+    uid = int(key)
+    if not 0 < uid <= _MAX_UID:
+        raise ValueError(f"Player UID {uid} does not fit in a signed 64-bit integer")
+    return uid
+
+
+class CompactPlayerList:
+    """A struct-of-arrays variant of PlayerList for very large rosters.
+
+    Instead of one Player and one PlayerNode object per entry, uids are held in
+    an array('q'), names in a plain list, and the next/prev links as integer
+    slot indexes in two more arrays, so uids must fit in a signed 64-bit
+    integer. The uid index is keyed by int to avoid keeping a uid string per
+    player, but the list is keyed by uid string like PlayerList, so nodes
+    with int keys (IntUIDPlayer) are refused. Freed slots are recycled.
+
+    It supports PlayerList's core API: inserts, deletes, keyed and batch
+    lookups, extend/from_iterable and iteration. It does not offer
+    listeners, snapshots, cursors, splicing or node pools. Nodes handed out
+    (head, tail, lookups, iteration) are read-only CompactPlayerNode views
+    built on demand. Their next/prev follow the list, but a view becomes
+    invalid once its player is deleted.
+    """
+    def __init__(self) -> None:
+        self._uids = array("q")
+        self._names = []
+        self._next = array("q")
+        self._prev = array("q")
+        self._free = []
+        self._head = _NIL
+        self._tail = _NIL
+        self._length = 0
+        self._index = {}
+
+    @classmethod
+    def from_iterable(cls, nodes: Iterable[PlayerNode]) -> CompactPlayerList:
+        """Builds a list from a batch of PlayerNodes in one pass.
+
+        Args:
+            nodes: The PlayerNodes to load, in head to tail order.
+
+        Returns:
+            CompactPlayerList: A new list holding the nodes' players.
+
+        Raises:
+            ValueError: If two nodes share a key or a uid does not fit in 64 bits.
+        """
+        player_list = cls()
+        player_list.extend(nodes)
+        return player_list
+
+    @property
+    def is_empty(self) -> bool:
+        """Checks if the list contains no nodes.
+
+        Returns:
+            bool: True if the list is empty, False otherwise.
+        """
+        return self._head == _NIL
+
+    @property
+    def length(self) -> int:
+        """Gets the number of nodes in the list.
+
+        Returns:
+            int: The current length of the list.
+        """
+        return self._length
+
+    @property
+    def head(self) -> PlayerNode | None:
+        """Gets a view of the first node in the list.
+
+        Returns:
+            CompactPlayerNode or None: The head node, or None if list is empty.
+        """
+        return None if self._head == _NIL else self._node_at(self._head)
+
+    @property
+    def tail(self) -> PlayerNode | None:
+        """Gets a view of the last node in the list.
+
+        Returns:
+            CompactPlayerNode or None: The tail node, or None if list is empty.
+        """
+        return None if self._tail == _NIL else self._node_at(self._tail)
+
+    def insert_at_head(self, node: PlayerNode) -> None:
+        """Inserts the player held by a PlayerNode at the front of the list.
+
+        Args:
+            node: The PlayerNode to insert.
+
+        Raises:
+            ValueError: If the key is already in the list or does not fit in 64 bits.
+        """
+        slot = self._allocate(node)
+        self._next[slot] = self._head
+        if self._head == _NIL:
+            self._tail = slot
+        else:
+            self._prev[self._head] = slot
+        self._head = slot
+
+    def insert_at_tail(self, node: PlayerNode) -> None:
+        """Inserts the player held by a PlayerNode at the end of the list.
+
+        Args:
+            node: The PlayerNode to insert.
+
+        Raises:
+            ValueError: If the key is already in the list or does not fit in 64 bits.
+        """
+        slot = self._allocate(node)
+        self._prev[slot] = self._tail
+        if self._tail == _NIL:
+            self._head = slot
+        else:
+            self._next[self._tail] = slot
+        self._tail = slot
+
+    def insert_at_position(self, node: PlayerNode, position: int) -> None:
+        """Inserts the player held by a PlayerNode at a specific position.
+
+        Args:
+            node: The PlayerNode to insert.
+            position: The position to insert the node at.
+
+        Raises:
+            IndexError: If position is outside the list.
+            ValueError: If the key is already in the list or does not fit in 64 bits.
+        """
+        if position < 0 or position > self.length:
+            raise IndexError("Invalid position")
+        if position == 0:
+            self.insert_at_head(node)
+            return
+        if position == self.length:
+            self.insert_at_tail(node)
+            return
+        current = self._head
+        for _ in range(position - 1):
+            current = self._next[current]
+        slot = self._allocate(node)
+        following = self._next[current]
+        self._next[slot] = following
+        self._prev[slot] = current
+        self._prev[following] = slot
+        self._next[current] = slot
+
+    def extend(self, nodes: Iterable[PlayerNode]) -> None:
+        """Appends the players of a batch of PlayerNodes at the tail, in order.
+
+        The batch is checked before anything is stored, so on error the list
+        is left unchanged.
+
+        Args:
+            nodes: The PlayerNodes whose players are appended, in order.
+
+        Raises:
+            ValueError: If a key is already in the list, appears twice in the
+                batch or does not fit in 64 bits.
+        """
+        nodes = list(nodes)
+        seen = set()
+        for node in nodes:
+            uid = _checked_uid(node.key)
+            if uid in self._index or uid in seen:
+                raise ValueError(f"A player with uid {uid} is already in the list")
+            seen.add(uid)
+        for node in nodes:
+            self.insert_at_tail(node)
+
+    def delete_head(self) -> None:
+        """Removes the first node in the list.
+
+        Raises:
+            IndexError: If the list is empty.
+        """
+        if self.is_empty:
+            raise IndexError("Cannot delete a node from an empty list")
+        self._unlink(self._head)
+
+    def delete_tail(self) -> None:
+        """Removes the last node in the list.
+
+        Raises:
+            IndexError: If the list is empty.
+        """
+        if self.is_empty:
+            raise IndexError("Cannot delete a node from an empty list")
+        self._unlink(self._tail)
+
+    def find_node_with_key(self, key: str) -> PlayerNode | None:
+        """Finds the node with the specified key in O(1) via the index.
+
+        Args:
+            key: The key to search for.
+
+        Returns:
+            CompactPlayerNode or None: A view of the node, or None if not found.
+        """
+        slot = self._slot_for(key)
+        return None if slot is None else self._node_at(slot)
+
+    def delete_node_with_key(self, key: str) -> bool:
+        """Deletes the node with the specified key.
+
+        Args:
+            key: The key to search for and delete.
+
+        Returns:
+            bool: True if a node was found and deleted, False otherwise.
+        """
+        slot = self._slot_for(key)
+        if slot is None:
+            return False
+        self._unlink(slot)
+        return True
+
+    def find_many(self, keys: Iterable[str]) -> dict:
+        """Looks up a batch of keys through the index, O(1) per key.
+
+        Args:
+            keys: The keys to search for.
+
+        Returns:
+            dict: Each key mapped to its node, or None if not found.
+        """
+        return {key: self.find_node_with_key(key) for key in keys}
+
+    def delete_many(self, keys: Iterable[str]) -> dict:
+        """Deletes a batch of keys through the index, O(1) per key.
+
+        Args:
+            keys: The keys to delete.
+
+        Returns:
+            dict: Each key mapped to True if it was deleted, False otherwise.
+        """
+        results = {}
+        for key in keys:
+            results[key] = self.delete_node_with_key(key) or results.get(key, False)
+        return results
+
+    # Rendering and queries only depend on iteration and keyed lookups, so
+    # share PlayerList's implementation.
+    display = PlayerList.display
+    render = PlayerList.render
+    query = PlayerList.query
+
+    def _allocate(self, node: PlayerNode) -> int:
+        """Copies a node's player into a free slot and indexes it.
+
+        Args:
+            node: The PlayerNode whose player is stored.
+
+        Returns:
+            int: The slot now holding the player, with both links cleared.
+
+        Raises:
+            ValueError: If the key is already in the list or does not fit in 64 bits.
+        """
+        uid = _checked_uid(node.key)
+        if uid in self._index:
+            raise ValueError(f"A player with uid {uid} is already in the list")
+        if self._free:
+            slot = self._free.pop()
+            self._uids[slot] = uid
+            self._names[slot] = node.name
+            self._next[slot] = _NIL
+            self._prev[slot] = _NIL
+        else:
+            slot = len(self._uids)
+            self._uids.append(uid)
+            self._names.append(node.name)
+            self._next.append(_NIL)
+            self._prev.append(_NIL)
+        self._index[uid] = slot
+        self._length += 1
+        return slot
+
+    def _slot_for(self, key: str) -> int | None:
+        """Looks up the slot for a key.
+
+        Keys are matched exactly like PlayerList does, so only the canonical
+        uid string (no sign, whitespace or leading zeros) is found.
+
+        Args:
+            key: The key to look up.
+
+        Returns:
+            int or None: The slot holding the key, or None if not found.
+        """
+        if not isinstance(key, str) or not key.isdecimal() or key[0] == "0":
+            return None
+        return self._index.get(int(key))
+
+    def _unlink(self, slot: int) -> None:
+        """Detaches a slot from the chain and returns it to the free list.
+
+        Args:
+            slot: The slot to remove.
+        """
+        prev_slot = self._prev[slot]
+        next_slot = self._next[slot]
+        if prev_slot == _NIL:
+            self._head = next_slot
+        else:
+            self._next[prev_slot] = next_slot
+        if next_slot == _NIL:
+            self._tail = prev_slot
+        else:
+            self._prev[next_slot] = prev_slot
+        del self._index[self._uids[slot]]
+        self._names[slot] = None  # drop the name string while the slot is free
+        self._free.append(slot)
+        self._length -= 1
+
+    def _node_at(self, slot: int) -> CompactPlayerNode:
+        """Builds a view of the node in a slot.
+
+        Args:
+            slot: The slot to read.
+
+        Returns:
+            CompactPlayerNode: A view of the slot.
+        """
+        return CompactPlayerNode(self, slot)
+
+    def __contains__(self, key: str) -> bool:
+        """Checks in O(1) whether a node with the given key is in the list.
+
+        Args:
+            key: The key to look for.
+
+        Returns:
+            bool: True if a node with the key is in the list, False otherwise.
+        """
+        return self._slot_for(key) is not None
+
+    def __iter__(self):
+        """Implements forward iteration through the list.
+
+        Yields:
+            CompactPlayerNode: A view of each node from head to tail.
+        """
+        current = self._head
+        while current != _NIL:
+            yield self._node_at(current)
+            current = self._next[current]
+
+    def __reversed__(self):
+        """Implements reverse iteration through the list.
+
+        Yields:
+            CompactPlayerNode: A view of each node from tail to head.
+        """
+        current = self._tail
+        while current != _NIL:
+            yield self._node_at(current)
+            current = self._prev[current]
+
+
+class CompactPlayerNode:
+    """A read-only view of one node of a CompactPlayerList.
+
+    It offers PlayerNode's read API. next and prev return views of the
+    neighbouring slots, and player builds a Player on demand. Once its player
+    is deleted from the list the view is invalid: key still answers, while
+    every other attribute raises ValueError.
+    """
+    __slots__ = ("_list", "_slot", "_uid")
+
+    def __init__(self, player_list: CompactPlayerList, slot: int) -> None:
+        """Initializes a view; the list hands these out.
+
+        Args:
+            player_list: The list holding the slot.
+            slot: The slot viewed.
+        """
+        self._list = player_list
+        self._slot = slot
+        self._uid = player_list._uids[slot]
+
+    @property
+    def key(self) -> str:
+        """Gets the unique identifier of the player in this node.
+
+        Returns:
+            str: The player's uid.
+        """
+        return str(self._uid)
+
+    @property
+    def name(self) -> str:
+        """Gets the name of the player in this node.
+
+        Returns:
+            str: The player's name.
+        """
+        return self._list._names[self._live_slot()]
+
+    @property
+    def player(self) -> Player:
+        """Builds the Player stored in this node.
+
+        Returns:
+            Player: A new Player with the node's uid and name.
+        """
+        return Player.from_trusted(self.key, self.name)
+
+    @property
+    def next(self) -> CompactPlayerNode | None:
+        """Gets a view of the next node.
+
+        Returns:
+            CompactPlayerNode or None: The next node, or None at the tail.
+        """
+        following = self._list._next[self._live_slot()]
+        return None if following == _NIL else CompactPlayerNode(self._list, following)
+
+    @property
+    def prev(self) -> CompactPlayerNode | None:
+        """Gets a view of the previous node.
+
+        Returns:
+            CompactPlayerNode or None: The previous node, or None at the head.
+        """
+        previous = self._list._prev[self._live_slot()]
+        return None if previous == _NIL else CompactPlayerNode(self._list, previous)
+
+    def _live_slot(self) -> int:
+        """Checks the viewed player is still in the list.
+
+        Returns:
+            int: The slot.
+
+        Raises:
+            ValueError: If the player has been deleted.
+        """
+        if self._list._index.get(self._uid) != self._slot:
+            raise ValueError(f"The player with uid {self._uid} is no longer in the list")
+        return self._slot
+
+    def __repr__(self):
+        """Returns a string representation of the node view.
+
+        Returns:
+            A string showing the node's key and its connections.
+        """
+        following, previous = self.next, self.prev
+        next_key = following.key if following else "None"
+        prev_key = previous.key if previous else "None"
+        return f"PlayerNode id: {self.key}, next: {next_key}, prev: {prev_key}"
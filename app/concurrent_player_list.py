@@ -0,0 +1,223 @@
+from __future__ import annotations
+import threading
+from typing import Iterable
+from player_list import PlayerList
+from player_node import PlayerNode
+
+
+class ConcurrentPlayerList:
+    """A thread-safe PlayerList that can be shared across a thread pool.
+
+    Writers (inserts and deletes) are serialised by one mutex. Keyed lookups,
+    membership tests and the length/head/tail properties take no lock at all:
+    each is a single dict lookup or attribute read, which the interpreter
+    performs atomically (also on free-threaded builds), so readers never block
+    each other or writers. Iteration walks a snapshot() view taken under the
+    writer mutex, so it sees one consistent version of the list even while
+    writers carry on, and only holds the mutex while it reads each chunk.
+    """
+
+    def __init__(self, nodes: Iterable[PlayerNode] = ()) -> None:
+        self._list = PlayerList.from_iterable(nodes)
+        self._write_lock = threading.Lock()
+
+    @property
+    def is_empty(self) -> bool:
+        """Checks if the list contains no nodes.
+
+        Returns:
+            bool: True if the list is empty, False otherwise.
+        """
+        return self._list.is_empty
+
+    @property
+    def length(self) -> int:
+        """Gets the number of nodes in the list.
+
+        Returns:
+            int: The current length of the list.
+        """
+        return self._list.length
+
+    @property
+    def head(self) -> PlayerNode | None:
+        """Gets the first node in the list.
+
+        Returns:
+            PlayerNode or None: The head node, or None if list is empty.
+        """
+        return self._list.head
+
+    @property
+    def tail(self) -> PlayerNode | None:
+        """Gets the last node in the list.
+
+        Returns:
+            PlayerNode or None: The tail node, or None if list is empty.
+        """
+        return self._list.tail
+
+    def insert_at_head(self, node: PlayerNode) -> None:
+        """Inserts a PlayerNode at the front of the list.
+
+        Args:
+            node: The PlayerNode to insert.
+        """
+        with self._write_lock:
+            self._list.insert_at_head(node)
+
+    def insert_at_tail(self, node: PlayerNode) -> None:
+        """Inserts a PlayerNode at the end of the list.
+
+        Args:
+            node: The PlayerNode to insert.
+        """
+        with self._write_lock:
+            self._list.insert_at_tail(node)
+
+    def insert_at_position(self, node: PlayerNode, position: int) -> None:
+        """Inserts a PlayerNode at a specific position in the list.
+
+        Args:
+            node: The PlayerNode to insert.
+            position: The position to insert the node at.
+        """
+        with self._write_lock:
+            self._list.insert_at_position(node, position)
+
+    def extend(self, nodes: Iterable[PlayerNode]) -> None:
+        """Appends a batch of PlayerNodes under a single exclusive lock.
+
+        Args:
+            nodes: The PlayerNodes to append.
+        """
+        nodes = list(nodes)  # don't run caller code while holding the lock
+        with self._write_lock:
+            self._list.extend(nodes)
+
+    def delete_head(self) -> None:
+        """Removes the first node in the list.
+
+        Raises:
+            IndexError: If the list is empty.
+        """
+        with self._write_lock:
+            self._list.delete_head()
+
+    def delete_tail(self) -> None:
+        """Removes the last node in the list.
+
+        Raises:
+            IndexError: If the list is empty.
+        """
+        with self._write_lock:
+            self._list.delete_tail()
+
+    def find_node_with_key(self, key: str) -> PlayerNode | None:
+        """Finds the node with the specified key.
+
+        Args:
+            key: The key to search for.
+
+        Returns:
+            PlayerNode or None: The node with the specified key, or None if not found.
+        """
+        return self._list.find_node_with_key(key)
+
+    def delete_node_with_key(self, key: str) -> bool:
+        """Deletes the node with the specified key.
+
+        Args:
+            key: The key to search for and delete.
+
+        Returns:
+            bool: True if a node was found and deleted, False otherwise.
+        """
+        with self._write_lock:
+            return self._list.delete_node_with_key(key)
+
+    def find_many(self, keys: Iterable[str]) -> dict:
+        """Looks up a batch of keys.
+
+        Args:
+            keys: The keys to search for.
+
+        Returns:
+            dict: Each key mapped to its node, or None if not found.
+        """
+        return self._list.find_many(keys)
+
+    def delete_many(self, keys: Iterable[str]) -> dict:
+        """Deletes a batch of keys under a single exclusive lock.
+
+        Args:
+            keys: The keys to delete.
+
+        Returns:
+            dict: Each key mapped to True if it was deleted, False otherwise.
+        """
+        keys = list(keys)  # don't run caller code while holding the lock
+        with self._write_lock:
+            return self._list.delete_many(keys)
+
+    def snapshot(self):
+        """Takes an immutable view of the list in O(1); see PlayerList.snapshot.
+
+        Unlike nodes(), nothing is copied. The view reads the list in
+        chunks, taking the writer mutex for one chunk at a time.
+
+        Returns:
+            PlayerListView: The view; release() it when done.
+        """
+        with self._write_lock:
+            view = self._list.snapshot()
+            # The view reads live nodes from reader threads.
+            view._lock = self._write_lock
+        return view
+
+    def nodes(self) -> list[PlayerNode]:
+        """Copies the current node order while no writer is active.
+
+        Returns:
+            list[PlayerNode]: The nodes from head to tail.
+        """
+        with self._write_lock:
+            return list(self._list)
+
+    # Rendering and queries only depend on iteration and keyed lookups, so
+    # share PlayerList's implementation.
+    display = PlayerList.display
+    render = PlayerList.render
+    query = PlayerList.query
+
+    def __contains__(self, key: str) -> bool:
+        """Checks whether a node with the given key is in the list.
+
+        Args:
+            key: The key to look for.
+
+        Returns:
+            bool: True if a node with the key is in the list, False otherwise.
+        """
+        return key in self._list
+
+    def __iter__(self):
+        """Iterates over the list as it was when iteration starts.
+
+        Taking the snapshot is O(1) under the writer mutex; use nodes() for
+        the live nodes rather than the view's detached copies.
+
+        Yields:
+            PlayerNode: Each node in the list from head to tail.
+        """
+        with self.snapshot() as view:
+            yield from view
+
+    def __reversed__(self):
+        """Iterates backwards over the list as it was when iteration starts.
+
+        Yields:
+            PlayerNode: Each node in the list from tail to head.
+        """
+        with self.snapshot() as view:
+            yield from reversed(view)
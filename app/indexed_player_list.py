@@ -0,0 +1,449 @@
+from __future__ import annotations
+import random
+from typing import Iterable
+from player_list import PlayerList
+from player_node import PlayerNode
+
+
+class _SkipNode:
+    """A tower in an indexable skip list.
+
+    next[level] is the following tower at that level and width[level] is how
+    many elements that link spans. The last tower on a level links to None
+    with a width reaching one past the end of the list. key is only used by
+    lists kept in key order.
+    """
+    __slots__ = ("value", "key", "next", "width")
+
+    def __init__(self, value, height: int, key=None) -> None:
+        self.value = value
+        self.key = key
+        self.next = [None] * height
+        self.width = [1] * height
+
+
+class _IndexableSkipList:
+    """A skip list addressed by position, with O(log n) expected operations.
+
+    Positions are 0-based. Besides insert, get and delete by position, the
+    rank of a tower can be found from the tower itself by walking forward
+    along its highest links to the end of the list.
+    """
+    __slots__ = ("_head", "_size", "_max_height")
+
+    def __init__(self, max_height: int = 32) -> None:
+        self._max_height = max_height
+        self._head = _SkipNode(None, max_height)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, position: int, value, key=None) -> _SkipNode:
+        """Inserts a value so that it ends up at the given position.
+
+        Args:
+            position: The position, from 0 to len() inclusive.
+            value: The value to store.
+            key: The sort key, for lists kept in key order.
+
+        Returns:
+            _SkipNode: The tower holding the value.
+        """
+        chain, steps_at = self._predecessors(position)
+        height = 1
+        while height < self._max_height and random.random() < 0.5:
+            height += 1
+        tower = _SkipNode(value, height, key)
+        for level in range(height):
+            previous = chain[level]
+            # The new tower sits position - steps_at[level] + 1 places after previous.
+            offset = position - steps_at[level] + 1
+            tower.next[level] = previous.next[level]
+            tower.width[level] = previous.width[level] - offset + 1
+            previous.next[level] = tower
+            previous.width[level] = offset
+        for level in range(height, self._max_height):
+            chain[level].width[level] += 1
+        self._size += 1
+        return tower
+
+    def get(self, position: int) -> _SkipNode:
+        """Gets the tower at a position.
+
+        Args:
+            position: The position, from 0 to len() - 1.
+
+        Returns:
+            _SkipNode: The tower at that position.
+        """
+        node = self._head
+        steps = 0
+        target = position + 1
+        for level in range(self._max_height - 1, -1, -1):
+            while node.next[level] is not None and steps + node.width[level] <= target:
+                steps += node.width[level]
+                node = node.next[level]
+        return node
+
+    def delete(self, position: int) -> _SkipNode:
+        """Removes the tower at a position.
+
+        Args:
+            position: The position, from 0 to len() - 1.
+
+        Returns:
+            _SkipNode: The removed tower.
+        """
+        chain, _ = self._predecessors(position)
+        tower = chain[0].next[0]
+        for level in range(self._max_height):
+            previous = chain[level]
+            if previous.next[level] is tower:
+                previous.width[level] += tower.width[level] - 1
+                previous.next[level] = tower.next[level]
+            else:
+                previous.width[level] -= 1
+        self._size -= 1
+        return tower
+
+    def rank(self, tower: _SkipNode) -> int:
+        """Finds the position of a tower in O(log n) expected time.
+
+        Args:
+            tower: A tower currently in the list.
+
+        Returns:
+            int: Its 0-based position.
+        """
+        distance = 0
+        node = tower
+        while True:
+            top = len(node.next) - 1
+            distance += node.width[top]
+            if node.next[top] is None:
+                break
+            node = node.next[top]
+        # distance runs from the tower to one past the last element.
+        return self._size - distance
+
+    def bisect_left(self, key) -> int:
+        """Finds where a key would be inserted before any equal keys.
+
+        Only meaningful when every tower was inserted in key order.
+
+        Args:
+            key: The key to look for.
+
+        Returns:
+            int: The number of towers whose key is less than key.
+        """
+        node = self._head
+        steps = 0
+        for level in range(self._max_height - 1, -1, -1):
+            while node.next[level] is not None and node.next[level].key < key:
+                steps += node.width[level]
+                node = node.next[level]
+        return steps
+
+    def bisect_right(self, key) -> int:
+        """Finds where a key would be inserted after any equal keys.
+
+        Only meaningful when every tower was inserted in key order.
+
+        Args:
+            key: The key to look for.
+
+        Returns:
+            int: The number of towers whose key is less than or equal to key.
+        """
+        node = self._head
+        steps = 0
+        for level in range(self._max_height - 1, -1, -1):
+            while node.next[level] is not None and node.next[level].key <= key:
+                steps += node.width[level]
+                node = node.next[level]
+        return steps
+
+    def _predecessors(self, position: int):
+        """Finds the last tower before a position on every level.
+
+        Args:
+            position: The position being inserted at or deleted.
+
+        Returns:
+            tuple: The towers per level, and each one's 1-based position
+            (0 for the head sentinel).
+        """
+        chain = [None] * self._max_height
+        steps_at = [0] * self._max_height
+        node = self._head
+        steps = 0
+        for level in range(self._max_height - 1, -1, -1):
+            while node.next[level] is not None and steps + node.width[level] <= position:
+                steps += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+            steps_at[level] = steps
+        return chain, steps_at
+
+
+class IndexedPlayerList(PlayerList):
+    """A PlayerList with O(log n) positional access.
+
+    Alongside the usual doubly-linked nodes and uid index, an indexable skip
+    list keeps the nodes in list order, so insert_at_position, indexing,
+    slicing and positional deletes no longer walk from the head. Deleting by
+    key finds the node's position from its skip list tower, also in
+    O(log n). Head and tail operations cost O(log n) instead of O(1).
+    """
+    _relinkable = False
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._skip = _IndexableSkipList()
+        self._towers = {}
+
+    def insert_at_head(self, node: PlayerNode) -> None:
+        """Inserts a PlayerNode at the front of the list.
+
+        Args:
+            node: The PlayerNode to insert.
+        """
+        super().insert_at_head(node)
+        self._towers[node.key] = self._skip.insert(0, node)
+
+    def insert_at_tail(self, node: PlayerNode) -> None:
+        """Inserts a PlayerNode at the end of the list.
+
+        Args:
+            node: The PlayerNode to insert.
+        """
+        super().insert_at_tail(node)
+        self._towers[node.key] = self._skip.insert(self._length - 1, node)
+
+    def insert_at_position(self, node: PlayerNode, position: int) -> None:
+        """Inserts a PlayerNode at a specific position in O(log n).
+
+        Args:
+            node: The PlayerNode to insert.
+            position: The position to insert the node at.
+
+        Raises:
+            IndexError: If position is outside the list.
+            ValueError: If a node with the same key is already in the list.
+        """
+        if position < 0 or position > self.length:
+            raise IndexError("Invalid position")
+        if position == 0:
+            self.insert_at_head(node)
+            return
+        if position == self.length:
+            self.insert_at_tail(node)
+            return
+        self._check_not_indexed(node)
+        following = self._skip.get(position).value
+        if self._histories is not None:
+            self._preserve(following.prev, following)
+        node.next = following
+        node.prev = following.prev
+        following.prev.next = node
+        following.prev = node
+        self._length += 1
+        self._index[node.key] = node
+        self._towers[node.key] = self._skip.insert(position, node)
+        if self._listeners is not None:
+            self._notify("on_insert", node)
+
+    def insert_after(self, anchor: PlayerNode, node: PlayerNode) -> None:
+        """Inserts a PlayerNode right after a node already in the list, in O(log n).
+
+        Args:
+            anchor: The node to insert after; it must belong to this list.
+            node: The PlayerNode to insert.
+
+        Raises:
+            ValueError: If anchor is not in the list, or a node with the same
+                key as node already is.
+        """
+        if self._index.get(anchor.key) is not anchor:
+            raise ValueError(f"The player with uid {anchor.key} is not in the list")
+        self.insert_at_position(node, self._skip.rank(self._towers[anchor.key]) + 1)
+
+    def extend(self, nodes: Iterable[PlayerNode]) -> None:
+        """Appends a batch of PlayerNodes at the end of the list, keeping their order.
+
+        Args:
+            nodes: The PlayerNodes to append.
+
+        Raises:
+            ValueError: If a key is already in the list or repeated in the batch.
+        """
+        nodes = list(nodes)
+        super().extend(nodes)
+        for node in nodes:
+            self._towers[node.key] = self._skip.insert(len(self._skip), node)
+
+    def extend_left(self, nodes: Iterable[PlayerNode]) -> None:
+        """Prepends a batch of PlayerNodes, like repeated insert_at_head calls.
+
+        Args:
+            nodes: The PlayerNodes to prepend.
+
+        Raises:
+            ValueError: If a key is already in the list or repeated in the batch.
+        """
+        nodes = list(nodes)
+        super().extend_left(nodes)
+        for node in nodes:
+            self._towers[node.key] = self._skip.insert(0, node)
+
+    def delete_head(self) -> None:
+        """Removes the first node in the list.
+
+        Raises:
+            IndexError: If the list is empty.
+        """
+        key = self._head.key if self._head is not None else None
+        super().delete_head()
+        self._skip.delete(0)
+        del self._towers[key]
+
+    def delete_tail(self) -> None:
+        """Removes the last node in the list.
+
+        Raises:
+            IndexError: If the list is empty.
+        """
+        key = self._tail.key if self._tail is not None else None
+        super().delete_tail()
+        self._skip.delete(len(self._skip) - 1)
+        del self._towers[key]
+
+    def delete_node_with_key(self, key: str) -> bool:
+        """Deletes the node with the specified key in O(log n).
+
+        Args:
+            key: The key to search for and delete.
+
+        Returns:
+            bool: True if a node was found and deleted, False otherwise.
+        """
+        tower = self._towers.get(key)
+        if tower is None:
+            return False
+        del self[self._skip.rank(tower)]
+        return True
+
+    def delete_many(self, keys: Iterable[str]) -> dict:
+        """Deletes a batch of keys, O(log n) per key.
+
+        Args:
+            keys: The keys to delete.
+
+        Returns:
+            dict: Each key mapped to True if it was deleted, False otherwise.
+        """
+        results = {}
+        for key in keys:
+            results[key] = self.delete_node_with_key(key) or results.get(key, False)
+        return results
+
+    def index_of(self, key: str) -> int:
+        """Finds the position of the node with a key in O(log n).
+
+        Args:
+            key: The key to look for.
+
+        Returns:
+            int: The 0-based position of the node.
+
+        Raises:
+            KeyError: If no node has the key.
+        """
+        return self._skip.rank(self._towers[key])
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, item: int | slice) -> PlayerNode | list[PlayerNode]:
+        """Gets the node at a position, or a list of nodes for a slice.
+
+        A contiguous slice costs one O(log n) seek plus a walk along the
+        linked nodes, so a page of k players costs O(log n + k).
+
+        Args:
+            item: A position (negative counts from the end) or a slice.
+
+        Returns:
+            PlayerNode or list[PlayerNode]: The selected node(s).
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        if isinstance(item, slice):
+            start, stop, step = item.indices(self._length)
+            positions = range(start, stop, step)
+            if not positions:
+                return []
+            if step == 1:
+                nodes = []
+                node = self._skip.get(start).value
+                for _ in positions:
+                    nodes.append(node)
+                    node = node.next
+                return nodes
+            return [self._skip.get(position).value for position in positions]
+        return self._skip.get(self._normalise_position(item)).value
+
+    def __delitem__(self, item: int | slice) -> None:
+        """Deletes the node at a position, or every node selected by a slice.
+
+        Args:
+            item: A position (negative counts from the end) or a slice.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        if isinstance(item, slice):
+            # Delete from the back so earlier positions stay valid.
+            for position in sorted(range(*item.indices(self._length)), reverse=True):
+                del self[position]
+            return
+        position = self._normalise_position(item)
+        if position == 0:
+            self.delete_head()
+            return
+        if position == self._length - 1:
+            self.delete_tail()
+            return
+        node = self._skip.delete(position).value
+        if self._histories is not None:
+            self._preserve(node.prev, node, node.next)
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        self._length -= 1
+        del self._index[node.key]
+        del self._towers[node.key]
+        if self._listeners is not None:
+            self._notify("on_delete", node)
+        if self._pool is not None:
+            self._pool.release(node)
+
+    def _normalise_position(self, position: int) -> int:
+        """Resolves a possibly negative position and checks its range.
+
+        Args:
+            position: The requested position.
+
+        Returns:
+            int: The equivalent non-negative position.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        if position < 0:
+            position += self._length
+        if not 0 <= position < self._length:
+            raise IndexError("list index out of range")
+        return position
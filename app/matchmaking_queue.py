@@ -0,0 +1,267 @@
+from __future__ import annotations
+import math
+import time
+from bisect import bisect_left, bisect_right, insort
+from typing import Callable
+from player import Player
+from player_list import PlayerList
+from player_node import PlayerNode
+
+
+class MatchmakingQueue:
+    """A first-come, first-served queue that forms groups of players.
+
+    Waiting players are kept in PlayerLists, one per skill bucket, each in
+    arrival order: joining appends at the tail, cancelling unlinks through
+    the uid index in O(1) and forming a group pops from the heads. Without a
+    bucket_width every player shares one bucket and groups are simply the
+    group_size longest-waiting players.
+
+    With a bucket_width, a player's skill picks their bucket and a group may
+    only draw from buckets at most max_spread away from its first player.
+    The first player is always the longest-waiting one who can be matched;
+    the rest are taken from the nearest buckets first, oldest first within a
+    bucket. Only the sorted keys of non-empty buckets are searched, so the
+    cost of forming a group grows with the number of buckets, not players.
+    """
+    def __init__(self, group_size: int, bucket_width: float | None = None, max_spread: int = 0,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """Initializes an empty queue.
+
+        Args:
+            group_size: The number of players in a group.
+            bucket_width: The skill range covered by one bucket, or None for no bucketing.
+            max_spread: How many buckets either side of its first player a group may draw from.
+            clock: The time source used for wait times, in seconds.
+
+        Raises:
+            ValueError: If group_size or bucket_width is not positive or max_spread is negative.
+        """
+        if group_size < 1:
+            raise ValueError("group_size must be a positive integer")
+        if bucket_width is not None and bucket_width <= 0:
+            raise ValueError("bucket_width must be positive")
+        if max_spread < 0:
+            raise ValueError("max_spread must not be negative")
+        self._group_size = group_size
+        self._width = bucket_width
+        self._spread = max_spread
+        self._clock = clock
+        self._buckets = {}
+        self._keys = []
+        self._bucket_of = {}
+        self._joined = {}
+        self._sequence = 0
+        self.groups = 0
+        self.matched = 0
+        self.cancelled = 0
+
+    @property
+    def group_size(self) -> int:
+        """Gets the number of players in a group.
+
+        Returns:
+            int: The group size.
+        """
+        return self._group_size
+
+    def join(self, player: Player, skill: float | None = None) -> None:
+        """Adds a player at the back of the queue.
+
+        Args:
+            player: The player to queue.
+            skill: The player's skill; required if the queue is bucketed, ignored otherwise.
+
+        Raises:
+            ValueError: If the player is already queued or a bucketed queue gets no skill.
+        """
+        uid = player.uid
+        if uid in self._bucket_of:
+            raise ValueError(f"The player with uid {uid} is already queued")
+        if self._width is None:
+            key = 0
+        elif skill is None:
+            raise ValueError("A skill is required to join a bucketed queue")
+        else:
+            key = math.floor(skill / self._width)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = PlayerList()
+            insort(self._keys, key)
+        bucket.insert_at_tail(PlayerNode(player))
+        self._bucket_of[uid] = key
+        self._joined[uid] = (self._sequence, self._clock())
+        self._sequence += 1
+
+    def cancel(self, uid: str) -> bool:
+        """Removes a waiting player from the queue in O(1).
+
+        Args:
+            uid: The player's uid.
+
+        Returns:
+            bool: True if the player was queued, False otherwise.
+        """
+        key = self._bucket_of.pop(uid, None)
+        if key is None:
+            return False
+        del self._joined[uid]
+        bucket = self._buckets[key]
+        bucket.delete_node_with_key(uid)
+        if bucket.is_empty:
+            self._drop_bucket(key)
+        self.cancelled += 1
+        return True
+
+    def wait_time(self, uid: str) -> float | None:
+        """Gets how long a player has been waiting.
+
+        Args:
+            uid: The player's uid.
+
+        Returns:
+            float or None: The wait in seconds, or None if the player is not queued.
+        """
+        joined = self._joined.get(uid)
+        return None if joined is None else self._clock() - joined[1]
+
+    def dequeue(self) -> list[Player] | None:
+        """Forms one group from the longest-waiting players who can be matched.
+
+        Returns:
+            list or None: The group's players, first player first, or None if
+            no group can be formed yet.
+        """
+        anchor = self._anchor()
+        if anchor is None:
+            return None
+        group = []
+        for key in self._window_order(anchor):
+            group.extend(self._take(key, self._group_size - len(group)))
+            if len(group) == self._group_size:
+                break
+        self.groups += 1
+        self.matched += len(group)
+        return group
+
+    def dequeue_many(self, max_groups: int | None = None) -> list[list[Player]]:
+        """Forms groups until no more can be formed or max_groups is reached.
+
+        Args:
+            max_groups: The most groups to form, or None for no limit.
+
+        Returns:
+            list: The groups, in the order they were formed.
+        """
+        groups = []
+        while max_groups is None or len(groups) < max_groups:
+            group = self.dequeue()
+            if group is None:
+                break
+            groups.append(group)
+        return groups
+
+    def stats(self) -> dict:
+        """Gets the queue statistics.
+
+        Returns:
+            dict: Queued players, non-empty buckets, groups formed, players
+            matched and cancellations.
+        """
+        return {
+            "queued": len(self._bucket_of),
+            "buckets": len(self._keys),
+            "groups": self.groups,
+            "matched": self.matched,
+            "cancelled": self.cancelled,
+        }
+
+    def _window(self, key: int) -> list:
+        """Gets the non-empty bucket keys a group anchored in a bucket may draw from.
+
+        Args:
+            key: The anchor's bucket key.
+
+        Returns:
+            list: The keys within max_spread of key, ascending.
+        """
+        keys = self._keys
+        return keys[bisect_left(keys, key - self._spread):bisect_right(keys, key + self._spread)]
+
+    def _anchor(self) -> int | None:
+        """Finds the bucket of the longest-waiting player who can be matched.
+
+        A bucket can anchor a group when its window holds at least group_size
+        players; its candidate is its head, the bucket's longest-waiting player.
+
+        Returns:
+            int or None: The bucket key, or None if no group can be formed.
+        """
+        buckets = self._buckets
+        best_key, best_sequence = None, None
+        for key in self._keys:
+            sequence = self._joined[buckets[key].head.key][0]
+            if best_sequence is not None and sequence >= best_sequence:
+                continue
+            waiting = sum(buckets[other].length for other in self._window(key))
+            if waiting >= self._group_size:
+                best_key, best_sequence = key, sequence
+        return best_key
+
+    def _window_order(self, key: int) -> list:
+        """Orders an anchor's window: nearest buckets first, then oldest head.
+
+        Args:
+            key: The anchor's bucket key.
+
+        Returns:
+            list: The bucket keys to draw from, the anchor's own first.
+        """
+        buckets, joined = self._buckets, self._joined
+        return sorted(self._window(key),
+                      key=lambda other: (abs(other - key), joined[buckets[other].head.key][0]))
+
+    def _take(self, key: int, count: int) -> list[Player]:
+        """Pops up to count players from the head of a bucket.
+
+        Args:
+            key: The bucket key.
+            count: The most players to take.
+
+        Returns:
+            list: The players taken, oldest first.
+        """
+        bucket = self._buckets[key]
+        taken = []
+        while len(taken) < count and not bucket.is_empty:
+            node = bucket.head
+            bucket.delete_head()
+            del self._bucket_of[node.key]
+            del self._joined[node.key]
+            taken.append(node.player)
+        if bucket.is_empty:
+            self._drop_bucket(key)
+        return taken
+
+    def _drop_bucket(self, key: int) -> None:
+        """Forgets an empty bucket.
+
+        Args:
+            key: The bucket key.
+        """
+        del self._buckets[key]
+        del self._keys[bisect_left(self._keys, key)]
+
+    def __len__(self) -> int:
+        return len(self._bucket_of)
+
+    def __contains__(self, uid: str) -> bool:
+        """Checks whether a player is waiting in the queue.
+
+        Args:
+            uid: The player's uid.
+
+        Returns:
+            bool: True if the player is queued, False otherwise.
+        """
+        return uid in self._bucket_of
@@ -1,16 +1,89 @@
+from __future__ import annotations
+import sys
+import weakref
+from functools import lru_cache
+from typing import Sequence
+
+# How many distinct raw uid inputs PlayerUID remembers the canonical form of.
+UID_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=UID_CACHE_SIZE)
+def _canonical_uid(value: str) -> str:
+    """Normalises a raw uid string, remembering recent inputs.
+
+    The canonical string is interned, so every player, index and snapshot
+    holding the same uid shares one string object. Invalid input raises and
+    is not cached.
+
+    Args:
+        value: The uid as given, e.g. " 042".
+
+    Returns:
+        str: The canonical uid, e.g. "42".
+
+    Raises:
+        ValueError: If value is not a positive integer.
+    """
+    # No uid should have trailing or leading whitespace.
+    value = value.strip()
+    # Try to convert string to integer
+    try:
+        int_value = int(value)
+    except ValueError:
+        raise ValueError("Player UID must be a string convertible to a positive integer")
+    # Validate uid is a positive integer
+    if int_value <= 0:
+        raise ValueError("Player UID must be a positive integer")
+    # Canonical form is the str version of the integer (removes leading 0's)
+    return sys.intern(str(int_value))
+
+
+@lru_cache(maxsize=UID_CACHE_SIZE)
+def _canonical_int_uid(value: str) -> int:
+    """Normalises a raw uid string to an int, remembering recent inputs.
+
+    Args:
+        value: The uid as given, e.g. " 042".
+
+    Returns:
+        int: The uid, e.g. 42.
+
+    Raises:
+        ValueError: If value is not a positive integer.
+    """
+    return int(_canonical_uid(value))
+
+
 class PlayerUID:
     """A descriptor that validates and manages a player's unique identifier (uid).
 
     The uid must be a string representing a positive integer. Leading zeros and
-    whitespace are stripped during validation.
+    whitespace are stripped during validation. Recently seen raw uids are
+    remembered in a bounded cache (see cache_info()), so duplicate-heavy input
+    is normalised once per distinct value.
     """
 
-    def __init__(self):
+    def __init__(self, as_int: bool = False):
         """Initializes a new PlayerUID descriptor.
 
-        The descriptor creates a unique attribute name for each instance.
+        The storage attribute is named by __set_name__ when the descriptor
+        is assigned to a class.
+
+        Args:
+            as_int: If True, the uid is stored and returned as an int rather
+                than its canonical string.
+        """
+        self.as_int = as_int
+
+    def __set_name__(self, owner, name):
+        """Stores the value under a fixed private name so owners can use __slots__.
+
+        Args:
+            owner: The class the descriptor is assigned to.
+            name: The attribute name the descriptor is assigned to.
         """
-        self.name = f"_{id(self)}_uid"
+        self.name = f"_{name}"
 
     def __get__(self, instance, owner):
         """Gets the player's unique identifier.
@@ -20,7 +93,7 @@ class PlayerUID:
             owner: The Player class.
 
         Returns:
-            str: The player's UID, or None if not set.
+            str or int: The player's UID (an int if as_int), or None if not set.
         """
         if instance is None:
             return self
@@ -37,23 +110,26 @@ class PlayerUID:
             TypeError: If value is not a string.
             ValueError: If value cannot be converted to a positive integer.
         """
-        if isinstance(value, str):
-            # No uid should have trailing or leading whitespace.
-            value = value.strip()
-            # Try to convert string to integer
-            try:
-                int_value = int(value)
-            except ValueError:
-                raise ValueError("Player UID must be a string convertible to a positive integer")
-        else:
+        if not isinstance(value, str):
             raise TypeError("Player UID must be a string.")
+        setattr(instance, self.name, _canonical_int_uid(value) if self.as_int else _canonical_uid(value))
 
-        # Validate uid is a positive integer
-        if int_value <= 0:
-            raise ValueError("Player UID must be a positive integer")
+    @staticmethod
+    def cache_info() -> dict:
+        """Gets the statistics of both uid normalisation caches.
 
-        # if valid set to str version of the integer (removes leading 0's)
-        setattr(instance, self.name, str(int_value))
+        Returns:
+            dict: "str" and "int" mapped to the CacheInfo (hits, misses,
+            maxsize and current size) of the cache used by string and int
+            uid players.
+        """
+        return {"str": _canonical_uid.cache_info(), "int": _canonical_int_uid.cache_info()}
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Empties the uid normalisation caches and resets their statistics."""
+        _canonical_uid.cache_clear()
+        _canonical_int_uid.cache_clear()
 
     def __delete__(self, instance):
         """Deletes the player's unique identifier.
@@ -75,13 +151,17 @@ class PlayerName:
     Attributes:
         name: Internal attribute name for storing the player name.
     """
+    # Objects told about every rename, held weakly, see add_listener().
+    _listeners = None
 
-    def __init__(self):
-        """Initializes the PlayerName descriptor.
+    def __set_name__(self, owner, name):
+        """Stores the value under a fixed private name so owners can use __slots__.
 
-        The descriptor creates a unique attribute name for storing player names.
+        Args:
+            owner: The class the descriptor is assigned to.
+            name: The attribute name the descriptor is assigned to.
         """
-        self.name = f"_{id(self)}_name"
+        self.name = f"_{name}"
 
     def __get__(self, instance, owner):
         """Gets the player's name.
@@ -108,10 +188,10 @@ class PlayerName:
             ValueError: If name is not a non-empty string.
         """
         # Validate name is a non-empty string
-        if not isinstance(value, str) or value.strip() == "":
+        if not isinstance(value, str) or (value := value.strip()) == "":
             raise ValueError("Player name must be a non-empty string")
         # Store sanitized name (stripped of extra whitespace)
-        setattr(instance, self.name, value.strip())
+        self._rename(instance, value)
 
     def __delete__(self, instance):
         """Deletes the player's name.
@@ -120,7 +200,61 @@ class PlayerName:
             instance: The Player instance.
         """
         # Reset to default name when deleted
-        setattr(instance, self.name, "Anonymous")
+        self._rename(instance, "Anonymous")
+
+    @classmethod
+    def add_listener(cls, listener) -> None:
+        """Registers an object to be told about every player rename.
+
+        After a player's name changes, listener.on_rename(player, old_name)
+        is called. Setting the first name (and Player.from_trusted) is not a
+        rename. Without listeners a set pays one attribute check.
+
+        Listeners are held through weak references, in no particular order:
+        one that is no longer referenced elsewhere stops being called once it
+        is garbage-collected, so a forgotten listener does not leak or slow
+        down every later rename.
+
+        Args:
+            listener: An object with an on_rename(player, old_name) method;
+                it must be hashable and weakly referenceable.
+        """
+        if cls._listeners is None:
+            cls._listeners = weakref.WeakSet()
+        cls._listeners.add(listener)
+
+    @classmethod
+    def remove_listener(cls, listener) -> None:
+        """Stops telling a listener about renames.
+
+        Args:
+            listener: An object previously passed to add_listener().
+
+        Raises:
+            ValueError: If the listener is not registered.
+        """
+        if cls._listeners is None or listener not in cls._listeners:
+            raise ValueError("The listener is not registered")
+        cls._listeners.discard(listener)
+        if not cls._listeners:
+            cls._listeners = None
+
+    def _rename(self, instance, value: str) -> None:
+        """Stores a name and tells the listeners if it changed one.
+
+        Args:
+            instance: The Player instance.
+            value: The validated name.
+        """
+        listeners = PlayerName._listeners
+        if listeners is None:
+            setattr(instance, self.name, value)
+            return
+        old = getattr(instance, self.name, None)
+        setattr(instance, self.name, value)
+        if old is not None and old != value:
+            for listener in list(listeners):
+                listener.on_rename(instance, old)
 
 
 class Player:
@@ -130,6 +264,10 @@ class Player:
         uid (str): Unique identifier for the player.
         name (str): Display name of the player.
     """
+    # Values live in slots rather than a per-instance __dict__ to keep
+    # millions of players cheap; the descriptors below write to them.
+    __slots__ = ("_uid", "_name")
+
     # Define descriptors for attributes
     uid = PlayerUID()
     name = PlayerName()
@@ -144,6 +282,76 @@ class Player:
         self.uid = uid
         self.name = name
 
+    @classmethod
+    def from_trusted(cls, uid: str, name: str) -> Player:
+        """Creates a Player from values that are already validated and normalised.
+
+        Skips the descriptors entirely, so the caller must guarantee uid is the
+        canonical string of a positive integer and name is a stripped, non-empty
+        string, e.g. because the values were validated when they were written.
+
+        Args:
+            uid: Canonical unique identifier for the player.
+            name: Stripped display name of the player.
+
+        Returns:
+            Player: The new player.
+        """
+        player = cls.__new__(cls)
+        player._uid = uid
+        player._name = name
+        return player
+
+    @classmethod
+    def validate_many(cls, uids: Sequence[str], names: Sequence[str]) -> list[Player]:
+        """Validates columns of uids and names in one batched pass and builds Players.
+
+        Applies the same rules as the uid and name descriptors, but column-wise
+        with map() instead of per object, then creates the players through
+        from_trusted.
+
+        Args:
+            uids: The uid of each player.
+            names: The name of each player, in the same order as uids.
+
+        Returns:
+            list[Player]: The new players, in input order.
+
+        Raises:
+            TypeError: If a uid is not a string.
+            ValueError: If the columns differ in length, a uid is not a positive
+                integer or a name is not a non-empty string. The message names
+                the first offending row.
+        """
+        if len(uids) != len(names):
+            raise ValueError("uids and names must have the same length")
+        if not all(isinstance(uid, str) for uid in uids):
+            row = next(i for i, uid in enumerate(uids) if not isinstance(uid, str))
+            raise TypeError(f"Player UID must be a string. (row {row})")
+        try:
+            int_uids = list(map(int, uids))
+        except ValueError:
+            row = next(i for i, uid in enumerate(uids) if not _parses_as_int(uid))
+            raise ValueError(
+                f"Player UID must be a string convertible to a positive integer (row {row})"
+            ) from None
+        if int_uids and min(int_uids) <= 0:
+            row = next(i for i, uid in enumerate(int_uids) if uid <= 0)
+            raise ValueError(f"Player UID must be a positive integer (row {row})")
+
+        if not all(isinstance(name, str) for name in names):
+            row = next(i for i, name in enumerate(names) if not isinstance(name, str))
+            raise ValueError(f"Player name must be a non-empty string (row {row})")
+        stripped_names = list(map(str.strip, names))
+        if not all(stripped_names):
+            row = stripped_names.index("")
+            raise ValueError(f"Player name must be a non-empty string (row {row})")
+
+        trusted = cls.from_trusted
+        if cls.uid.as_int:
+            return list(map(trusted, int_uids, stripped_names))
+        return list(map(trusted, map(sys.intern, map(str, int_uids)), stripped_names))
+
     def __repr__(self):
         """Returns the string representation of the Player instance.
 
@@ -152,3 +360,32 @@ class Player:
         """
         # No need for __str__ as __repr__ is clear and concise
         return f"Player(uid='{self.uid}', name='{self.name}')"
+
+
+class IntUIDPlayer(Player):
+    """A Player whose uid is stored and returned as an int.
+
+    Input is validated exactly as for Player, but the uid is kept as an int,
+    which is smaller than its string and hashes and compares as a number. A
+    PlayerList of IntUIDPlayer nodes is keyed by int, so look players up with
+    find_node_with_key(42) rather than "42". from_trusted expects an int uid.
+    """
+    __slots__ = ()
+
+    uid = PlayerUID(as_int=True)
+
+
+def _parses_as_int(value: str) -> bool:
+    """Checks whether int() accepts a string.
+
+    Args:
+        value: The string to check.
+
+    Returns:
+        bool: True if int(value) succeeds, False otherwise.
+    """
+    try:
+        int(value)
+    except ValueError:
+        return False
+    return True
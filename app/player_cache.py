@@ -0,0 +1,217 @@
+from __future__ import annotations
+import time
+from typing import Callable
+from player import Player
+from player_list import PlayerList
+from player_node import PlayerNode
+
+
+class LRUPlayerCache:
+    """A bounded cache of recently active players, evicting the least recently used.
+
+    The cache is a PlayerList ordered from most recently used (head) to least
+    recently used (tail). Lookups go through the list's uid index and a hit
+    moves the node to the head, so get, touch and put are all O(1). When the
+    cache grows past capacity, players are evicted from the tail.
+
+    With ttl set, an entry expires ttl seconds after it was last put. Expired
+    entries are dropped lazily when accessed, or all at once by
+    purge_expired().
+    """
+
+    def __init__(self, capacity: int, ttl: float | None = None,
+                 on_evict: Callable[[Player, str], None] | None = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """Initializes an empty cache.
+
+        Args:
+            capacity: The maximum number of players held.
+            ttl: Seconds an entry stays valid after being put, or None to never expire.
+            on_evict: Optional callback called with each player dropped by the
+                cache and the reason, "capacity" or "expired". Players removed
+                through invalidate() or replaced by put() are not reported.
+            clock: The time source used for ttl, in seconds.
+
+        Raises:
+            ValueError: If capacity is not positive or ttl is not positive.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be a positive integer")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self._capacity = capacity
+        self._ttl = ttl
+        self._on_evict = on_evict
+        self._clock = clock
+        self._list = PlayerList()
+        self._deadlines = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def capacity(self) -> int:
+        """Gets the maximum number of players held.
+
+        Returns:
+            int: The capacity.
+        """
+        return self._capacity
+
+    def get(self, uid: str) -> Player | None:
+        """Gets a cached player and marks it as most recently used.
+
+        Args:
+            uid: The player's uid.
+
+        Returns:
+            Player or None: The cached player, or None on a miss.
+        """
+        node = self._live_node(uid)
+        if node is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._move_to_head(node)
+        return node.player
+
+    def touch(self, uid: str) -> bool:
+        """Marks a cached player as most recently used without counting a hit.
+
+        Args:
+            uid: The player's uid.
+
+        Returns:
+            bool: True if the player was cached, False otherwise.
+        """
+        node = self._live_node(uid)
+        if node is None:
+            return False
+        self._move_to_head(node)
+        return True
+
+    def put(self, player: Player) -> None:
+        """Caches a player as most recently used, replacing any entry with its uid.
+
+        Evicts least recently used players if the cache is over capacity.
+
+        Args:
+            player: The player to cache.
+        """
+        uid = player.uid
+        self._list.delete_node_with_key(uid)
+        self._list.insert_at_head(PlayerNode(player))
+        if self._ttl is not None:
+            self._deadlines[uid] = self._clock() + self._ttl
+        while self._list.length > self._capacity:
+            self._drop(self._list.tail, "capacity")
+
+    def invalidate(self, uid: str) -> bool:
+        """Removes a player from the cache.
+
+        Args:
+            uid: The player's uid.
+
+        Returns:
+            bool: True if the player was cached, False otherwise.
+        """
+        self._deadlines.pop(uid, None)
+        return self._list.delete_node_with_key(uid)
+
+    def purge_expired(self) -> int:
+        """Drops every expired entry.
+
+        Returns:
+            int: The number of entries dropped.
+        """
+        if self._ttl is None:
+            return 0
+        now = self._clock()
+        expired = [node for node in self._list if self._deadlines[node.key] <= now]
+        for node in expired:
+            self._drop(node, "expired")
+        return len(expired)
+
+    def stats(self) -> dict:
+        """Gets the cache statistics.
+
+        Returns:
+            dict: Hits, misses, hit_rate, evictions, expirations, size and capacity.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": self._list.length,
+            "capacity": self._capacity,
+        }
+
+    def _live_node(self, uid: str) -> PlayerNode | None:
+        """Finds a cached node, dropping it instead if it has expired.
+
+        Args:
+            uid: The player's uid.
+
+        Returns:
+            PlayerNode or None: The node, or None if absent or expired.
+        """
+        node = self._list.find_node_with_key(uid)
+        if node is not None and self._ttl is not None and self._deadlines[uid] <= self._clock():
+            self._drop(node, "expired")
+            return None
+        return node
+
+    def _move_to_head(self, node: PlayerNode) -> None:
+        """Moves a cached node to the head of the list in O(1).
+
+        Args:
+            node: The node to move.
+        """
+        if node is not self._list.head:
+            self._list.delete_node_with_key(node.key)
+            self._list.insert_at_head(node)
+
+    def _drop(self, node: PlayerNode, reason: str) -> None:
+        """Removes a node, updates the statistics and reports it.
+
+        Args:
+            node: The node to remove.
+            reason: "capacity" or "expired".
+        """
+        self._list.delete_node_with_key(node.key)
+        self._deadlines.pop(node.key, None)
+        if reason == "expired":
+            self.expirations += 1
+        else:
+            self.evictions += 1
+        if self._on_evict is not None:
+            self._on_evict(node.player, reason)
+
+    def __len__(self) -> int:
+        return self._list.length
+
+    def __contains__(self, uid: str) -> bool:
+        """Checks whether a player is cached, without affecting recency or statistics.
+
+        Args:
+            uid: The player's uid.
+
+        Returns:
+            bool: True if the player is cached and not expired, False otherwise.
+        """
+        if uid not in self._list:
+            return False
+        return self._ttl is None or self._deadlines[uid] > self._clock()
+
+    def __iter__(self):
+        """Iterates from most to least recently used.
+
+        Yields:
+            Player: Each cached player.
+        """
+        for node in self._list:
+            yield node.player
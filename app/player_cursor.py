@@ -0,0 +1,155 @@
+from __future__ import annotations
+from player_list import PlayerList
+from player_node import PlayerNode
+
+
+class PlayerCursor:
+    """A position on a PlayerList node, for O(1) edits around it.
+
+    The cursor holds a node rather than an index, so it stays on the same
+    player however the rest of the list changes. Every edit goes through the
+    list's own methods, so the uid index, listeners and views stay in step.
+    If the node under the cursor is removed by other means, the cursor
+    becomes invalid until it is moved to another node with move_to().
+    """
+    def __init__(self, player_list: PlayerList, node: PlayerNode | None) -> None:
+        """Places a cursor; use PlayerList.cursor() rather than calling this.
+
+        Args:
+            player_list: The list to edit.
+            node: The node to start on, or None for an empty list.
+
+        Raises:
+            ValueError: If node is not in the list.
+        """
+        self._list = player_list
+        self._node = None
+        if node is not None:
+            self.move_to(node)
+
+    @property
+    def node(self) -> PlayerNode | None:
+        """Gets the node under the cursor.
+
+        Returns:
+            PlayerNode or None: The node, or None if the list was empty.
+        """
+        return self._node
+
+    @property
+    def is_valid(self) -> bool:
+        """Checks the node under the cursor is still in the list.
+
+        Returns:
+            bool: True if the cursor can be used, False otherwise.
+        """
+        node = self._node
+        return node is not None and self._list.find_node_with_key(node.key) is node
+
+    def move_to(self, node: PlayerNode) -> None:
+        """Moves the cursor onto a node of its list.
+
+        Args:
+            node: The node to move to.
+
+        Raises:
+            ValueError: If node is not in the list.
+        """
+        if self._list.find_node_with_key(node.key) is not node:
+            raise ValueError(f"The player with uid {node.key} is not in the list")
+        self._node = node
+
+    def move_next(self) -> bool:
+        """Moves the cursor one node towards the tail.
+
+        Returns:
+            bool: True if it moved, False if it was already on the tail.
+        """
+        following = self._current().next
+        if following is None:
+            return False
+        self._node = following
+        return True
+
+    def move_prev(self) -> bool:
+        """Moves the cursor one node towards the head.
+
+        Returns:
+            bool: True if it moved, False if it was already on the head.
+        """
+        previous = self._current().prev
+        if previous is None:
+            return False
+        self._node = previous
+        return True
+
+    def insert_before(self, node: PlayerNode) -> None:
+        """Inserts a node just before the cursor, in O(1); the cursor stays put.
+
+        On an empty list the node becomes the only node and the cursor moves
+        onto it.
+
+        Args:
+            node: The PlayerNode to insert.
+
+        Raises:
+            ValueError: If the cursor is invalid or node's uid is already in the list.
+        """
+        if self._node is None and self._list.is_empty:
+            self._list.insert_at_head(node)
+            self._node = node
+            return
+        previous = self._current().prev
+        if previous is None:
+            self._list.insert_at_head(node)
+        else:
+            self._list.insert_after(previous, node)
+
+    def insert_after(self, node: PlayerNode) -> None:
+        """Inserts a node just after the cursor, in O(1); the cursor stays put.
+
+        On an empty list the node becomes the only node and the cursor moves
+        onto it.
+
+        Args:
+            node: The PlayerNode to insert.
+
+        Raises:
+            ValueError: If the cursor is invalid or node's uid is already in the list.
+        """
+        if self._node is None and self._list.is_empty:
+            self._list.insert_at_head(node)
+            self._node = node
+            return
+        self._list.insert_after(self._current(), node)
+
+    def remove(self) -> PlayerNode:
+        """Removes the node under the cursor, in O(1).
+
+        The cursor moves to the following node, or to the preceding one when
+        the tail was removed, or to None when the list is now empty.
+
+        Returns:
+            PlayerNode: The removed node.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        node = self._current()
+        landing = node.next if node.next is not None else node.prev
+        self._list.delete_node_with_key(node.key)
+        self._node = landing
+        return node
+
+    def _current(self) -> PlayerNode:
+        """Gets the node under the cursor, checking it is still in the list.
+
+        Returns:
+            PlayerNode: The node.
+
+        Raises:
+            ValueError: If the cursor is on no node or its node was removed.
+        """
+        if not self.is_valid:
+            raise ValueError("The cursor's node is no longer in the list")
+        return self._node
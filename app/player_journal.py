@@ -0,0 +1,493 @@
+from __future__ import annotations
+import os
+import re
+import struct
+import threading
+import zlib
+from player import Player, PlayerName
+from player_list import PlayerList
+from player_node import PlayerNode
+from player_snapshot import MappedPlayerList, save_rows
+
+# How buffered records reach the disk, from safest to fastest:
+#   always  every change is written and fsynced before the call returns
+#   batch   group commit: changes are written and fsynced together, once
+#           group_size are pending or interval seconds have passed
+#   never   changes are written in groups like batch, fsync is left to the OS
+FSYNC_POLICIES = ("always", "batch", "never")
+
+# A journal is a series of generations. Generation g has a log file
+# <path>.<g>.log and, once compacted, a snapshot <path>.<g>.snapshot holding
+# everything logged before generation g. Recovery loads the newest snapshot
+# and replays the logs from its generation on.
+#
+# Log layout, all integers little-endian:
+#   header   magic, format version, reserved, generation
+#   records  op, uid, prev uid (0 for the head), name length, name, CRC-32
+#            (renames carry the new name and no prev)
+_MAGIC = b"PLWL"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHQ")
+_RECORD = struct.Struct("<BQQI")
+_CRC = struct.Struct("<I")
+_INSERT = 1
+_DELETE = 2
+_RENAME = 3
+# Uids are stored unsigned in 64 bits, and 0 marks the head as a prev.
+_MAX_UID = 2 ** 64 - 1
+
+
+def check_uid(node: PlayerNode) -> None:
+    """Rejects a node whose uid does not fit in a record.
+
+    Args:
+        node: The node about to be recorded.
+
+    Raises:
+        ValueError: If the uid is not between 1 and 2**64 - 1.
+    """
+    uid = int(node.key)
+    if not 0 < uid <= _MAX_UID:
+        raise ValueError(f"Player UID {uid} cannot be journaled: it must lie in 1..2**64 - 1")
+
+
+def encode_insert(node: PlayerNode) -> bytes:
+    """Encodes the insert of a linked node as "insert after its prev".
+
+    Args:
+        node: A node that has just been linked into a list.
+
+    Returns:
+        bytes: The record.
+    """
+    name = node.name.encode("utf-8")
+    prev = 0 if node.prev is None else int(node.prev.key)
+    body = _RECORD.pack(_INSERT, int(node.key), prev, len(name)) + name
+    return body + _CRC.pack(zlib.crc32(body))
+
+
+def encode_delete(node: PlayerNode) -> bytes:
+    """Encodes the delete of a node.
+
+    Args:
+        node: A node that has just been unlinked from a list.
+
+    Returns:
+        bytes: The record.
+    """
+    body = _RECORD.pack(_DELETE, int(node.key), 0, 0)
+    return body + _CRC.pack(zlib.crc32(body))
+
+
+def encode_rename(node: PlayerNode) -> bytes:
+    """Encodes a change of a node's player name.
+
+    Args:
+        node: A node whose player has just been renamed.
+
+    Returns:
+        bytes: The record.
+    """
+    name = node.name.encode("utf-8")
+    body = _RECORD.pack(_RENAME, int(node.key), 0, len(name)) + name
+    return body + _CRC.pack(zlib.crc32(body))
+
+
+def iter_records(data: bytes, start: int = 0):
+    """Decodes records until the data ends or a record is torn or corrupt.
+
+    Args:
+        data: The encoded records.
+        start: The offset of the first record.
+
+    Yields:
+        tuple: (op, uid, prev uid, name, offset just past the record).
+    """
+    offset = start
+    while offset + _RECORD.size <= len(data):
+        op, uid, prev, name_length = _RECORD.unpack_from(data, offset)
+        body_end = offset + _RECORD.size + name_length
+        end = body_end + _CRC.size
+        if end > len(data) or op not in (_INSERT, _DELETE, _RENAME):
+            return
+        (crc,) = _CRC.unpack_from(data, body_end)
+        if crc != zlib.crc32(data[offset:body_end]):
+            return
+        yield op, uid, prev, str(data[offset + _RECORD.size:body_end], "utf-8"), end
+        offset = end
+
+
+def apply_record(player_list: PlayerList, op: int, uid: int, prev: int, name: str,
+                 player_class: type = Player) -> None:
+    """Replays one decoded record against a list.
+
+    Args:
+        player_list: The list to change.
+        op: The record's operation.
+        uid: The player's uid.
+        prev: For inserts, the uid of the node to insert after, or 0 for the head.
+        name: For inserts and renames, the player's name.
+        player_class: The Player (sub)class to build; its uid type, e.g. int
+            for IntUIDPlayer, is the list's key type.
+
+    Raises:
+        ValueError: If the record does not fit the list, e.g. its prev is missing.
+    """
+    key = _key_type(player_class)
+    if op == _DELETE:
+        player_list.delete_node_with_key(key(uid))
+        return
+    if op == _RENAME:
+        node = player_list.find_node_with_key(key(uid))
+        if node is None:
+            raise ValueError(f"Journal renames {uid}, which is not in the list")
+        node.player.name = name
+        return
+    node = PlayerNode(player_class.from_trusted(key(uid), name))
+    if prev == 0:
+        player_list.insert_at_head(node)
+        return
+    anchor = player_list.find_node_with_key(key(prev))
+    if anchor is None:
+        raise ValueError(f"Journal inserts {uid} after {prev}, which is not in the list")
+    player_list.insert_after(anchor, node)
+
+
+def _key_type(player_class: type) -> type:
+    """Gets the type a list of player_class players is keyed by.
+
+    Args:
+        player_class: A Player (sub)class.
+
+    Returns:
+        type: int for players with int uids, such as IntUIDPlayer, else str.
+    """
+    return int if player_class.uid.as_int else str
+
+
+class PlayerJournal:
+    """A write-ahead log that makes a PlayerList survive crashes.
+
+    Opening a journal recovers its list from the newest snapshot and the logs
+    written since, then records every insert and delete made to the list
+    (through add_listener), and every rename of a listed player (through
+    PlayerName.add_listener), as a compact, checksummed binary record. A
+    torn record at the end of the log, left by a crash mid-write, is
+    discarded. Records hold uids in 64 bits, so inserting a player whose uid
+    does not fit is refused before the list changes.
+
+    compact() folds the log into a snapshot (see player_snapshot). Only the
+    node order is captured in the caller; encoding and writing the snapshot
+    happen on a background thread while new records go to a fresh log. Call
+    it between list operations, never from inside a listener.
+
+    Attributes:
+        player_list: The recovered list; change it directly.
+    """
+    def __init__(self, path: str, fsync: str = "batch", group_size: int = 256,
+                 interval: float = 0.01, player_list_class: type = PlayerList,
+                 player_class: type = Player) -> None:
+        """Opens (or creates) a journal and recovers its list.
+
+        Args:
+            path: The journal's base path; files are named <path>.<generation>.log
+                and <path>.<generation>.snapshot.
+            fsync: One of FSYNC_POLICIES.
+            group_size: How many records batch and never group per write.
+            interval: The longest, in seconds, batch and never hold a record
+                before writing it.
+            player_list_class: The PlayerList (sub)class to recover into.
+            player_class: The Player (sub)class to recover players as, e.g.
+                IntUIDPlayer for a list keyed by int.
+
+        Raises:
+            ValueError: If fsync is not a known policy or a log is not a journal.
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy {fsync!r}, expected one of {FSYNC_POLICIES}")
+        self._path = path
+        self._fsync = fsync
+        self._group_size = group_size
+        self._lock = threading.Lock()
+        self._buffer = []
+        self._file = None
+        self._compaction = None
+        self._player_class = player_class
+        self.player_list, generation = self._recover(player_list_class)
+        self._open_log(generation)
+        self.player_list.add_listener(self)
+        PlayerName.add_listener(self)
+        self._closed = threading.Event()
+        self._flusher = None
+        if fsync != "always":
+            self._flusher = threading.Thread(target=self._flush_periodically, args=(interval,), daemon=True)
+            self._flusher.start()
+
+    @property
+    def generation(self) -> int:
+        """Gets the generation of the log currently being written.
+
+        Returns:
+            int: The generation.
+        """
+        return self._generation
+
+    @property
+    def log_size(self) -> int:
+        """Gets the size of the current log, e.g. to decide when to compact().
+
+        Returns:
+            int: The bytes written plus the bytes still buffered.
+        """
+        with self._lock:
+            return self._file.tell() + sum(map(len, self._buffer))
+
+    def check_insert(self, node: PlayerNode) -> None:
+        """Refuses a node whose uid does not fit in a record; called by the list.
+
+        Args:
+            node: The node about to be inserted.
+
+        Raises:
+            ValueError: If the uid is not between 1 and 2**64 - 1.
+        """
+        check_uid(node)
+
+    def on_insert(self, node: PlayerNode) -> None:
+        """Records an insert; called by the list.
+
+        Args:
+            node: The inserted node.
+        """
+        self._append(encode_insert(node))
+
+    def on_delete(self, node: PlayerNode) -> None:
+        """Records a delete; called by the list.
+
+        Args:
+            node: The deleted node.
+        """
+        self._append(encode_delete(node))
+
+    def on_rename(self, player: Player, old_name: str) -> None:
+        """Records a rename of a player in the list; called by PlayerName.
+
+        Args:
+            player: The renamed player.
+            old_name: The name it had before.
+        """
+        node = self.player_list.find_node_with_key(player.uid)
+        if node is not None and node.player is player:
+            self._append(encode_rename(node))
+
+    def commit(self) -> None:
+        """Writes and fsyncs every buffered record now, whatever the policy."""
+        with self._lock:
+            self._flush(sync=True)
+
+    def compact(self, wait: bool = False) -> None:
+        """Folds everything logged so far into a snapshot, in the background.
+
+        Args:
+            wait: If True, return only once the snapshot is durable.
+        """
+        self.wait_for_compaction()
+        with self._lock:
+            self._flush(sync=True)
+            # Capture values, not nodes: the list may rename, delete or (with
+            # a node pool) recycle its nodes while the snapshot is written.
+            rows = [(node.key, node.name) for node in self.player_list]
+            generation = self._generation + 1
+            self._file.close()
+            self._open_log(generation)
+        self._compaction = threading.Thread(target=self._write_snapshot, args=(rows, generation))
+        self._compaction.start()
+        if wait:
+            self.wait_for_compaction()
+
+    def wait_for_compaction(self) -> None:
+        """Blocks until a running compaction, if any, has finished."""
+        if self._compaction is not None:
+            self._compaction.join()
+            self._compaction = None
+
+    def close(self) -> None:
+        """Commits, finishes any compaction and stops recording the list."""
+        self.player_list.remove_listener(self)
+        PlayerName.remove_listener(self)
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.commit()
+        self.wait_for_compaction()
+        self._file.close()
+
+    def _recover(self, player_list_class: type):
+        """Rebuilds the list from the newest snapshot and the logs after it.
+
+        Args:
+            player_list_class: The list class to build.
+
+        Returns:
+            tuple: The list and the generation to keep writing.
+        """
+        snapshots, logs = self._generations()
+        base = max(snapshots, default=0)
+        if base:
+            with MappedPlayerList(self._file_name(base, "snapshot"), use_mmap=False) as snapshot:
+                trusted, key = self._player_class.from_trusted, _key_type(self._player_class)
+                player_list = player_list_class.from_iterable(
+                    PlayerNode(trusted(key(node.key), node.name)) for node in snapshot
+                )
+        else:
+            player_list = player_list_class()
+        replayed = [generation for generation in sorted(logs) if generation >= base]
+        for generation in replayed:
+            self._replay(player_list, generation, last=generation == replayed[-1])
+        self._remove_before(base)
+        return player_list, (replayed[-1] if replayed else max(base, 1))
+
+    def _replay(self, player_list: PlayerList, generation: int, last: bool) -> None:
+        """Applies one log, cutting a torn tail off the last one.
+
+        Args:
+            player_list: The list being rebuilt.
+            generation: The log's generation.
+            last: Whether this is the newest log, which may end mid-record.
+
+        Raises:
+            ValueError: If the file is not a journal log.
+        """
+        name = self._file_name(generation, "log")
+        with open(name, "rb") as file:
+            data = file.read()
+        end = _HEADER.size
+        if len(data) >= _HEADER.size:
+            magic, version, _, stored = _HEADER.unpack_from(data)
+            if magic != _MAGIC or version != _VERSION or stored != generation:
+                raise ValueError(f"{name} is not a version {_VERSION} journal log")
+            for op, uid, prev, player_name, end in iter_records(data, _HEADER.size):
+                apply_record(player_list, op, uid, prev, player_name, self._player_class)
+        if last and end != len(data):
+            with open(name, "r+b") as file:
+                file.truncate(end)
+
+    def _open_log(self, generation: int) -> None:
+        """Opens a generation's log for appending, writing its header if new.
+
+        Args:
+            generation: The generation to write.
+        """
+        self._generation = generation
+        self._file = open(self._file_name(generation, "log"), "ab")
+        if self._file.tell() < _HEADER.size:
+            self._file.truncate(0)
+            self._file.write(_HEADER.pack(_MAGIC, _VERSION, 0, generation))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            _fsync_directory(self._path)
+
+    def _append(self, record: bytes) -> None:
+        """Buffers a record and writes the group out as the policy requires.
+
+        Args:
+            record: The encoded record.
+        """
+        with self._lock:
+            self._buffer.append(record)
+            if self._fsync == "always":
+                self._flush(sync=True)
+            elif len(self._buffer) >= self._group_size:
+                self._flush(sync=self._fsync == "batch")
+
+    def _flush(self, sync: bool) -> None:
+        """Writes the buffered records; the caller holds the lock.
+
+        Args:
+            sync: Whether to fsync after writing.
+        """
+        if self._buffer:
+            self._file.write(b"".join(self._buffer))
+            self._buffer.clear()
+            self._file.flush()
+            if sync:
+                os.fsync(self._file.fileno())
+
+    def _flush_periodically(self, interval: float) -> None:
+        """Bounds how long batch and never hold a record, until closed.
+
+        Args:
+            interval: Seconds between flushes.
+        """
+        while not self._closed.wait(interval):
+            with self._lock:
+                self._flush(sync=self._fsync == "batch")
+
+    def _write_snapshot(self, rows: list, generation: int) -> None:
+        """Writes a generation's snapshot durably, then drops what it replaces.
+
+        Args:
+            rows: The list's (uid, name) pairs when the generation began.
+            generation: The generation the snapshot starts.
+        """
+        name = self._file_name(generation, "snapshot")
+        save_rows(rows, f"{name}.tmp")
+        with open(f"{name}.tmp", "rb+") as file:
+            os.fsync(file.fileno())
+        os.replace(f"{name}.tmp", name)
+        _fsync_directory(self._path)
+        self._remove_before(generation)
+
+    def _generations(self):
+        """Finds the generations present on disk.
+
+        Returns:
+            tuple: The set of snapshot generations and the set of log generations.
+        """
+        directory, base = os.path.split(os.path.abspath(self._path))
+        pattern = re.compile(re.escape(base) + r"\.(\d+)\.(log|snapshot)")
+        snapshots, logs = set(), set()
+        for entry in os.listdir(directory):
+            match = pattern.fullmatch(entry)
+            if match:
+                (logs if match.group(2) == "log" else snapshots).add(int(match.group(1)))
+        return snapshots, logs
+
+    def _remove_before(self, generation: int) -> None:
+        """Deletes the logs and snapshots a newer snapshot has made redundant.
+
+        Args:
+            generation: The oldest generation to keep.
+        """
+        snapshots, logs = self._generations()
+        for kind, generations in (("log", logs), ("snapshot", snapshots)):
+            for old in generations:
+                if old < generation:
+                    os.remove(self._file_name(old, kind))
+
+    def _file_name(self, generation: int, kind: str) -> str:
+        return f"{self._path}.{generation}.{kind}"
+
+    def __enter__(self) -> PlayerJournal:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _fsync_directory(path: str) -> None:
+    """Makes file creations and renames next to path durable, where supported.
+
+    Args:
+        path: A path inside the directory.
+    """
+    try:
+        descriptor = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return  # e.g. Windows, where directories cannot be opened
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
@@ -1,15 +1,54 @@
 from __future__ import annotations
+import sys
+import weakref
+from itertools import islice
+from typing import Iterable, TextIO
 from player import Player
 from player_node import PlayerNode
 
 class PlayerList:
     """A doubly-linked list implementation for managing PlayerNodes.
 
-    The list maintains head and tail pointers and tracks its length.
+    The list maintains head and tail pointers and tracks its length. A uid to
+    PlayerNode index is kept in sync by every insert and delete, so lookups,
+    deletes by key and membership tests are O(1). Since uids identify a player,
+    a list may only hold one node per uid.
     """
+    # Whether concat() and split_at() may relink whole chains; subclasses
+    # keeping extra per-node structure move nodes one at a time instead.
+    _relinkable = True
+
     def __init__(self) -> None:
         self._head = None
+        self._tail = None
         self._length = 0
+        self._index = {}
+        # Where pending snapshot() views read the list's past state from:
+        # the list's own history, and every history holding its nodes, both
+        # held weakly (see player_list_view._History).
+        self._history = None
+        self._histories = None
+        # Objects told about every insert and delete, see add_listener().
+        self._listeners = None
+        # The PlayerNodePool deleted nodes are returned to, see use_pool().
+        self._pool = None
+
+    @classmethod
+    def from_iterable(cls, nodes: Iterable[PlayerNode]) -> PlayerList:
+        """Builds a list from a batch of PlayerNodes in one pass.
+
+        Args:
+            nodes: The PlayerNodes to load, in head to tail order.
+
+        Returns:
+            PlayerList: A new list holding the nodes.
+
+        Raises:
+            ValueError: If two nodes share a key.
+        """
+        player_list = cls()
+        player_list.extend(nodes)
+        return player_list
 
     @property
     def is_empty(self) -> bool:
@@ -55,12 +94,18 @@ class PlayerList:
         """
         # We are passing nodes rather than values
         # because then input is already sanitised by Player's descriptors.
+        self._check_not_indexed(node)
+        if self._histories is not None:
+            self._preserve(self._head)
         if self.is_empty:
             self._head = node
             self._tail = node
             node.next = None  # Ensure node's pointers are set correctly
             node.prev = None
             self._length += 1
+            self._index[node.key] = node
+            if self._listeners is not None:
+                self._notify("on_insert", node)
             return
 
         node.next = self._head
@@ -68,6 +113,9 @@ class PlayerList:
         self._head.prev = node  # update old head's prev to point to the new node
         self._head = node
         self._length += 1
+        self._index[node.key] = node
+        if self._listeners is not None:
+            self._notify("on_insert", node)
 
     def insert_at_tail(self, node: PlayerNode) -> None:
         """Inserts a PlayerNode at the end of the list.
@@ -75,6 +123,9 @@ class PlayerList:
         Args:
             node: The PlayerNode to insert.
         """
+        self._check_not_indexed(node)
+        if self._histories is not None:
+            self._preserve(self._tail)
         if self.is_empty:
             # For an empty list, new node becomes both head and tail.
             self._head = node
@@ -82,6 +133,9 @@ class PlayerList:
             node.next = None  # Ensure node's pointers are set correctly
             node.prev = None
             self._length += 1
+            self._index[node.key] = node
+            if self._listeners is not None:
+                self._notify("on_insert", node)
             return
 
         node.prev = self._tail
@@ -89,6 +143,167 @@ class PlayerList:
         self._tail.next = node
         self._tail = node
         self._length += 1
+        self._index[node.key] = node
+        if self._listeners is not None:
+            self._notify("on_insert", node)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True):
+        """Loads a list written by save().
+
+        Args:
+            path: The snapshot file to read.
+            mmap: If True, memory-map the file and return a read-only
+                MappedPlayerList that materialises players lazily as they are
+                iterated or looked up. If False, read the whole file and return
+                a regular PlayerList.
+
+        Returns:
+            MappedPlayerList or PlayerList: The loaded list.
+
+        Raises:
+            ValueError: If the file is not a player snapshot.
+        """
+        from player_snapshot import MappedPlayerList
+
+        if mmap:
+            return MappedPlayerList(path)
+        with MappedPlayerList(path, use_mmap=False) as snapshot:
+            return snapshot.to_player_list()
+
+    def save(self, path: str) -> None:
+        """Writes the list to a compact binary snapshot file, preserving order.
+
+        Args:
+            path: The file to write.
+        """
+        from player_snapshot import save_snapshot
+
+        save_snapshot(self, path)
+
+    @classmethod
+    def open_journal(cls, path: str, fsync: str = "batch", **options):
+        """Recovers a list from a write-ahead journal and keeps journaling it.
+
+        See player_journal.PlayerJournal for the files written and the options.
+
+        Args:
+            path: The journal's base path.
+            fsync: "always", "batch" (group commit) or "never".
+            **options: Passed on to PlayerJournal, e.g. group_size or interval.
+
+        Returns:
+            PlayerJournal: The open journal; its player_list is the recovered list.
+        """
+        from player_journal import PlayerJournal
+
+        return PlayerJournal(path, fsync=fsync, player_list_class=cls, **options)
+
+    def iter_export(self, format: str = "csv", chunk_size: int = 1000):
+        """Streams the list as CSV or JSON Lines, one chunk of records at a time.
+
+        Args:
+            format: "csv" (with a uid,name header) or "jsonl".
+            chunk_size: The number of records per yielded chunk.
+
+        Yields:
+            str: Encoded records, each terminated by a newline.
+        """
+        from roster_io import iter_export
+
+        yield from iter_export(self, format=format, chunk_size=chunk_size)
+
+    def import_stream(self, fileobj, format: str = "csv", errors: str = "raise",
+                      chunk_size: int = 1000, on_error=None) -> int:
+        """Appends players parsed incrementally from a CSV or JSON Lines stream.
+
+        See roster_io.import_stream for the error policies.
+
+        Args:
+            fileobj: A text stream positioned at the start of the roster.
+            format: "csv" (with a uid,name header) or "jsonl".
+            errors: "raise" or "skip".
+            chunk_size: The number of records parsed and inserted per batch.
+            on_error: Optional callback for skipped records.
+
+        Returns:
+            int: The number of players imported.
+        """
+        from roster_io import import_stream
+
+        return import_stream(self, fileobj, format=format, errors=errors,
+                             chunk_size=chunk_size, on_error=on_error)
+
+    def extend(self, nodes: Iterable[PlayerNode]) -> None:
+        """Appends a batch of PlayerNodes at the end of the list, keeping their order.
+
+        Equivalent to calling insert_at_tail for each node, but the whole batch
+        is linked in a single pass. Either every node is inserted or, if a key
+        clashes, none are.
+
+        Args:
+            nodes: The PlayerNodes to append.
+
+        Raises:
+            ValueError: If a key is already in the list or repeated in the batch.
+        """
+        batch = self._collect_batch(nodes)
+        if not batch:
+            return
+        if self._histories is not None:
+            self._preserve(self._tail)
+        # Write the link slots directly; the property setters dominate the
+        # cost of this loop otherwise.
+        prev = self._tail
+        for node in batch.values():
+            node._prev = prev
+            if prev is None:
+                self._head = node
+            else:
+                prev._next = node
+            prev = node
+        prev._next = None
+        self._tail = prev
+        self._length += len(batch)
+        self._index.update(batch)
+        if self._listeners is not None:
+            for node in batch.values():
+                self._notify("on_insert", node)
+
+    def extend_left(self, nodes: Iterable[PlayerNode]) -> None:
+        """Prepends a batch of PlayerNodes at the front of the list.
+
+        Like deque.extendleft this is equivalent to calling insert_at_head for
+        each node, so the batch ends up in reverse order. Either every node is
+        inserted or, if a key clashes, none are.
+
+        Args:
+            nodes: The PlayerNodes to prepend.
+
+        Raises:
+            ValueError: If a key is already in the list or repeated in the batch.
+        """
+        batch = self._collect_batch(nodes)
+        if not batch:
+            return
+        if self._histories is not None:
+            self._preserve(self._head)
+        following = self._head
+        for node in batch.values():
+            node._next = following
+            if following is None:
+                self._tail = node
+            else:
+                following._prev = node
+            following = node
+        following._prev = None
+        self._head = following
+        self._length += len(batch)
+        self._index.update(batch)
+        if self._listeners is not None:
+            # Report in list order, so each node's prev is already reported.
+            for node in reversed(batch.values()):
+                self._notify("on_insert", node)
 
     def insert_at_position(self, node: PlayerNode, position: int) -> None:
         """Inserts a PlayerNode at a specific position in the list.
@@ -96,6 +311,10 @@ class PlayerList:
         Args:
             node: The PlayerNode to insert.
             position: The position to insert the node at.
+
+        Raises:
+            IndexError: If position is outside the list.
+            ValueError: If a node with the same key is already in the list.
         """
         if position < 0 or position > self.length:
             raise IndexError("Invalid position")
@@ -105,12 +324,49 @@ class PlayerList:
         if position == self.length:
             self.insert_at_tail(node)
             return
+        self._check_not_indexed(node)
         current = self._head
         for _ in range(position - 1):
             current = current.next
+        if self._histories is not None:
+            self._preserve(current, current.next)
         node.next = current.next
         node.prev = current
         current.next.prev = node
+        current.next = node
+        self._length += 1
+        self._index[node.key] = node
+        if self._listeners is not None:
+            self._notify("on_insert", node)
+
+    def insert_after(self, anchor: PlayerNode, node: PlayerNode) -> None:
+        """Inserts a PlayerNode right after a node already in the list, in O(1).
+
+        Args:
+            anchor: The node to insert after; it must belong to this list.
+            node: The PlayerNode to insert.
+
+        Raises:
+            ValueError: If anchor is not in the list, or a node with the same
+                key as node already is.
+        """
+        if self._index.get(anchor.key) is not anchor:
+            raise ValueError(f"The player with uid {anchor.key} is not in the list")
+        if anchor is self._tail:
+            self.insert_at_tail(node)
+            return
+        self._check_not_indexed(node)
+        following = anchor.next
+        if self._histories is not None:
+            self._preserve(anchor, following)
+        node.prev = anchor
+        node.next = following
+        following.prev = node
+        anchor.next = node
+        self._length += 1
+        self._index[node.key] = node
+        if self._listeners is not None:
+            self._notify("on_insert", node)
 
     def delete_head(self) -> None:
         """Removes the first node in the list.
@@ -120,16 +376,24 @@ class PlayerList:
         """
         if self.is_empty:
             raise IndexError("Cannot delete a node from an empty list")
+        node = self._head
+        if self._histories is not None:
+            self._preserve(node, node.next)
+        del self._index[node.key]
         if self.length == 1:
             self._head = None
             self._tail = None
             self._length -= 1
-            return
-        # Update the head pointer to the next node.
-        new_head = self._head.next
-        new_head.prev = None  # New head's prev must be None.
-        self._head = new_head
-        self._length -= 1
+        else:
+            # Update the head pointer to the next node.
+            new_head = node.next
+            new_head.prev = None  # New head's prev must be None.
+            self._head = new_head
+            self._length -= 1
+        if self._listeners is not None:
+            self._notify("on_delete", node)
+        if self._pool is not None:
+            self._pool.release(node)
 
     def delete_tail(self) -> None:
         """Removes the last node in the list.
@@ -139,32 +403,35 @@ class PlayerList:
         """
         if self.is_empty:
             raise IndexError("Cannot delete a node from an empty list")
+        node = self._tail
+        if self._histories is not None:
+            self._preserve(node.prev, node)
+        del self._index[node.key]
         if self.length == 1:
             self._head = None
             self._tail = None
             self._length -= 1
-            return
-
-        # Update the tail pointer to the previous node.
-        new_tail = self._tail.prev
-        new_tail.next = None
-        self._tail = new_tail
-        self._length -= 1
+        else:
+            # Update the tail pointer to the previous node.
+            new_tail = node.prev
+            new_tail.next = None
+            self._tail = new_tail
+            self._length -= 1
+        if self._listeners is not None:
+            self._notify("on_delete", node)
+        if self._pool is not None:
+            self._pool.release(node)
 
     def find_node_with_key(self, key: str) -> PlayerNode | None:
-        """Finds the first node with the specified key.
+        """Finds the node with the specified key in O(1) via the index.
 
         Args:
             key: The key to search for.
 
         Returns:
-            PlayerNode or None: The first node with the specified key, or None if not found.
+            PlayerNode or None: The node with the specified key, or None if not found.
         """
-        for node in self:
-            if node.key == key:
-                return node
-        return None
-
+        return self._index.get(key)
 
     def delete_node_with_key(self, key: str) -> bool:
         """Deletes the first node with the specified key.
@@ -177,35 +444,479 @@ class PlayerList:
         """
         node = self.find_node_with_key(key)
         if node is not None:
-            if node == self._head:
+            if node is self._head:
                 self.delete_head()
                 # delete_head() already decrements length
                 return True
-            if node == self._tail:
+            if node is self._tail:
                 self.delete_tail()
                 # delete_tail() already decrements length
                 return True
             else:
+                if self._histories is not None:
+                    self._preserve(node.prev, node, node.next)
                 node.prev.next = node.next
                 node.next.prev = node.prev
                 self._length -= 1
+                del self._index[key]
+                if self._listeners is not None:
+                    self._notify("on_delete", node)
+                if self._pool is not None:
+                    self._pool.release(node)
                 return True
         return False
 
+    def find_many(self, keys: Iterable[str]) -> dict:
+        """Looks up a batch of keys through the index, O(1) per key.
+
+        Args:
+            keys: The keys to search for.
+
+        Returns:
+            dict: Each key mapped to its node, or None if not found.
+        """
+        index = self._index
+        return {key: index.get(key) for key in keys}
+
+    def delete_many(self, keys: Iterable[str]) -> dict:
+        """Deletes a batch of keys through the index, O(1) per key.
+
+        Each node is unlinked where it stands, so removing k players costs
+        O(k) however long the list is. A key repeated in the batch is only
+        deleted once.
+
+        Args:
+            keys: The keys to delete.
+
+        Returns:
+            dict: Each key mapped to True if it was deleted, False otherwise.
+        """
+        index = self._index
+        results = {}
+        for key in keys:
+            node = index.pop(key, None)
+            if node is None:
+                results.setdefault(key, False)
+                continue
+            results[key] = True
+            # Write the link slots directly, as extend() does.
+            prev, following = node._prev, node._next
+            if self._histories is not None:
+                self._preserve(prev, node, following)
+            if prev is None:
+                self._head = following
+            else:
+                prev._next = following
+            if following is None:
+                self._tail = prev
+            else:
+                following._prev = prev
+            node._prev = node._next = None
+            if self._listeners is not None:
+                self._notify("on_delete", node)
+            if self._pool is not None:
+                self._pool.release(node)
+        self._length = len(index)
+        return results
+
+    def concat(self, other: PlayerList) -> None:
+        """Moves every node of another list onto the end of this one.
+
+        The two chains are joined by relinking the ends, without touching the
+        interior nodes. Only the uid index needs work: the smaller index is
+        merged into the larger, so the cost is O(min(len(self), len(other))).
+        other is left empty. Lists with extra per-node structure, such as
+        IndexedPlayerList, move the nodes one by one instead.
+
+        Args:
+            other: The list to empty into this one.
+
+        Raises:
+            ValueError: If other is this list, the lists share a uid or a
+                listener refuses one of other's nodes.
+        """
+        if other is self:
+            raise ValueError("Cannot concatenate a list with itself")
+        small, big = sorted((self._index, other._index), key=len)
+        clash = next((key for key in small if key in big), None)
+        if clash is not None:
+            raise ValueError(f"A player with uid {clash} is already in the list")
+        if other.is_empty:
+            return
+        if self._listeners is not None:
+            for node in other:
+                self._check_insert(node)
+        if not (self._relinkable and other._relinkable):
+            nodes = list(other)
+            other._move_out([node.key for node in nodes])
+            self.extend(nodes)
+            return
+        if self._histories is not None:
+            self._preserve(self._tail)
+        if other._histories is not None:
+            other._preserve(other._head)
+        if other._histories is not None:
+            # Views of other still walk the moved nodes, so writes to this
+            # list must save their state too.
+            held = self._histories or []
+            self._histories = held + [ref for ref in other._histories if ref not in held]
+        moved = list(other) if self._listeners or other._listeners else ()
+        if self._tail is None:
+            self._head = other._head
+        else:
+            self._tail.next = other._head
+            other._head.prev = self._tail
+        self._tail = other._tail
+        self._length += other._length
+        big.update(small)
+        self._index = big
+        other._head = other._tail = None
+        other._length = 0
+        other._index = {}
+        for node in moved:
+            if other._listeners is not None:
+                other._notify("on_delete", node)
+            if self._listeners is not None:
+                self._notify("on_insert", node)
+
+    def split_at(self, node: PlayerNode) -> PlayerList:
+        """Cuts the list in two before a node, in O(min(k, n - k)).
+
+        The node and every node after it move to a new list of the same class,
+        linked as they were. The uid index is split by walking the shorter
+        side, found by stepping out from the cut in both directions at once.
+
+        Args:
+            node: The first node of the new list; it must belong to this list.
+
+        Returns:
+            PlayerList: A new list holding node through the old tail.
+
+        Raises:
+            ValueError: If node is not in the list.
+        """
+        if self._index.get(node.key) is not node:
+            raise ValueError(f"The player with uid {node.key} is not in the list")
+        rest = type(self)()
+        if not self._relinkable:
+            nodes = []
+            current = node
+            while current is not None:
+                nodes.append(current)
+                current = current.next
+            self._move_out([moved.key for moved in nodes])
+            rest.extend(nodes)
+            return rest
+        if self._histories is not None:
+            self._preserve(node.prev, node)
+        if self._histories is not None:
+            # Views still walk the moved nodes through the new list.
+            rest._histories = list(self._histories)
+        # Step towards both ends at once until one side runs out.
+        forward, backward = node, node.prev
+        while forward is not None and backward is not None:
+            forward, backward = forward.next, backward.prev
+        tail_is_shorter = forward is None
+        shorter = []
+        current = node if tail_is_shorter else self._head
+        while current is not None and (tail_is_shorter or current is not node):
+            shorter.append(current)
+            current = current.next
+        index = self._index
+        part = {moved.key: index.pop(moved.key) for moved in shorter}
+        if tail_is_shorter:
+            rest._index, moved_count = part, len(shorter)
+        else:
+            rest._index, self._index, moved_count = index, part, self._length - len(shorter)
+        rest._head, rest._tail, rest._length = node, self._tail, moved_count
+        self._tail = node.prev
+        if self._tail is None:
+            self._head = None
+        else:
+            self._tail.next = None
+        node.prev = None
+        self._length -= moved_count
+        if self._listeners is not None:
+            for moved in rest:
+                self._notify("on_delete", moved)
+        return rest
+
+    def _move_out(self, keys: list) -> None:
+        """Deletes nodes that are moving to another list.
+
+        The nodes are not released to the list's pool, if it has one, as
+        they stay in use.
+
+        Args:
+            keys: The keys of the nodes to move.
+        """
+        pool, self._pool = self._pool, None
+        try:
+            self.delete_many(keys)
+        finally:
+            self._pool = pool
+
+    def cursor(self, node: PlayerNode | None = None):
+        """Creates a cursor for O(1) edits around a node.
+
+        Args:
+            node: The node to start on; the head by default.
+
+        Returns:
+            PlayerCursor: The cursor.
+        """
+        from player_cursor import PlayerCursor
+
+        return PlayerCursor(self, self._head if node is None else node)
+
+    def snapshot(self):
+        """Takes an immutable view of the list in its current state, in O(1).
+
+        Nothing is copied, neither now nor later. While views are pending,
+        each write saves the old links of the few nodes it relinks and each
+        rename saves the player's old name, so a write stays O(1) and a list
+        with no pending views pays nothing. Views taken between the same two
+        writes share what is saved.
+
+        Returns:
+            PlayerListView: The view; release() it when done.
+
+        Raises:
+            ValueError: If the list uses a node pool, which would recycle the
+                nodes the view reads.
+        """
+        from player_list_view import PlayerListView, _History
+
+        if self._pool is not None:
+            raise ValueError("A list using a node pool cannot be snapshotted")
+        history = None if self._history is None else self._history()
+        if history is None:
+            history = _History()
+            self._history = weakref.ref(history)
+            if self._histories is None:
+                self._histories = []
+            self._histories.append(self._history)
+        return PlayerListView(history.generation(self))
+
+    def use_pool(self, pool) -> None:
+        """Returns every node deleted from now on to a PlayerNodePool.
+
+        Insert nodes taken from pool.acquire() to complete the cycle. A
+        deleted node is reset and handed out again, so callers must not keep
+        references to nodes once they are deleted (including the node
+        returned by PlayerCursor.remove()). Snapshot views and listeners
+        (journals, changelogs, indexes) may hold nodes past their deletion,
+        so a list with either cannot pool its nodes.
+
+        Args:
+            pool: The PlayerNodePool, or None to stop pooling.
+
+        Raises:
+            ValueError: If snapshot views of the list are still pending or
+                listeners are registered.
+        """
+        if pool is not None:
+            if self._histories is not None and any(ref() for ref in self._histories):
+                raise ValueError("Release the list's snapshot views before pooling its nodes")
+            if self._listeners is not None:
+                raise ValueError("Remove the list's listeners before pooling its nodes")
+        self._pool = pool
+
+    def add_listener(self, listener) -> None:
+        """Registers an object to be told about every insert and delete.
+
+        After each node is linked in, listener.on_insert(node) is called; the
+        node's prev is already in place, so "insert after node.prev" (or at
+        the head when it is None) replays the change. After each node is
+        unlinked, listener.on_delete(node) is called. Batch operations report
+        one call per node, in list order. A listener may also define
+        check_insert(node), called before anything is linked, to refuse a
+        node by raising ValueError. A list without listeners pays one
+        attribute check per write.
+
+        Args:
+            listener: An object with on_insert(node) and on_delete(node)
+                methods, and optionally check_insert(node).
+
+        Raises:
+            ValueError: If the list uses a node pool, which would recycle
+                nodes the listener may still hold.
+        """
+        if self._pool is not None:
+            raise ValueError("A list using a node pool cannot have listeners")
+        if self._listeners is None:
+            self._listeners = []
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener) -> None:
+        """Stops telling a listener about changes.
+
+        Args:
+            listener: An object previously passed to add_listener().
+
+        Raises:
+            ValueError: If the listener is not registered.
+        """
+        if self._listeners is None:
+            raise ValueError("The listener is not registered")
+        self._listeners.remove(listener)
+        if not self._listeners:
+            self._listeners = None
+
+    def query(self):
+        """Starts a lazy query over the list, e.g.
+        player_list.query().where(name_prefix="Ste").select(lambda node: node.name).limit(10).
+
+        Returns:
+            PlayerQuery: A query yielding every node, in list order.
+        """
+        from player_query import PlayerQuery
+
+        return PlayerQuery(self)
+
     def display(self, forward: bool = True) -> None:
         """Prints the list contents to console.
 
         Args:
             forward: If True, prints from head to tail; if False, tail to head.
         """
-        nodes = list(self if forward else reversed(self))
-        if not nodes:
-            print("Empty list")
+        self.render(forward=forward)
+
+    def render(self, stream: TextIO | None = None, forward: bool = True,
+               head: int | None = None, tail: int | None = None,
+               chunk_size: int = 1000) -> None:
+        """Writes the list contents to a text stream while walking it.
+
+        Output is written every chunk_size nodes, so memory stays bounded
+        however long the list is. With head and/or tail set, only that many
+        nodes from each end are written, around a marker counting the rest;
+        the tail end is read by walking the list from the other side.
+
+        Args:
+            stream: Where to write; sys.stdout by default.
+            forward: If True, writes from head to tail; if False, tail to head.
+            head: How many nodes to show from the start, or None for all.
+            tail: How many nodes to show from the end, or None for none when
+                head is set, and all otherwise.
+            chunk_size: How many nodes to buffer between writes.
+        """
+        if stream is None:
+            stream = sys.stdout
+        if self.is_empty:
+            stream.write("Empty list\n")
             return
+        length = self.length
+        shown_head = length if head is None and tail is None else min(head or 0, length)
+        shown_tail = min(tail or 0, length - shown_head)
+        skipped = max(0, length - shown_head - shown_tail)
+
+        pieces = []
+        separator = ""
+        for node in islice(self if forward else reversed(self), shown_head):
+            pieces.append(f"{node.key}'{node.name}'")
+            if len(pieces) == chunk_size:
+                stream.write(separator + " -> ".join(pieces))
+                separator = " -> "
+                pieces.clear()
+        if skipped:
+            pieces.append(f"...({skipped} more)")
+        if shown_tail:
+            ending = islice(reversed(self) if forward else self, shown_tail)
+            pieces.extend(reversed([f"{node.key}'{node.name}'" for node in ending]))
+        stream.write((separator + " -> ".join(pieces) if pieces else "") + "\n")
+
+
+    def _notify(self, event: str, node: PlayerNode) -> None:
+        """Calls one method on every listener.
+
+        Args:
+            event: "on_insert" or "on_delete".
+            node: The node inserted or deleted.
+        """
+        for listener in self._listeners:
+            getattr(listener, event)(node)
+
+    def _preserve(self, *nodes: PlayerNode | None) -> None:
+        """Saves the state of nodes about to be relinked for the pending views.
+
+        Args:
+            *nodes: The nodes whose next or prev the write changes, including
+                any node it unlinks; None entries are skipped.
+        """
+        alive = 0
+        for ref in self._histories:
+            history = ref()
+            if history is not None:
+                history.preserve(nodes)
+                alive += 1
+        if alive < len(self._histories):
+            # Forget the histories whose views were all released or collected.
+            self._histories = [ref for ref in self._histories if ref() is not None] or None
+
+    def _check_not_indexed(self, node: PlayerNode) -> None:
+        """Rejects a node whose key is already held by the list.
+
+        Args:
+            node: The PlayerNode about to be inserted.
+
+        Raises:
+            ValueError: If a node with the same key is already in the list,
+                or a listener refuses the node.
+        """
+        if node.key in self._index:
+            raise ValueError(f"A player with uid {node.key} is already in the list")
+        if self._listeners is not None:
+            self._check_insert(node)
 
-        output = " -> ".join(f"{node.key}'{node.name}'" for node in nodes)
-        print(output)
+    def _collect_batch(self, nodes: Iterable[PlayerNode]) -> dict:
+        """Keys a batch of nodes, rejecting clashes before anything is linked.
 
+        Args:
+            nodes: The PlayerNodes about to be inserted.
+
+        Returns:
+            dict: The nodes keyed by uid, in batch order.
+
+        Raises:
+            ValueError: If a key is already in the list or repeated in the
+                batch, or a listener refuses a node.
+        """
+        batch = {}
+        index = self._index
+        for node in nodes:
+            key = node.key
+            if key in index or key in batch:
+                raise ValueError(f"A player with uid {key} is already in the list")
+            batch[key] = node
+        if self._listeners is not None:
+            for node in batch.values():
+                self._check_insert(node)
+        return batch
+
+    def _check_insert(self, node: PlayerNode) -> None:
+        """Lets each listener with a check_insert() method refuse a node.
+
+        Args:
+            node: The PlayerNode about to be inserted.
+
+        Raises:
+            ValueError: If a listener refuses the node.
+        """
+        for listener in self._listeners:
+            check = getattr(listener, "check_insert", None)
+            if check is not None:
+                check(node)
+
+    def __contains__(self, key: str) -> bool:
+        """Checks in O(1) whether a node with the given key is in the list.
+
+        Args:
+            key: The key to look for.
+
+        Returns:
+            bool: True if a node with the key is in the list, False otherwise.
+        """
+        return key in self._index
 
     def __iter__(self):
         """Implements forward iteration through the list.
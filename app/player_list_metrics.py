@@ -0,0 +1,294 @@
+from __future__ import annotations
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from player_list import PlayerList
+
+# Upper bounds of the latency buckets, in seconds (1us to 1s).
+LATENCY_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+                   1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0)
+# Upper bounds of the traversal buckets, in nodes visited.
+TRAVERSAL_BUCKETS = (0, 1, 4, 16, 64, 256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+# The PlayerList methods that are counted and timed once instrumented.
+INSTRUMENTED_OPERATIONS = (
+    "insert_at_head", "insert_at_tail", "insert_at_position", "insert_after",
+    "extend", "extend_left", "delete_head", "delete_tail", "find_node_with_key",
+    "delete_node_with_key", "find_many", "delete_many", "display",
+)
+
+
+class Histogram:
+    """A cumulative histogram with fixed bucket upper bounds, Prometheus style."""
+
+    def __init__(self, bounds) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # the last bucket is +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Records one observation.
+
+        Args:
+            value: The observed value.
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def snapshot(self) -> dict:
+        """Gets the histogram as plain data.
+
+        Returns:
+            dict: Cumulative counts per upper bound ("+Inf" last), sum and count.
+        """
+        buckets = {}
+        running = 0
+        for bound, count in zip((*self.bounds, "+Inf"), self.counts):
+            running += count
+            buckets[bound] = running
+        return {"buckets": buckets, "sum": self.total, "count": self.count}
+
+
+class PlayerListMetrics:
+    """Per-operation counters, latency and traversal histograms and a length gauge.
+
+    Attributes:
+        length_samples: (unix time, length) pairs, taken at most once every
+            sample_interval seconds and capped at max_samples.
+    """
+
+    def __init__(self, sample_interval: float = 1.0, max_samples: int = 3600) -> None:
+        self._lock = threading.Lock()
+        self.counters = {}
+        self.latencies = {}
+        self.traversals = {}
+        self.length = 0
+        self.length_samples = deque(maxlen=max_samples)
+        self._sample_interval = sample_interval
+        self._last_sample = float("-inf")
+
+    def observe(self, operation: str, seconds: float, traversed: int, length: int) -> None:
+        """Records one completed operation.
+
+        Args:
+            operation: The PlayerList method name.
+            seconds: How long it took.
+            traversed: How many nodes it walked.
+            length: The list length afterwards.
+        """
+        with self._lock:
+            self.counters[operation] = self.counters.get(operation, 0) + 1
+            if operation not in self.latencies:
+                self.latencies[operation] = Histogram(LATENCY_BUCKETS)
+                self.traversals[operation] = Histogram(TRAVERSAL_BUCKETS)
+            self.latencies[operation].observe(seconds)
+            self.traversals[operation].observe(traversed)
+            self.length = length
+            now = time.time()
+            if now - self._last_sample >= self._sample_interval:
+                self.length_samples.append((now, length))
+                self._last_sample = now
+
+    def snapshot(self) -> dict:
+        """Gets every metric as plain data, e.g. for logging as JSON.
+
+        Returns:
+            dict: Counters, latency and traversal histograms per operation,
+            the current length and the length samples.
+        """
+        with self._lock:
+            return {
+                "counters": dict(self.counters),
+                "latency_seconds": {op: h.snapshot() for op, h in self.latencies.items()},
+                "traversed_nodes": {op: h.snapshot() for op, h in self.traversals.items()},
+                "length": self.length,
+                "length_samples": list(self.length_samples),
+            }
+
+    def to_prometheus(self, prefix: str = "player_list") -> str:
+        """Renders the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: The metric name prefix.
+
+        Returns:
+            str: The exposition text.
+        """
+        snapshot = self.snapshot()
+        lines = [f"# TYPE {prefix}_operations_total counter"]
+        for operation, count in sorted(snapshot["counters"].items()):
+            lines.append(f'{prefix}_operations_total{{operation="{operation}"}} {count}')
+        for name, histograms in (("latency_seconds", snapshot["latency_seconds"]),
+                                 ("traversed_nodes", snapshot["traversed_nodes"])):
+            lines.append(f"# TYPE {prefix}_{name} histogram")
+            for operation, histogram in sorted(histograms.items()):
+                for bound, count in histogram["buckets"].items():
+                    lines.append(f'{prefix}_{name}_bucket{{operation="{operation}",le="{bound}"}} {count}')
+                lines.append(f'{prefix}_{name}_sum{{operation="{operation}"}} {histogram["sum"]}')
+                lines.append(f'{prefix}_{name}_count{{operation="{operation}"}} {histogram["count"]}')
+        lines.append(f"# TYPE {prefix}_length gauge")
+        lines.append(f"{prefix}_length {snapshot['length']}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str, prefix: str = "player_list") -> None:
+        """Atomically writes the exposition text to a file, e.g. for a textfile collector.
+
+        Args:
+            path: The file to write.
+            prefix: The metric name prefix.
+        """
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            file.write(self.to_prometheus(prefix))
+        os.replace(temporary, path)
+
+    def serve_prometheus(self, host: str = "127.0.0.1", port: int = 0,
+                         prefix: str = "player_list") -> ThreadingHTTPServer:
+        """Serves the exposition text over HTTP from a daemon thread.
+
+        Args:
+            host: The interface to bind, localhost by default.
+            port: The port to bind; 0 picks a free one (see server.server_port).
+            prefix: The metric name prefix.
+
+        Returns:
+            ThreadingHTTPServer: The running server; call shutdown() to stop it.
+        """
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = metrics.to_prometheus(prefix).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+def _traversed(operation: str, args: tuple, kwargs: dict, length_before: int) -> int:
+    """Works out how many nodes an operation walked.
+
+    Keyed operations go through the uid index and walk nothing, a positional
+    insert walks to the node before the position and display walks the list.
+
+    Args:
+        operation: The PlayerList method name.
+        args: The positional arguments it was called with.
+        kwargs: The keyword arguments it was called with.
+        length_before: The list length before the call.
+
+    Returns:
+        int: The number of nodes visited.
+    """
+    if operation == "insert_at_position":
+        position = kwargs.get("position", args[1] if len(args) > 1 else 0)
+        return 0 if position in (0, length_before) else position - 1
+    if operation == "display":
+        return length_before
+    return 0
+
+
+def _timed(cls: type, operation: str):
+    """Wraps a list method so each outermost call is recorded.
+
+    Args:
+        cls: The list class providing the method.
+        operation: The method name.
+
+    Returns:
+        function: The recording wrapper.
+    """
+    method = getattr(cls, operation)
+
+    def wrapper(self, *args, **kwargs):
+        # Only the outermost call is recorded, e.g. delete_node_with_key but
+        # not the delete_head it calls internally.
+        if self._metrics_busy or self._metrics is None:
+            return method(self, *args, **kwargs)
+        self._metrics_busy = True
+        length_before = self._length
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            self._metrics_busy = False
+            self._metrics.observe(operation, elapsed,
+                                  _traversed(operation, args, kwargs, length_before),
+                                  self._length)
+
+    wrapper.__name__ = operation
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+_instrumented_classes = {}
+
+
+def _instrumented_class(cls: type) -> type:
+    """Builds, once per list class, a subclass whose operations are recorded.
+
+    Args:
+        cls: The list class to instrument.
+
+    Returns:
+        type: The instrumented subclass.
+    """
+    if cls not in _instrumented_classes:
+        namespace = {op: _timed(cls, op) for op in INSTRUMENTED_OPERATIONS}
+        namespace["_instrumented_base"] = cls
+        # Lists the subclass builds itself (split_at(), from_iterable()) start
+        # unrecorded until they are passed to instrument().
+        namespace["_metrics"] = None
+        namespace["_metrics_busy"] = False
+        _instrumented_classes[cls] = type(f"Instrumented{cls.__name__}", (cls,), namespace)
+    return _instrumented_classes[cls]
+
+
+def instrument(player_list: PlayerList, metrics: PlayerListMetrics | None = None) -> PlayerListMetrics:
+    """Starts recording metrics for a list.
+
+    The list's class is swapped for an instrumented subclass, so lists that
+    are never instrumented pay nothing at all.
+
+    Args:
+        player_list: The list (a PlayerList or subclass) to instrument.
+        metrics: Where to record; a new PlayerListMetrics by default.
+
+    Returns:
+        PlayerListMetrics: The metrics being recorded.
+    """
+    if metrics is None:
+        metrics = PlayerListMetrics()
+    player_list._metrics = metrics
+    player_list._metrics_busy = False
+    if not hasattr(type(player_list), "_instrumented_base"):
+        player_list.__class__ = _instrumented_class(type(player_list))
+    metrics.length = player_list.length
+    return metrics
+
+
+def uninstrument(player_list: PlayerList) -> None:
+    """Stops recording metrics for a list and restores its original class.
+
+    Args:
+        player_list: A list previously passed to instrument().
+    """
+    base = getattr(type(player_list), "_instrumented_base", None)
+    if base is not None:
+        player_list.__class__ = base
+        player_list.__dict__.pop("_metrics", None)
+        player_list.__dict__.pop("_metrics_busy", None)
@@ -0,0 +1,350 @@
+from __future__ import annotations
+import weakref
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+from player import PlayerName
+from player_list import PlayerList
+from player_node import PlayerNode
+
+# How many nodes a view reads per lock acquisition when the list is shared
+# between threads, bounding how long a reader can hold up the writers.
+_CHUNK_SIZE = 1000
+
+_new_node = PlayerNode.__new__
+
+
+class _History:
+    """The past links and names of a list, for the views taken of it.
+
+    Each snapshot starts a new generation, numbered in order. Nothing is
+    copied then. Instead the list calls preserve() before each write, and
+    the first time a node is relinked after a generation starts, the links
+    it had are saved under that generation's number. Renames are heard
+    through PlayerName and saved the same way. A generation finds the state
+    it saw in the first entry numbered at or after it, or else in the live
+    node, so every write costs O(1) however many views are pending.
+
+    Entries that no live generation can reach are dropped from time to time,
+    so the history stays proportional to the writes the pending views span.
+    """
+    __slots__ = ("version", "written", "links", "names", "saved", "compact_at",
+                 "generations", "newest", "__weakref__")
+
+    def __init__(self) -> None:
+        self.version = 0
+        # Whether the list changed since the newest generation started.
+        self.written = True
+        # node -> [(version, prev, next)] and player -> [(version, name)].
+        self.links = {}
+        self.names = {}
+        self.saved = 0
+        self.compact_at = 1024
+        self.generations = weakref.WeakSet()
+        self.newest = None
+        PlayerName.add_listener(self)
+
+    def generation(self, player_list: PlayerList) -> _Generation:
+        """Gets a generation for the list's current state, sharing the newest if unchanged.
+
+        Args:
+            player_list: The list the history belongs to.
+
+        Returns:
+            _Generation: The generation.
+        """
+        newest = None if self.newest is None else self.newest()
+        if newest is not None and not self.written:
+            return newest
+        self.version += 1
+        self.written = False
+        newest = _Generation(self, player_list)
+        self.generations.add(newest)
+        self.newest = weakref.ref(newest)
+        return newest
+
+    def preserve(self, nodes: tuple) -> None:
+        """Saves the links of nodes about to be relinked; called by the list.
+
+        Args:
+            nodes: The nodes whose next or prev is about to change; None
+                entries are skipped.
+        """
+        self.written = True
+        version, links = self.version, self.links
+        for node in nodes:
+            if node is None:
+                continue
+            entries = links.get(node)
+            if entries is None:
+                links[node] = [(version, node._prev, node._next)]
+            elif entries[-1][0] != version:
+                entries.append((version, node._prev, node._next))
+            else:
+                continue
+            self.saved += 1
+        if self.saved > self.compact_at:
+            self._compact()
+
+    def on_rename(self, player, old_name: str) -> None:
+        """Saves a player's name from before a rename; called by PlayerName.
+
+        Args:
+            player: The renamed player.
+            old_name: The name it had before.
+        """
+        self.written = True
+        entries = self.names.get(player)
+        if entries is None:
+            self.names[player] = [(self.version, old_name)]
+        elif entries[-1][0] != self.version:
+            entries.append((self.version, old_name))
+        else:
+            return
+        self.saved += 1
+        if self.saved > self.compact_at:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Drops the entries no live generation reads."""
+        live = sorted(generation.version for generation in self.generations)
+        self.saved = 0
+        for saved in (self.links, self.names):
+            for key, entries in list(saved.items()):
+                # An entry is read by the generations numbered after the
+                # entry before it, up to its own number.
+                kept = []
+                after = 0
+                for entry in entries:
+                    position = bisect_right(live, after)
+                    if position < len(live) and live[position] <= entry[0]:
+                        kept.append(entry)
+                    after = entry[0]
+                if kept:
+                    saved[key] = kept
+                    self.saved += len(kept)
+                else:
+                    del saved[key]
+        self.compact_at = max(1024, 2 * self.saved)
+
+
+class _Generation:
+    """The state of a list when one or more views were taken of it."""
+    __slots__ = ("history", "version", "head", "tail", "length", "__weakref__")
+
+    def __init__(self, history: _History, player_list: PlayerList) -> None:
+        """Records the ends and length of a list.
+
+        Args:
+            history: The history the list saves its past state in.
+            player_list: The list being viewed.
+        """
+        self.history = history
+        self.version = history.version
+        self.head = player_list._head
+        self.tail = player_list._tail
+        self.length = player_list._length
+
+
+class PlayerListView:
+    """An immutable view of a PlayerList as it was when the view was taken.
+
+    Taking a view is O(1), and so is every later write to the list: instead
+    of copying the list, the list saves the old links of each node it
+    relinks and the old name of each renamed player (see _History), and
+    the view reads those in place of the live values. Views taken between
+    the same two writes share this state. Later writes and renames never
+    show through.
+
+    The view hands out detached copies: each node it yields holds a new
+    Player with the key and name the view promises, and no next or prev.
+    A view of a list shared between threads reads the list in chunks,
+    holding the writers' lock for one chunk at a time. Call release() (or
+    use a with block) once a reader is done, so the list stops saving state
+    for it.
+    """
+    def __init__(self, generation: _Generation, lock=None) -> None:
+        """Initializes a view; use PlayerList.snapshot() rather than calling this.
+
+        Args:
+            generation: The state of the list being viewed.
+            lock: The lock guarding the list's writers, if it is shared
+                between threads; taken while the view reads the list.
+        """
+        self._generation = generation
+        self._lock = lock
+        self._length = generation.length
+        self._index = None
+
+    @property
+    def is_empty(self) -> bool:
+        """Checks if the view contains no nodes.
+
+        Returns:
+            bool: True if the view is empty, False otherwise.
+        """
+        return self._length == 0
+
+    @property
+    def length(self) -> int:
+        """Gets the number of nodes in the view.
+
+        Returns:
+            int: The length of the list when the view was taken.
+        """
+        return self._length
+
+    @property
+    def head(self) -> PlayerNode | None:
+        """Gets a copy of the first node in the view.
+
+        Returns:
+            PlayerNode or None: The head node, or None if the view is empty.
+        """
+        return next(self._walk(forward=True, limit=1), None)
+
+    @property
+    def tail(self) -> PlayerNode | None:
+        """Gets a copy of the last node in the view.
+
+        Returns:
+            PlayerNode or None: The tail node, or None if the view is empty.
+        """
+        return next(self._walk(forward=False, limit=1), None)
+
+    def find_node_with_key(self, key: str) -> PlayerNode | None:
+        """Finds the node with the specified key, building the index on first use.
+
+        Args:
+            key: The key to search for.
+
+        Returns:
+            PlayerNode or None: The node with the specified key, or None if not found.
+        """
+        if self._index is None:
+            self._index = {node.key: node for node in self._walk(forward=True)}
+        return self._index.get(key)
+
+    def release(self) -> None:
+        """Drops the view's state. The view must not be used afterwards."""
+        self._generation = None
+        self._index = None
+
+    # Rendering and queries only depend on iteration and keyed lookups, so
+    # share PlayerList's implementation.
+    display = PlayerList.display
+    render = PlayerList.render
+    query = PlayerList.query
+
+    def _walk(self, forward: bool, limit: int | None = None):
+        """Reads the list as it was, a chunk of nodes at a time.
+
+        Args:
+            forward: If True, walks from head to tail; otherwise tail to head.
+            limit: The most nodes to read, or None for all of them.
+
+        Yields:
+            PlayerNode: A detached copy of each node.
+
+        Raises:
+            ValueError: If the view has been released.
+        """
+        generation = self._generation
+        if generation is None:
+            raise ValueError("The view has been released")
+        history, version = generation.history, generation.version
+        links, names = history.links, history.names
+        side = 2 if forward else 1
+        node = generation.head if forward else generation.tail
+        remaining = self._length if limit is None else min(limit, self._length)
+        step = "_next" if forward else "_prev"
+        while remaining:
+            # Only read under the lock; the copies are made after releasing it.
+            chunk = []
+            if self._lock is not None:
+                self._lock.acquire()
+            try:
+                renamed = bool(names)
+                relinked = bool(links)
+                for _ in range(min(remaining, _CHUNK_SIZE)):
+                    player = node._player
+                    name = player._name
+                    if renamed:
+                        entries = names.get(player)
+                        if entries is not None and entries[-1][0] >= version:
+                            name = _as_of(entries, version)[1]
+                    chunk.append((type(player), node._key, name))
+                    if relinked:
+                        entries = links.get(node)
+                        if entries is not None and entries[-1][0] >= version:
+                            node = _as_of(entries, version)[side]
+                            continue
+                    node = getattr(node, step)
+            finally:
+                if self._lock is not None:
+                    self._lock.release()
+            remaining -= len(chunk)
+            for player_class, key, name in chunk:
+                # Fill the slots directly, as PlayerNodePool does: the key is
+                # already known, so skip reading it back through player.uid.
+                copy = _new_node(PlayerNode)
+                copy._player = player_class.from_trusted(key, name)
+                copy._key = key
+                copy._next = copy._prev = None
+                yield copy
+
+    def __enter__(self) -> PlayerListView:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __contains__(self, key: str) -> bool:
+        """Checks whether a node with the given key is in the view.
+
+        Args:
+            key: The key to look for.
+
+        Returns:
+            bool: True if a node with the key is in the view, False otherwise.
+        """
+        return self.find_node_with_key(key) is not None
+
+    def __iter__(self):
+        """Implements forward iteration through the view.
+
+        Yields:
+            PlayerNode: Each node from head to tail.
+        """
+        return self._walk(forward=True)
+
+    def __reversed__(self):
+        """Implements reverse iteration through the view.
+
+        Yields:
+            PlayerNode: Each node from tail to head.
+        """
+        return self._walk(forward=False)
+
+
+def _as_of(entries: list, version: int) -> tuple | None:
+    """Finds the saved entry a generation reads.
+
+    Args:
+        entries: A node's or player's saved entries, in version order.
+        version: The generation's number.
+
+    Returns:
+        tuple or None: The first entry saved at or after the generation, or
+        None if the live value has not changed since.
+    """
+    if entries[-1][0] < version:
+        return None
+    if entries[0][0] >= version:
+        return entries[0]
+    return entries[bisect_left(entries, version, key=_VERSION)]
+
+
+_VERSION = itemgetter(0)
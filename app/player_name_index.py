@@ -0,0 +1,247 @@
+from __future__ import annotations
+from bisect import bisect_left, bisect_right, insort
+from player import Player, PlayerName
+from player_list import PlayerList
+from player_node import PlayerNode
+
+# Substring queries shorter than this scan every name instead of the n-grams.
+GRAM = 3
+# The pairs per sorted chunk after a split; a chunk splits past twice this.
+CHUNK_SIZE = 1000
+
+
+class PlayerNameIndex:
+    """A prefix (and optionally substring) search index over a list's names.
+
+    Names are kept as (name, uid) pairs in sorted chunks of at most
+    2 * CHUNK_SIZE pairs, with the largest pair of each chunk alongside, so a
+    prefix query is two bisects followed by a walk over the matches. Inserts
+    and deletes bisect to their chunk and update it in place with insort, in
+    O(log n + CHUNK_SIZE), so queries never wait for a re-sort however the
+    list churns. With substrings=True a trigram to uids map also answers
+    substring queries.
+
+    The index registers itself as a listener of the list (see
+    PlayerList.add_listener) and of renames (see PlayerName.add_listener),
+    so every insert and delete path and every player.name = ... on a listed
+    player keeps it current.
+    """
+    def __init__(self, player_list: PlayerList, ignore_case: bool = True,
+                 substrings: bool = False) -> None:
+        """Indexes every node in a list and starts following its changes.
+
+        Args:
+            player_list: The list to index.
+            ignore_case: If True, matching is case-insensitive (casefolded).
+            substrings: If True, also build the n-gram index for substring().
+        """
+        self._list = player_list
+        self._fold = str.casefold if ignore_case else str
+        self._names = {node.key: self._fold(node.name) for node in player_list}
+        entries = sorted((name, uid) for uid, name in self._names.items())
+        self._chunks = [entries[i:i + CHUNK_SIZE] for i in range(0, len(entries), CHUNK_SIZE)]
+        self._maxes = [chunk[-1] for chunk in self._chunks]
+        # Bumped by every write, so running prefix() walks know to re-find
+        # their place.
+        self._version = 0
+        self._grams = None
+        if substrings:
+            self._grams = {}
+            for uid, name in self._names.items():
+                for gram in _grams(name):
+                    self._grams.setdefault(gram, set()).add(uid)
+        player_list.add_listener(self)
+        PlayerName.add_listener(self)
+
+    def prefix(self, text: str, limit: int | None = None):
+        """Lazily yields the nodes whose name starts with text, in name order.
+
+        Writes made while the query is being consumed are allowed: the walk
+        carries on after the last pair it yielded.
+
+        Args:
+            text: The prefix to match.
+            limit: The most nodes to yield, or None for all.
+
+        Yields:
+            PlayerNode: Each matching node.
+        """
+        text = self._fold(text)
+        find = self._list.find_node_with_key
+        chunk_at, position = self._locate((text,))
+        version = self._version
+        while limit is None or limit > 0:
+            if version != self._version:
+                # The chunks changed while the caller held the query.
+                chunk_at, position = self._locate(entry, after=True)
+                version = self._version
+            if chunk_at == len(self._chunks):
+                return
+            chunk = self._chunks[chunk_at]
+            if position == len(chunk):
+                chunk_at, position = chunk_at + 1, 0
+                continue
+            entry = chunk[position]
+            if not entry[0].startswith(text):
+                return
+            position += 1
+            node = find(entry[1])
+            if node is not None:
+                yield node
+                if limit is not None:
+                    limit -= 1
+
+    def substring(self, text: str, limit: int | None = None):
+        """Lazily yields the nodes whose name contains text, in no particular order.
+
+        Texts of at least GRAM characters are answered from the n-gram index;
+        shorter ones scan the indexed names.
+
+        Args:
+            text: The text to look for.
+            limit: The most nodes to yield, or None for all.
+
+        Yields:
+            PlayerNode: Each matching node.
+
+        Raises:
+            ValueError: If the index was built without substrings=True.
+        """
+        if self._grams is None:
+            raise ValueError("The index was built without substrings=True")
+        text = self._fold(text)
+        if len(text) < GRAM:
+            candidates = list(self._names)
+        else:
+            sets = sorted((self._grams.get(gram, ()) for gram in _grams(text)), key=len)
+            candidates = set(sets[0]).intersection(*sets[1:])
+        find = self._list.find_node_with_key
+        for uid in candidates:
+            if limit is not None and limit <= 0:
+                return
+            if text in self._names.get(uid, ""):
+                node = find(uid)
+                if node is not None:
+                    yield node
+                    if limit is not None:
+                        limit -= 1
+
+    def close(self) -> None:
+        """Stops following the list. The index must not be used afterwards."""
+        self._list.remove_listener(self)
+        PlayerName.remove_listener(self)
+
+    def on_insert(self, node: PlayerNode) -> None:
+        """Indexes an inserted node; called by the list.
+
+        Args:
+            node: The inserted node.
+        """
+        self._add(node.key, self._fold(node.name))
+
+    def on_delete(self, node: PlayerNode) -> None:
+        """Drops a deleted node from the index; called by the list.
+
+        Args:
+            node: The deleted node.
+        """
+        self._remove(node.key)
+
+    def on_rename(self, player: Player, old_name: str) -> None:
+        """Re-files a renamed player of the list; called by PlayerName.
+
+        Args:
+            player: The renamed player.
+            old_name: The name it had before.
+        """
+        node = self._list.find_node_with_key(player.uid)
+        if node is None or node.player is not player:
+            return
+        name = self._fold(player.name)
+        if self._names.get(node.key) != name:
+            self._remove(node.key)
+            self._add(node.key, name)
+
+    def _add(self, uid, name: str) -> None:
+        """Files a uid under a name.
+
+        Args:
+            uid: The node's key.
+            name: The folded name.
+        """
+        self._names[uid] = name
+        entry = (name, uid)
+        self._version += 1
+        if not self._chunks:
+            self._chunks.append([entry])
+            self._maxes.append(entry)
+        else:
+            chunk_at = min(bisect_left(self._maxes, entry), len(self._chunks) - 1)
+            chunk = self._chunks[chunk_at]
+            insort(chunk, entry)
+            self._maxes[chunk_at] = chunk[-1]
+            if len(chunk) > 2 * CHUNK_SIZE:
+                self._chunks.insert(chunk_at + 1, chunk[CHUNK_SIZE:])
+                del chunk[CHUNK_SIZE:]
+                self._maxes[chunk_at] = chunk[-1]
+                self._maxes.insert(chunk_at + 1, self._chunks[chunk_at + 1][-1])
+        if self._grams is not None:
+            for gram in _grams(name):
+                self._grams.setdefault(gram, set()).add(uid)
+
+    def _remove(self, uid) -> None:
+        """Unfiles a uid, if it is indexed.
+
+        Args:
+            uid: The node's key.
+        """
+        name = self._names.pop(uid, None)
+        if name is None:
+            return
+        entry = (name, uid)
+        self._version += 1
+        chunk_at = bisect_left(self._maxes, entry)
+        chunk = self._chunks[chunk_at]
+        del chunk[bisect_left(chunk, entry)]
+        if chunk:
+            self._maxes[chunk_at] = chunk[-1]
+        else:
+            del self._chunks[chunk_at]
+            del self._maxes[chunk_at]
+        if self._grams is not None:
+            for gram in _grams(name):
+                uids = self._grams[gram]
+                uids.discard(uid)
+                if not uids:
+                    del self._grams[gram]
+
+    def _locate(self, entry: tuple, after: bool = False) -> tuple:
+        """Finds where an entry is, or would be, filed.
+
+        Args:
+            entry: The (name, uid) pair, or a (name,) prefix of one.
+            after: If True, find the place just past an equal entry.
+
+        Returns:
+            tuple: The chunk number and the position within the chunk.
+        """
+        find = bisect_right if after else bisect_left
+        chunk_at = find(self._maxes, entry)
+        if chunk_at == len(self._chunks):
+            return chunk_at, 0
+        return chunk_at, find(self._chunks[chunk_at], entry)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+def _grams(text: str) -> set:
+    """Gets the distinct n-grams of a text.
+
+    Args:
+        text: The text to split.
+
+    Returns:
+        set: Every substring of GRAM characters.
+    """
+    return {text[i:i + GRAM] for i in range(len(text) - GRAM + 1)}
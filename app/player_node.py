@@ -10,9 +10,14 @@ class PlayerNode:
         next_node: Reference to the next PlayerNode, if any.
         prev_node: Reference to the previous PlayerNode, if any.
     """
+    # Slots instead of a __dict__: a node is four references and nothing more.
+    __slots__ = ("_player", "_key", "_next", "_prev")
 
     def __init__(self, player: Player, next_node: PlayerNode | None = None, prev_node: PlayerNode | None = None):
         self._player = player
+        # Lists file the node under this key, so it must not follow later
+        # changes to player.uid.
+        self._key = player.uid
         self._next = next_node
         self._prev = prev_node
 
@@ -68,10 +73,14 @@ class PlayerNode:
     def key(self):
         """Gets the unique identifier of the player in this node.
 
+        The key is the player's uid when the node was created. Lists index
+        the node under it, so reassigning player.uid afterwards leaves the
+        node where it is, still found and deleted by its original key.
+
         Returns:
-            The player's uid.
+            The player's uid at creation.
         """
-        return self._player.uid
+        return self._key
 
     @property
     def name(self):
@@ -0,0 +1,110 @@
+from __future__ import annotations
+from player import Player
+from player_node import PlayerNode
+
+
+class PlayerNodePool:
+    """A bounded free list of PlayerNodes, to reuse nodes instead of allocating them.
+
+    acquire() hands out a recycled node when one is free and a new one
+    otherwise; release() takes back an unlinked node, clearing its links and
+    player so it pins nothing, and drops it for the garbage collector when
+    the pool is already full. A list given the pool with
+    PlayerList.use_pool() releases every node it deletes.
+
+    A released node is reused by a later acquire(), so nothing may keep a
+    reference to it: not the caller, and not anything that outlives the
+    delete, such as a snapshot view, a journal compacting in the background,
+    a changelog or an index. A pooled list therefore refuses snapshot() and
+    add_listener(), and use_pool() refuses a list that has either. The pool
+    is not thread-safe.
+    """
+    def __init__(self, capacity: int = 4096) -> None:
+        """Initializes an empty pool.
+
+        Args:
+            capacity: The most free nodes kept.
+
+        Raises:
+            ValueError: If capacity is negative.
+        """
+        if capacity < 0:
+            raise ValueError("capacity must not be negative")
+        self._capacity = capacity
+        self._free = []
+        self.hits = 0
+        self.misses = 0
+        self.released = 0
+        self.discarded = 0
+
+    @property
+    def capacity(self) -> int:
+        """Gets the most free nodes kept.
+
+        Returns:
+            int: The capacity.
+        """
+        return self._capacity
+
+    def acquire(self, player: Player) -> PlayerNode:
+        """Gets an unlinked node holding a player, recycled if one is free.
+
+        Args:
+            player: The player the node holds.
+
+        Returns:
+            PlayerNode: The node, with no next or prev.
+        """
+        if self._free:
+            self.hits += 1
+            node = self._free.pop()
+            node._player = player
+            node._key = player.uid
+            return node
+        self.misses += 1
+        return PlayerNode(player)
+
+    def release(self, node: PlayerNode) -> bool:
+        """Takes back a node that is no longer in any list.
+
+        Args:
+            node: The unlinked node.
+
+        Returns:
+            bool: True if the pool kept the node, False if it was full or
+            the node had already been released.
+        """
+        if node._player is None:
+            return False
+        node._player = None
+        node._next = node._prev = None
+        if len(self._free) >= self._capacity:
+            self.discarded += 1
+            return False
+        self._free.append(node)
+        self.released += 1
+        return True
+
+    def clear(self) -> None:
+        """Drops every free node."""
+        self._free.clear()
+
+    def stats(self) -> dict:
+        """Gets the pool statistics.
+
+        Returns:
+            dict: Hits, misses, hit_rate, released, discarded, size and capacity.
+        """
+        acquires = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / acquires if acquires else 0.0,
+            "released": self.released,
+            "discarded": self.discarded,
+            "size": len(self._free),
+            "capacity": self._capacity,
+        }
+
+    def __len__(self) -> int:
+        return len(self._free)
@@ -0,0 +1,207 @@
+from __future__ import annotations
+from itertools import islice
+from typing import Any, Callable, Iterable
+
+
+class PlayerQuery:
+    """A lazy, composable query over a list of PlayerNodes.
+
+    Each call returns a new query; nothing runs until the query is iterated,
+    and then nodes stream through the where/select steps one at a time, so
+    the roster is never copied and iteration stops as soon as limit() is met.
+
+    Keyword predicates to where() (uid, uids, uid_range, name_prefix) can be
+    answered by an index instead of a scan: uids through the list's uid
+    index, uid_range through a SortedPlayerList ordered by uid, and
+    name_prefix through a PlayerNameIndex attached to the list. An index
+    only proposes candidates: every where() step, the answered one included,
+    is still checked against each candidate, so an index that has fallen
+    behind (e.g. missed a rename) cannot leak wrong rows.
+
+    An indexed query yields matches in the index's order (uids in the order
+    given, a uid range ascending, a name prefix in name order) rather than
+    list order, so limit() pages hold different rows than a scan would;
+    explain() tells which plan a query will use.
+    """
+    def __init__(self, source, steps: tuple = (), limit: int | None = None,
+                 reverse: bool = False) -> None:
+        """Creates a query; use PlayerList.query() rather than calling this.
+
+        Args:
+            source: The list to query.
+            steps: ("where", predicate, hint) and ("select", function, None) steps.
+            limit: The most results to yield, or None for all.
+            reverse: Whether to walk the list from tail to head.
+        """
+        self._source = source
+        self._steps = steps
+        self._limit = limit
+        self._reverse = reverse
+
+    def where(self, predicate: Callable[[Any], bool] | None = None, *, uid: str | None = None,
+              uids: Iterable[str] | None = None, uid_range: tuple | None = None,
+              name_prefix: str | None = None) -> PlayerQuery:
+        """Keeps only the items matching every given condition.
+
+        Args:
+            predicate: A function of the current item (a node, unless select()
+                came earlier) that returns True to keep it.
+            uid: Keep the node with this uid.
+            uids: Keep the nodes with these uids.
+            uid_range: Keep nodes whose uid, as a number, lies in (lo, hi),
+                inclusive; a None bound leaves that side open.
+            name_prefix: Keep nodes whose name starts with this, ignoring case.
+
+        Returns:
+            PlayerQuery: The narrowed query.
+
+        Raises:
+            ValueError: If a keyword condition follows a select().
+        """
+        steps = list(self._steps)
+        keywords = {"uid": uid, "uids": uids, "uid_range": uid_range, "name_prefix": name_prefix}
+        keywords = {name: value for name, value in keywords.items() if value is not None}
+        if keywords and any(step[0] == "select" for step in steps):
+            raise ValueError("uid and name conditions must come before select()")
+        for name, value in keywords.items():
+            if name == "uids":
+                value = tuple(dict.fromkeys(value))
+            steps.append(("where", _keyword_predicate(name, value), (name, value)))
+        if predicate is not None:
+            steps.append(("where", predicate, None))
+        return PlayerQuery(self._source, tuple(steps), self._limit, self._reverse)
+
+    def select(self, function: Callable[[Any], Any]) -> PlayerQuery:
+        """Transforms each item, e.g. select(lambda node: node.name).
+
+        Args:
+            function: The function applied to each item.
+
+        Returns:
+            PlayerQuery: The transformed query.
+        """
+        return PlayerQuery(self._source, self._steps + (("select", function, None),),
+                           self._limit, self._reverse)
+
+    def limit(self, count: int) -> PlayerQuery:
+        """Caps the number of results; iteration stops once it is reached.
+
+        The first count results are taken in the plan's order: list order
+        for a scan, the index's order for an indexed plan (see explain()).
+
+        Args:
+            count: The most results to yield.
+
+        Returns:
+            PlayerQuery: The capped query.
+        """
+        count = count if self._limit is None else min(count, self._limit)
+        return PlayerQuery(self._source, self._steps, count, self._reverse)
+
+    def reverse(self) -> PlayerQuery:
+        """Walks the list from tail to head instead.
+
+        Returns:
+            PlayerQuery: The reversed query.
+        """
+        return PlayerQuery(self._source, self._steps, self._limit, not self._reverse)
+
+    def first(self):
+        """Runs the query for its first result only.
+
+        Returns:
+            The first result, or None if there is none.
+        """
+        return next(iter(self.limit(1)), None)
+
+    def explain(self) -> str:
+        """Describes how the query will find its nodes.
+
+        Returns:
+            str: "scan" or the index used, e.g. "uid index".
+        """
+        return self._plan()[0]
+
+    def _plan(self):
+        """Picks an index for the first answerable keyword condition, if any.
+
+        Returns:
+            tuple: The plan's name and the candidate nodes it yields.
+        """
+        source = self._source
+        for kind, _, hint in self._steps:
+            if kind == "select":
+                break
+            if hint is None:
+                continue
+            name, value = hint
+            if name in ("uid", "uids"):
+                keys = (value,) if name == "uid" else value
+                keys = reversed(keys) if self._reverse else keys
+                found = (source.find_node_with_key(key) for key in keys)
+                return "uid index", (node for node in found if node is not None)
+            if name == "uid_range" and not self._reverse and _sorted_by_uid(source):
+                return "sorted uid index", source.range(*value)
+            if name == "name_prefix" and not self._reverse:
+                index = _name_index(source)
+                if index is not None:
+                    return "name index", index.prefix(value)
+        return "scan", reversed(source) if self._reverse else iter(source)
+
+    def __iter__(self):
+        """Runs the query.
+
+        Yields:
+            Each result, lazily.
+        """
+        _, stream = self._plan()
+        for kind, function, _ in self._steps:
+            stream = filter(function, stream) if kind == "where" else map(function, stream)
+        if self._limit is not None:
+            stream = islice(stream, self._limit)
+        return iter(stream)
+
+
+def _keyword_predicate(name: str, value) -> Callable:
+    """Builds the scan-time test for a keyword condition.
+
+    Args:
+        name: "uid", "uids", "uid_range" or "name_prefix".
+        value: The condition's value.
+
+    Returns:
+        function: A predicate over nodes.
+    """
+    if name == "uid":
+        return lambda node: node.key == value
+    if name == "uids":
+        wanted = frozenset(value)
+        return lambda node: node.key in wanted
+    if name == "uid_range":
+        lo, hi = (None if bound is None else int(bound) for bound in value)
+        if lo is None and hi is None:
+            return lambda node: True
+        if lo is None:
+            return lambda node: int(node.key) <= hi
+        if hi is None:
+            return lambda node: lo <= int(node.key)
+        return lambda node: lo <= int(node.key) <= hi
+    prefix = value.casefold()
+    return lambda node: node.name.casefold().startswith(prefix)
+
+
+def _sorted_by_uid(source) -> bool:
+    """Checks whether a list can answer uid ranges from its ordering."""
+    from sorted_player_list import SortedPlayerList, _uid_order
+
+    return isinstance(source, SortedPlayerList) and source._sort_key is _uid_order
+
+
+def _name_index(source):
+    """Finds a case-insensitive PlayerNameIndex following a list, if any."""
+    from player_name_index import PlayerNameIndex
+
+    for listener in getattr(source, "_listeners", None) or ():
+        if isinstance(listener, PlayerNameIndex) and listener._fold is str.casefold:
+            return listener
+    return None
@@ -0,0 +1,250 @@
+from __future__ import annotations
+import os
+import struct
+from collections import deque
+from player import Player, PlayerName
+from player_journal import apply_record, encode_delete, encode_insert, encode_rename, iter_records
+from player_list import PlayerList
+from player_node import PlayerNode
+
+# A replica asks for changes with one message: the changelog epoch and the
+# version it holds. The primary answers with one message: a reply header
+# (kind, epoch, version) followed by journal records (see player_journal),
+# either the changes since the replica's version or the whole list as inserts.
+_REQUEST = struct.Struct("<QQ")
+_REPLY = struct.Struct("<BQQ")
+_DELTA = 1
+_FULL = 2
+# The version a replica that holds nothing asks for.
+_NOTHING = 2 ** 64 - 1
+
+
+class PlayerChangelog:
+    """Numbers every change to a PlayerList so replicas can catch up by delta.
+
+    The changelog listens to the list (see PlayerList.add_listener) and to
+    player renames (see PlayerName.add_listener), encoding each change as a
+    journal record: inserts as "after this neighbour", deletes by uid and
+    renames by uid and new name. Each change bumps version by one and the
+    last capacity records are kept, so a replica at version V receives just
+    the records since V; one that is further behind, or that last synced
+    with another changelog (epoch), receives the whole list instead.
+
+    The list holds the changelog as a listener for as long as the list
+    lives, while PlayerName holds it only weakly, so a dropped list does not
+    leave its changelog behind. Call close() (or use a with block) to stop
+    recording while the list is still in use, since every write and rename
+    pays for the open changelog until then.
+
+    The changelog is not thread-safe: serve replicas from the thread that
+    writes the list, or guard both with one lock.
+    """
+    def __init__(self, player_list: PlayerList, capacity: int = 1_000_000) -> None:
+        """Starts recording a list's changes.
+
+        Args:
+            player_list: The list to follow.
+            capacity: The most recent changes kept for delta replies.
+
+        Raises:
+            ValueError: If capacity is negative.
+        """
+        if capacity < 0:
+            raise ValueError("capacity must not be negative")
+        self._list = player_list
+        self._records = deque(maxlen=capacity)
+        self._version = 0
+        self.epoch = int.from_bytes(os.urandom(8), "little") or 1
+        player_list.add_listener(self)
+        PlayerName.add_listener(self)
+
+    @property
+    def version(self) -> int:
+        """Gets the number of changes recorded so far.
+
+        Returns:
+            int: The current version.
+        """
+        return self._version
+
+    def delta_since(self, version: int) -> bytes | None:
+        """Gets the records that bring a replica at version up to date.
+
+        Args:
+            version: The version the replica holds.
+
+        Returns:
+            bytes or None: The records, or None if they are no longer kept.
+        """
+        behind = self._version - version
+        if behind < 0 or behind > len(self._records):
+            return None
+        if behind == 0:
+            return b""
+        start = len(self._records) - behind
+        return b"".join(self._records[position] for position in range(start, len(self._records)))
+
+    def full(self) -> bytes:
+        """Encodes the whole list as inserts, from head to tail.
+
+        Returns:
+            bytes: The records.
+        """
+        return b"".join(encode_insert(node) for node in self._list)
+
+    def handle(self, connection) -> bool:
+        """Answers one request from a replica.
+
+        Args:
+            connection: A multiprocessing Connection, from Pipe() or a
+                multiprocessing.connection Listener for sockets.
+
+        Returns:
+            bool: True if a request was answered, False if the replica hung up.
+        """
+        try:
+            epoch, version = _REQUEST.unpack(connection.recv_bytes())
+        except EOFError:
+            return False
+        delta = self.delta_since(version) if epoch == self.epoch else None
+        if delta is None:
+            connection.send_bytes(_REPLY.pack(_FULL, self.epoch, self._version) + self.full())
+        else:
+            connection.send_bytes(_REPLY.pack(_DELTA, self.epoch, self._version) + delta)
+        return True
+
+    def serve(self, connection) -> None:
+        """Answers requests until the replica hangs up.
+
+        Args:
+            connection: A multiprocessing Connection to the replica.
+        """
+        while self.handle(connection):
+            pass
+
+    def close(self) -> None:
+        """Stops recording. The changelog must not be used afterwards."""
+        self._list.remove_listener(self)
+        PlayerName.remove_listener(self)
+
+    def on_insert(self, node: PlayerNode) -> None:
+        """Records an insert; called by the list.
+
+        Args:
+            node: The inserted node.
+        """
+        self._record(encode_insert(node))
+
+    def on_delete(self, node: PlayerNode) -> None:
+        """Records a delete; called by the list.
+
+        Args:
+            node: The deleted node.
+        """
+        self._record(encode_delete(node))
+
+    def on_rename(self, player: Player, old_name: str) -> None:
+        """Records a rename of a player in the list; called by PlayerName.
+
+        Args:
+            player: The renamed player.
+            old_name: The name it had before.
+        """
+        node = self._list.find_node_with_key(player.uid)
+        if node is not None and node.player is player:
+            self._record(encode_rename(node))
+
+    def _record(self, record: bytes) -> None:
+        """Keeps a change and bumps the version.
+
+        Args:
+            record: The encoded change.
+        """
+        self._records.append(record)
+        self._version += 1
+
+    def __enter__(self) -> PlayerChangelog:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class PlayerReplica:
+    """A read replica of a PlayerList, kept current by a PlayerChangelog.
+
+    Each sync() asks the primary for the changes since the replica's version
+    and applies them to player_list in place, so listeners and indexes on
+    the replica's list see every change. When the primary answers with the
+    whole list instead, the list is emptied and reloaded.
+    """
+    def __init__(self, connection, player_list: PlayerList | None = None) -> None:
+        """Initializes an empty replica; the first sync() loads the whole list.
+
+        Args:
+            connection: A multiprocessing Connection to the primary's changelog.
+            player_list: The list to mirror into, or None for a new PlayerList.
+        """
+        self._connection = connection
+        self.player_list = PlayerList() if player_list is None else player_list
+        self._epoch = 0
+        self._version = _NOTHING
+        self.bytes_received = 0
+        self.deltas = 0
+        self.full_resyncs = 0
+
+    @property
+    def version(self) -> int | None:
+        """Gets the primary's version the replica holds.
+
+        Returns:
+            int or None: The version, or None before the first sync().
+        """
+        return None if self._version == _NOTHING else self._version
+
+    def sync(self) -> str:
+        """Brings the replica up to date with the primary.
+
+        Returns:
+            str: "delta" or "full", the kind of update applied.
+
+        Raises:
+            ValueError: If a record does not fit the list, e.g. it was
+                changed other than through sync().
+        """
+        self._connection.send_bytes(_REQUEST.pack(self._epoch, self._version))
+        message = self._connection.recv_bytes()
+        self.bytes_received += len(message)
+        kind, epoch, version = _REPLY.unpack_from(message)
+        if kind == _FULL:
+            self._reload(message)
+            self.full_resyncs += 1
+        else:
+            for op, uid, prev, name, _ in iter_records(message, _REPLY.size):
+                apply_record(self.player_list, op, uid, prev, name)
+            self.deltas += 1
+        self._epoch, self._version = epoch, version
+        return "full" if kind == _FULL else "delta"
+
+    def close(self) -> None:
+        """Hangs up on the primary."""
+        self._connection.close()
+
+    def _reload(self, message: bytes) -> None:
+        """Replaces the list's contents with a full reply's inserts.
+
+        Args:
+            message: The reply, header included.
+        """
+        player_list = self.player_list
+        player_list.delete_many([node.key for node in player_list])
+        player_list.extend(
+            PlayerNode(Player.from_trusted(str(uid), name))
+            for _, uid, _, name, _ in iter_records(message, _REPLY.size)
+        )
+
+    def __enter__(self) -> PlayerReplica:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
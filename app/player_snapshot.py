@@ -0,0 +1,320 @@
+from __future__ import annotations
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Iterable
+from player import Player
+from player_list import PlayerList
+from player_node import PlayerNode
+
+# File layout, all integers little-endian:
+#   header   magic, format version, reserved, player count
+#   uids     count x uint64, in list order
+#   offsets  (count + 1) x uint64, name i is blob[offsets[i]:offsets[i + 1]]
+#   by uid   count x uint64, the rows in ascending uid order (version 2 on)
+#   blob     the UTF-8 encoded names, back to back
+_MAGIC = b"PLST"
+_VERSION = 2
+# Version 1 files lack the by-uid section; they are still read, with an
+# in-memory index built on the first keyed lookup.
+_READABLE_VERSIONS = (1, 2)
+_HEADER = struct.Struct("<4sHHQ")
+
+
+def save_snapshot(nodes: Iterable[PlayerNode], path: str) -> int:
+    """Writes PlayerNodes to a binary snapshot file, preserving their order.
+
+    Args:
+        nodes: The nodes to save, in list order.
+        path: The file to write.
+
+    Returns:
+        int: The number of players written.
+
+    Raises:
+        OverflowError: If a uid does not fit in an unsigned 64-bit integer.
+    """
+    return save_rows(((node.key, node.name) for node in nodes), path)
+
+
+def save_rows(rows: Iterable[tuple], path: str) -> int:
+    """Writes (uid, name) rows to a binary snapshot file, preserving their order.
+
+    Unlike save_snapshot(), this needs no nodes, so rows captured from a
+    list can be written later (e.g. from another thread) whatever happens
+    to the list's nodes meanwhile.
+
+    Args:
+        rows: The (uid, name) pairs to save, in list order.
+        path: The file to write.
+
+    Returns:
+        int: The number of players written.
+
+    Raises:
+        OverflowError: If a uid does not fit in an unsigned 64-bit integer.
+    """
+    uids = array("Q")
+    offsets = array("Q", [0])
+    names = []
+    end = 0
+    for uid, name in rows:
+        uids.append(int(uid))
+        encoded = name.encode("utf-8")
+        names.append(encoded)
+        end += len(encoded)
+        offsets.append(end)
+    by_uid = array("Q", sorted(range(len(uids)), key=uids.__getitem__))
+    if sys.byteorder != "little":
+        uids.byteswap()
+        offsets.byteswap()
+        by_uid.byteswap()
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(_MAGIC, _VERSION, 0, len(uids)))
+        file.write(uids.tobytes())
+        file.write(offsets.tobytes())
+        file.write(by_uid.tobytes())
+        file.writelines(names)
+    return len(uids)
+
+
+class MappedPlayerList:
+    """A read-only PlayerList view over a snapshot file.
+
+    The uid column, offset table and name blob are read straight out of the
+    (optionally memory-mapped) file. Players are only materialised when they
+    are iterated or looked up, and nothing is kept of them afterwards, so
+    memory stays proportional to the nodes the caller holds on to; each
+    access to a row builds a new node. Keyed lookups binary-search the
+    file's by-uid section, so opening and looking up never load the whole
+    uid column. Nodes handed out are detached: their next/prev are always
+    None.
+    """
+    def __init__(self, path: str, use_mmap: bool = True) -> None:
+        """Opens a snapshot file.
+
+        Args:
+            path: The file to read.
+            use_mmap: If True, map the file; otherwise read it into memory.
+
+        Raises:
+            ValueError: If the file is not a player snapshot, or is truncated.
+        """
+        with open(path, "rb") as file:
+            if use_mmap and os.fstat(file.fileno()).st_size:
+                self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._buffer = file.read()
+        view = memoryview(self._buffer)
+        magic = version = count = None
+        if len(view) >= _HEADER.size:
+            magic, version, _, count = _HEADER.unpack_from(view)
+        if magic != _MAGIC or version not in _READABLE_VERSIONS:
+            view.release()
+            self.close()
+            raise ValueError(f"{path} is not a version {_VERSION} player snapshot")
+        uids_start = _HEADER.size
+        offsets_start = uids_start + 8 * count
+        by_uid_start = offsets_start + 8 * (count + 1)
+        blob_start = by_uid_start + (8 * count if version >= 2 else 0)
+        if blob_start > len(view) or _last_offset(view, by_uid_start) != len(view) - blob_start:
+            view.release()
+            self.close()
+            raise ValueError(f"{path} is truncated or corrupt")
+        self._view = view
+        self._uids = view[uids_start:offsets_start].cast("Q")
+        self._offsets = view[offsets_start:by_uid_start].cast("Q")
+        self._by_uid = view[by_uid_start:blob_start].cast("Q") if version >= 2 else None
+        self._blob = view[blob_start:]
+        if sys.byteorder != "little":
+            # Columns are stored little-endian; swap once into arrays instead.
+            self._uids = _swapped(self._uids)
+            self._offsets = _swapped(self._offsets)
+            if self._by_uid is not None:
+                self._by_uid = _swapped(self._by_uid)
+        self._length = count
+        self._index = None
+
+    @property
+    def is_empty(self) -> bool:
+        """Checks if the list contains no nodes.
+
+        Returns:
+            bool: True if the list is empty, False otherwise.
+        """
+        return self._length == 0
+
+    @property
+    def length(self) -> int:
+        """Gets the number of nodes in the list.
+
+        Returns:
+            int: The current length of the list.
+        """
+        return self._length
+
+    @property
+    def head(self) -> PlayerNode | None:
+        """Gets the first node in the list.
+
+        Returns:
+            PlayerNode or None: The head node, or None if list is empty.
+        """
+        return self._node_at(0) if self._length else None
+
+    @property
+    def tail(self) -> PlayerNode | None:
+        """Gets the last node in the list.
+
+        Returns:
+            PlayerNode or None: The tail node, or None if list is empty.
+        """
+        return self._node_at(self._length - 1) if self._length else None
+
+    def find_node_with_key(self, key: str) -> PlayerNode | None:
+        """Finds the node with the specified key.
+
+        Args:
+            key: The key to search for.
+
+        Returns:
+            PlayerNode or None: The node with the specified key, or None if not found.
+        """
+        row = self._row_for(key)
+        return None if row is None else self._node_at(row)
+
+    def to_player_list(self) -> PlayerList:
+        """Materialises the whole snapshot as a regular, mutable PlayerList.
+
+        Returns:
+            PlayerList: A new list holding every player in snapshot order.
+        """
+        return PlayerList.from_iterable(
+            PlayerNode(self._player_at(row)) for row in range(self._length)
+        )
+
+    # Rendering and queries only depend on iteration and keyed lookups, so
+    # share PlayerList's implementation.
+    display = PlayerList.display
+    render = PlayerList.render
+    query = PlayerList.query
+
+    def close(self) -> None:
+        """Releases the file buffer. The list must not be used afterwards."""
+        for name in ("_uids", "_offsets", "_by_uid", "_blob", "_view"):
+            view = self.__dict__.pop(name, None)
+            if isinstance(view, memoryview):
+                view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def _row_for(self, key: str) -> int | None:
+        """Looks up the row holding a key in O(log n) through the by-uid section.
+
+        Args:
+            key: The key to look up.
+
+        Returns:
+            int or None: The row holding the key, or None if not found.
+        """
+        # Only canonical uid strings match, as in PlayerList.
+        if not isinstance(key, str) or not key.isdecimal() or key[0] == "0":
+            return None
+        uid = int(key)
+        if self._by_uid is None:
+            if self._index is None:
+                self._index = dict(zip(self._uids, range(self._length)))
+            return self._index.get(uid)
+        uids, by_uid = self._uids, self._by_uid
+        position = bisect_left(by_uid, uid, key=uids.__getitem__)
+        if position < self._length and uids[by_uid[position]] == uid:
+            return by_uid[position]
+        return None
+
+    def _player_at(self, row: int) -> Player:
+        """Decodes the player stored in a row.
+
+        Args:
+            row: The row to read.
+
+        Returns:
+            Player: A new player built from the already validated row.
+        """
+        name = str(self._blob[self._offsets[row]:self._offsets[row + 1]], "utf-8")
+        return Player.from_trusted(str(self._uids[row]), name)
+
+    def _node_at(self, row: int) -> PlayerNode:
+        """Builds a node for a row; nothing is kept of it.
+
+        Args:
+            row: The row to read.
+
+        Returns:
+            PlayerNode: A new node holding the row's player.
+        """
+        return PlayerNode(self._player_at(row))
+
+    def __contains__(self, key: str) -> bool:
+        """Checks whether a node with the given key is in the list.
+
+        Args:
+            key: The key to look for.
+
+        Returns:
+            bool: True if a node with the key is in the list, False otherwise.
+        """
+        return self._row_for(key) is not None
+
+    def __enter__(self) -> MappedPlayerList:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __iter__(self):
+        """Implements forward iteration through the list.
+
+        Yields:
+            PlayerNode: Each node in the list from head to tail.
+        """
+        for row in range(self._length):
+            yield self._node_at(row)
+
+    def __reversed__(self):
+        """Implements reverse iteration through the list.
+
+        Yields:
+            PlayerNode: Each node in the list from tail to head.
+        """
+        for row in reversed(range(self._length)):
+            yield self._node_at(row)
+
+
+def _last_offset(view: memoryview, end: int) -> int:
+    """Reads the offset table's last entry, the length of the name blob.
+
+    Args:
+        view: The whole file.
+        end: Where the offset table ends.
+
+    Returns:
+        int: The blob length the file declares.
+    """
+    return int.from_bytes(view[end - 8:end], "little")
+
+
+def _swapped(column: memoryview) -> array:
+    """Copies a little-endian uint64 column into a native array.
+
+    Args:
+        column: The column as stored in the file.
+
+    Returns:
+        array: The column in native byte order.
+    """
+    values = array("Q", column.tobytes())
+    values.byteswap()
+    return values
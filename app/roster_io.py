@@ -0,0 +1,217 @@
+from __future__ import annotations
+import csv
+import io
+import json
+from itertools import islice
+from typing import Callable, Iterable, Iterator, TextIO
+from player import Player
+from player_list import PlayerList
+from player_node import PlayerNode
+
+FORMATS = ("csv", "jsonl")
+ERROR_POLICIES = ("raise", "skip")
+_CSV_HEADER = ["uid", "name"]
+# json.dumps builds a new encoder per call when given options; share one.
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+def iter_export(nodes: Iterable[PlayerNode], format: str = "csv",
+                chunk_size: int = 1000) -> Iterator[str]:
+    """Encodes PlayerNodes as CSV or JSON Lines, one chunk of records at a time.
+
+    Only one chunk of encoded text is held at once, so memory stays bounded by
+    chunk_size however long the roster is.
+
+    Args:
+        nodes: The nodes to export, usually a PlayerList.
+        format: "csv" (with a uid,name header) or "jsonl".
+        chunk_size: The number of records per yielded chunk.
+
+    Yields:
+        str: Encoded records, each terminated by a newline.
+
+    Raises:
+        ValueError: If format or chunk_size is invalid.
+    """
+    _check_format(format)
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+    nodes = iter(nodes)
+    buffer = io.StringIO()
+    if format == "csv":
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(_CSV_HEADER)
+
+        def encode(node: PlayerNode) -> None:
+            writer.writerow((node.key, node.name))
+    else:
+        def encode(node: PlayerNode) -> None:
+            record = {"uid": node.key, "name": node.name}
+            buffer.write(_JSON_ENCODER.encode(record) + "\n")
+    while True:
+        written = 0
+        for node in islice(nodes, chunk_size):
+            encode(node)
+            written += 1
+        chunk = buffer.getvalue()
+        if chunk:
+            yield chunk
+        if written < chunk_size:
+            return
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def import_stream(player_list: PlayerList, fileobj: TextIO, format: str = "csv",
+                  errors: str = "raise", chunk_size: int = 1000,
+                  on_error: Callable[[int, Exception], None] | None = None) -> int:
+    """Parses a CSV or JSON Lines roster incrementally and appends it to a list.
+
+    Records are read chunk_size at a time, validated with the Player rules in
+    one batch and linked with PlayerList.extend, so memory stays bounded by the
+    chunk size.
+
+    Args:
+        player_list: The list to append the players to.
+        fileobj: A text stream positioned at the start of the roster.
+        format: "csv" (with a uid,name header) or "jsonl".
+        errors: "raise" to stop at the first bad record, or "skip" to drop bad
+            records (invalid uid or name, malformed line, uid already in the
+            list) and carry on. With "raise", chunks before the bad one have
+            already been imported.
+        chunk_size: The number of records parsed and inserted per batch.
+        on_error: Optional callback called with the record number (1-based,
+            excluding any header) and the exception of every skipped record.
+
+    Returns:
+        int: The number of players imported.
+
+    Raises:
+        ValueError: If format, errors or chunk_size is invalid, or, with
+            errors="raise", if a record is invalid.
+        TypeError: With errors="raise", if a record holds a non-string uid.
+    """
+    _check_format(format)
+    if errors not in ERROR_POLICIES:
+        raise ValueError(f"errors must be one of {ERROR_POLICIES}")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+    records = _parse_csv(fileobj) if format == "csv" else _parse_jsonl(fileobj)
+    imported = 0
+    number = 0
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return imported
+        nodes = []
+        uids = []
+        names = []
+        numbers = []
+        for record in chunk:
+            number += 1
+            if isinstance(record, Exception):
+                _reject(errors, on_error, number, record)
+                continue
+            uids.append(record[0])
+            names.append(record[1])
+            numbers.append(number)
+        try:
+            players = Player.validate_many(uids, names)
+        except (TypeError, ValueError):
+            if errors == "raise":
+                raise
+            # Fall back to validating row by row to isolate the bad records.
+            players = []
+            for uid, name, record_number in zip(uids, names, numbers):
+                try:
+                    players.append(Player(uid, name))
+                except (TypeError, ValueError) as error:
+                    _reject(errors, on_error, record_number, error)
+                    players.append(None)
+        if errors == "skip":
+            seen = set()
+            for player, record_number in zip(players, numbers):
+                if player is None:
+                    continue
+                if player.uid in player_list or player.uid in seen:
+                    _reject(errors, on_error, record_number, ValueError(
+                        f"A player with uid {player.uid} is already in the list"))
+                    continue
+                seen.add(player.uid)
+                nodes.append(PlayerNode(player))
+        else:
+            nodes = [PlayerNode(player) for player in players]
+        player_list.extend(nodes)
+        imported += len(nodes)
+
+
+def _check_format(format: str) -> None:
+    """Rejects unknown roster formats.
+
+    Args:
+        format: The requested format.
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    if format not in FORMATS:
+        raise ValueError(f"format must be one of {FORMATS}")
+
+
+def _reject(errors: str, on_error, number: int, error: Exception) -> None:
+    """Applies the error policy to a bad record.
+
+    Args:
+        errors: The error policy.
+        on_error: The optional error callback.
+        number: The record number.
+        error: What was wrong with the record.
+
+    Raises:
+        Exception: The error itself when the policy is "raise".
+    """
+    if errors == "raise":
+        raise error
+    if on_error is not None:
+        on_error(number, error)
+
+
+def _parse_csv(fileobj: TextIO) -> Iterator:
+    """Lazily parses CSV rows after a uid,name header, ignoring blank lines.
+
+    Args:
+        fileobj: The text stream to read.
+
+    Yields:
+        tuple or ValueError: (uid, name) per row, or the error for a malformed row.
+    """
+    reader = csv.reader(fileobj)
+    header = next(reader, None)
+    if header is not None and [column.strip() for column in header] != _CSV_HEADER:
+        raise ValueError("CSV roster must start with a uid,name header")
+    for row in reader:
+        if not row or (len(row) == 1 and not row[0].strip()):
+            continue
+        if len(row) != 2:
+            yield ValueError(f"Expected 2 columns, got {len(row)}")
+        else:
+            yield row[0], row[1]
+
+
+def _parse_jsonl(fileobj: TextIO) -> Iterator:
+    """Lazily parses JSON Lines records, ignoring blank lines.
+
+    Args:
+        fileobj: The text stream to read.
+
+    Yields:
+        tuple or ValueError: (uid, name) per record, or the error for a malformed record.
+    """
+    for line in fileobj:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            yield record["uid"], record["name"]
+        except (ValueError, KeyError, TypeError) as error:
+            yield ValueError(f"Malformed record: {error}")
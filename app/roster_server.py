@@ -0,0 +1,82 @@
+from __future__ import annotations
+import asyncio
+from async_player_list import AsyncPlayerList
+from player import Player
+from player_node import PlayerNode
+
+# Line-based protocol, one request per line, one response line per request:
+#   FIND <uid>         -> OK <uid> <name> | NOT_FOUND
+#   ADD <uid> <name>   -> OK | ERR <message>
+#   DEL <uid>          -> OK | NOT_FOUND
+#   LEN                -> OK <length>
+# Malformed requests get ERR <message>.
+
+
+async def handle_request(player_list: AsyncPlayerList, line: str) -> str:
+    """Executes one protocol request against the roster.
+
+    Args:
+        player_list: The roster to serve.
+        line: The request line, without its newline.
+
+    Returns:
+        str: The response line, without its newline.
+    """
+    command, _, argument = line.partition(" ")
+    command = command.upper()
+    if command == "FIND":
+        node = await player_list.find_node_with_key(argument)
+        return "NOT_FOUND" if node is None else f"OK {node.key} {node.name}"
+    if command == "ADD":
+        uid, _, name = argument.partition(" ")
+        try:
+            await player_list.insert_at_tail(PlayerNode(Player(uid, name)))
+        except (TypeError, ValueError) as error:
+            return f"ERR {error}"
+        return "OK"
+    if command == "DEL":
+        return "OK" if await player_list.delete_node_with_key(argument) else "NOT_FOUND"
+    if command == "LEN":
+        return f"OK {player_list.length}"
+    return f"ERR unknown command {command!r}"
+
+
+async def serve(player_list: AsyncPlayerList, host: str = "127.0.0.1",
+                port: int = 0) -> asyncio.Server:
+    """Starts serving a roster over asyncio streams.
+
+    Args:
+        player_list: The roster to serve.
+        host: The interface to bind, localhost by default.
+        port: The port to bind; 0 picks a free one (see server.sockets).
+
+    Returns:
+        asyncio.Server: The running server.
+    """
+    async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while line := await reader.readline():
+                response = await handle_request(player_list, line.decode("utf-8").rstrip("\r\n"))
+                writer.write(response.encode("utf-8") + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle_client, host, port)
+
+
+async def main(port: int = 8765) -> None:
+    """Serves an empty roster on localhost until cancelled.
+
+    Args:
+        port: The port to listen on.
+    """
+    server = await serve(AsyncPlayerList(), port=port)
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
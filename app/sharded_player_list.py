@@ -0,0 +1,318 @@
+from __future__ import annotations
+import multiprocessing
+import os
+from itertools import islice
+from typing import Iterable
+from player import IntUIDPlayer, Player
+from player_list import PlayerList
+from player_node import PlayerNode
+
+
+def _shard_worker(connection) -> None:
+    """Runs one shard: owns a PlayerList and serves requests from the front end.
+
+    Requests are (command, argument) tuples and every request gets exactly one
+    reply. Players cross the pipe as (uid, name) tuples, which were validated
+    by the front end, so they are rebuilt with _trusted_player.
+
+    Args:
+        connection: This shard's end of the pipe.
+    """
+    player_list = PlayerList()
+    iterators = {}
+    while True:
+        command, argument = connection.recv()
+        try:
+            if command == "insert":
+                player_list.extend(PlayerNode(_trusted_player(uid, name)) for uid, name in argument)
+                reply = None
+            elif command == "find":
+                reply = []
+                for key in argument:
+                    node = player_list.find_node_with_key(key)
+                    reply.append(None if node is None else (node.key, node.name))
+            elif command == "delete":
+                reply = [player_list.delete_node_with_key(key) for key in argument]
+            elif command == "length":
+                reply = player_list.length
+            elif command == "iterate":
+                # argument is (iteration id, chunk size); an empty chunk ends it.
+                iteration, size = argument
+                nodes = iterators.setdefault(iteration, iter(player_list))
+                reply = [(node.key, node.name) for node in islice(nodes, size)]
+                if len(reply) < size:
+                    del iterators[iteration]
+            elif command == "release":
+                reply = iterators.pop(argument, None) is not None
+            elif command == "stop":
+                connection.send(("ok", None))
+                return
+            else:
+                raise ValueError(f"Unknown shard command {command!r}")
+        except Exception as error:
+            connection.send(("error", error))
+        else:
+            connection.send(("ok", reply))
+
+
+def _trusted_player(uid, name: str) -> Player:
+    """Rebuilds a validated player, as an IntUIDPlayer when its uid is an int.
+
+    Args:
+        uid: The player's canonical uid.
+        name: The player's name.
+
+    Returns:
+        Player: The player.
+    """
+    return (IntUIDPlayer if type(uid) is int else Player).from_trusted(uid, name)
+
+
+class ShardedPlayerList:
+    """A roster partitioned by uid across worker processes, one PlayerList each.
+
+    Every worker process owns the PlayerList for one shard, so roster work
+    spreads over several cores. A player lives on shard int(uid) % shards;
+    IntUIDPlayer nodes, keyed by int, are routed and returned the same way.
+    Single-key calls are routed to their shard. Batched calls (insert_many,
+    find_many, delete_many) send each shard its part of the batch first and
+    only then collect the replies, so shards work in parallel.
+
+    Iteration merges the shards lazily, a chunk from each shard at a time. It
+    follows insertion order within a shard but not across shards. Nodes
+    handed out are detached copies. Call close() (or use a with block) to
+    stop the workers.
+    """
+    def __init__(self, shards: int | None = None, chunk_size: int = 10_000) -> None:
+        self._shard_count = shards or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+        self._connections = []
+        self._processes = []
+        self._iterations = 0
+        for _ in range(self._shard_count):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_shard_worker, args=(child,), daemon=True)
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+
+    @property
+    def shards(self) -> int:
+        """Gets the number of shards.
+
+        Returns:
+            int: The number of worker processes.
+        """
+        return self._shard_count
+
+    @property
+    def length(self) -> int:
+        """Gets the number of nodes across all shards.
+
+        Returns:
+            int: The total length.
+        """
+        return sum(self._fan_out({shard: ("length", None) for shard in range(self._shard_count)}).values())
+
+    def insert(self, node: PlayerNode) -> None:
+        """Inserts a PlayerNode at the end of its shard.
+
+        Args:
+            node: The PlayerNode to insert.
+
+        Raises:
+            ValueError: If a node with the same key is already in the list.
+        """
+        self.insert_many([node])
+
+    def insert_many(self, nodes: Iterable[PlayerNode]) -> None:
+        """Inserts a batch of PlayerNodes, each shard linking its part in parallel.
+
+        Each shard inserts its part all-or-nothing, but a clash on one shard
+        does not undo the parts already inserted on other shards.
+
+        Args:
+            nodes: The PlayerNodes to insert.
+
+        Raises:
+            ValueError: If a key is already in the list, repeated in the batch
+                or not a uid.
+        """
+        parts = {}
+        for node in nodes:
+            shard = self._shard_of(node.key)
+            if shard is None:
+                raise ValueError(f"Player UID {node.key!r} cannot be routed to a shard")
+            parts.setdefault(shard, []).append((node.key, node.name))
+        self._fan_out({shard: ("insert", part) for shard, part in parts.items()})
+
+    def find_node_with_key(self, key: str) -> PlayerNode | None:
+        """Finds the node with the specified key on its shard.
+
+        Args:
+            key: The key to search for.
+
+        Returns:
+            PlayerNode or None: A detached copy of the node, or None if not found.
+        """
+        return self.find_many([key])[key]
+
+    def find_many(self, keys: Iterable[str]) -> dict:
+        """Looks up a batch of keys, querying every shard involved in parallel.
+
+        Args:
+            keys: The keys to search for.
+
+        Returns:
+            dict: Each key mapped to a detached PlayerNode, or None if not found.
+        """
+        results, replies = self._keyed("find", keys)
+        for key, found in replies:
+            results[key] = None if found is None else PlayerNode(_trusted_player(*found))
+        return results
+
+    def delete_node_with_key(self, key: str) -> bool:
+        """Deletes the node with the specified key from its shard.
+
+        Args:
+            key: The key to search for and delete.
+
+        Returns:
+            bool: True if a node was found and deleted, False otherwise.
+        """
+        return self.delete_many([key])[key]
+
+    def delete_many(self, keys: Iterable[str]) -> dict:
+        """Deletes a batch of keys, each shard deleting its part in parallel.
+
+        Args:
+            keys: The keys to delete.
+
+        Returns:
+            dict: Each key mapped to True if it was deleted, False otherwise.
+        """
+        results, replies = self._keyed("delete", keys)
+        results = {key: bool(found) for key, found in results.items()}
+        results.update(replies)
+        return results
+
+    def close(self) -> None:
+        """Stops the worker processes. The list must not be used afterwards."""
+        for connection in self._connections:
+            try:
+                connection.send(("stop", None))
+                connection.recv()
+            except (BrokenPipeError, EOFError):
+                pass
+            connection.close()
+        for process in self._processes:
+            process.join()
+        self._connections = []
+        self._processes = []
+
+    def _shard_of(self, key: str) -> int | None:
+        """Picks the shard owning a key.
+
+        Args:
+            key: The key to route.
+
+        Returns:
+            int or None: The shard, or None if the key is not a canonical uid
+            (a str, or an int for IntUIDPlayer) and so cannot be in any shard.
+        """
+        if type(key) is int:
+            return key % self._shard_count if key >= 0 else None
+        if not isinstance(key, str) or not key.isdecimal() or key[0] == "0":
+            return None
+        return int(key) % self._shard_count
+
+    def _keyed(self, command: str, keys: Iterable[str]):
+        """Routes a batch of keys to their shards and gathers the per-key replies.
+
+        Args:
+            command: "find" or "delete".
+            keys: The keys to send.
+
+        Returns:
+            tuple: A dict of every key mapped to None, and an iterable of
+            (key, reply) pairs for the keys that were routed.
+        """
+        results = {}
+        parts = {}
+        for key in keys:
+            results[key] = None
+            shard = self._shard_of(key)
+            if shard is not None:
+                parts.setdefault(shard, []).append(key)
+        replies = self._fan_out({shard: (command, part) for shard, part in parts.items()})
+        pairs = ((key, reply) for shard, part in parts.items() for key, reply in zip(part, replies[shard]))
+        return results, pairs
+
+    def _fan_out(self, requests: dict) -> dict:
+        """Sends one request per shard, then collects every reply.
+
+        Args:
+            requests: Shard number mapped to a (command, argument) request.
+
+        Returns:
+            dict: Shard number mapped to its reply.
+
+        Raises:
+            Exception: The first error raised by a shard, after all replies are in.
+        """
+        for shard, request in requests.items():
+            self._connections[shard].send(request)
+        replies = {}
+        error = None
+        for shard in requests:
+            status, reply = self._connections[shard].recv()
+            if status == "error" and error is None:
+                error = reply
+            replies[shard] = reply
+        if error is not None:
+            raise error
+        return replies
+
+    def __enter__(self) -> ShardedPlayerList:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __contains__(self, key: str) -> bool:
+        """Checks whether a node with the given key is on its shard.
+
+        Args:
+            key: The key to look for.
+
+        Returns:
+            bool: True if a node with the key is in the list, False otherwise.
+        """
+        return self.find_node_with_key(key) is not None
+
+    def __iter__(self):
+        """Lazily merges the shards, fetching one chunk from each shard at a time.
+
+        The list must not be modified while the generator is being consumed.
+
+        Yields:
+            PlayerNode: A detached copy of every node, shard by shard within each round.
+        """
+        self._iterations += 1
+        iteration = self._iterations
+        request = ("iterate", (iteration, self._chunk_size))
+        active = set(range(self._shard_count))
+        try:
+            while active:
+                replies = self._fan_out({shard: request for shard in active})
+                for shard in sorted(replies):
+                    if len(replies[shard]) < self._chunk_size:
+                        active.discard(shard)
+                for shard in sorted(replies):
+                    for uid, name in replies[shard]:
+                        yield PlayerNode(_trusted_player(uid, name))
+        finally:
+            # Abandoned part way: let the shards drop their iterators.
+            if active and self._connections:
+                self._fan_out({shard: ("release", iteration) for shard in active})
@@ -0,0 +1,267 @@
+from __future__ import annotations
+from typing import Any, Callable, Iterable
+from indexed_player_list import _IndexableSkipList
+from player_list import PlayerList
+from player_node import PlayerNode
+
+
+def _uid_order(node: PlayerNode) -> int:
+    """Default sort key: the uid compared as a number, so "9" sorts before "10"."""
+    return int(node.key)
+
+
+def _uid_bound(value: str | int) -> int:
+    """Normalises a uid bound the way PlayerUID does (strip, then int)."""
+    return int(value.strip()) if isinstance(value, str) else int(value)
+
+
+class SortedPlayerList:
+    """A list of PlayerNodes kept in key order, with range and rank queries.
+
+    By default nodes are ordered by uid, compared numerically; pass key to
+    order by anything else (e.g. key=lambda node: node.name). Nodes with equal
+    sort keys keep their insertion order. An indexable skip list holds the
+    order, so inserts, deletes, rank and nearest are O(log n). Nodes stay
+    doubly linked, so a range scan costs one O(log n) seek plus a walk along
+    the links.
+    """
+    def __init__(self, nodes: Iterable[PlayerNode] = (),
+                 key: Callable[[PlayerNode], Any] | None = None) -> None:
+        self._sort_key = _uid_order if key is None else key
+        # Bounds given to queries are uids when ordering by uid.
+        self._bound = _uid_bound if key is None else (lambda value: value)
+        self._skip = _IndexableSkipList()
+        self._towers = {}
+        self._head = None
+        self._tail = None
+        for node in nodes:
+            self.insert(node)
+
+    @property
+    def is_empty(self) -> bool:
+        """Checks if the list contains no nodes.
+
+        Returns:
+            bool: True if the list is empty, False otherwise.
+        """
+        return self._head is None
+
+    @property
+    def length(self) -> int:
+        """Gets the number of nodes in the list.
+
+        Returns:
+            int: The current length of the list.
+        """
+        return len(self._skip)
+
+    @property
+    def head(self) -> PlayerNode | None:
+        """Gets the node with the smallest sort key.
+
+        Returns:
+            PlayerNode or None: The head node, or None if list is empty.
+        """
+        return self._head
+
+    @property
+    def tail(self) -> PlayerNode | None:
+        """Gets the node with the largest sort key.
+
+        Returns:
+            PlayerNode or None: The tail node, or None if list is empty.
+        """
+        return self._tail
+
+    def insert(self, node: PlayerNode) -> None:
+        """Inserts a PlayerNode at its place in key order in O(log n).
+
+        Args:
+            node: The PlayerNode to insert.
+
+        Raises:
+            ValueError: If a node with the same uid is already in the list.
+        """
+        if node.key in self._towers:
+            raise ValueError(f"A player with uid {node.key} is already in the list")
+        sort_key = self._sort_key(node)
+        tower = self._skip.insert(self._skip.bisect_right(sort_key), node, sort_key)
+        following = tower.next[0].value if tower.next[0] is not None else None
+        previous = following.prev if following is not None else self._tail
+        node.next = following
+        node.prev = previous
+        if previous is None:
+            self._head = node
+        else:
+            previous.next = node
+        if following is None:
+            self._tail = node
+        else:
+            following.prev = node
+        self._towers[node.key] = tower
+
+    def extend(self, nodes: Iterable[PlayerNode]) -> None:
+        """Inserts every PlayerNode of a batch at its place in key order.
+
+        Args:
+            nodes: The PlayerNodes to insert.
+        """
+        for node in nodes:
+            self.insert(node)
+
+    def find_node_with_key(self, key: str) -> PlayerNode | None:
+        """Finds the node with the specified uid in O(1).
+
+        Args:
+            key: The uid to search for.
+
+        Returns:
+            PlayerNode or None: The node with the specified uid, or None if not found.
+        """
+        tower = self._towers.get(key)
+        return None if tower is None else tower.value
+
+    def delete_node_with_key(self, key: str) -> bool:
+        """Deletes the node with the specified uid in O(log n).
+
+        Args:
+            key: The uid to search for and delete.
+
+        Returns:
+            bool: True if a node was found and deleted, False otherwise.
+        """
+        tower = self._towers.pop(key, None)
+        if tower is None:
+            return False
+        self._skip.delete(self._skip.rank(tower))
+        node = tower.value
+        if node.prev is None:
+            self._head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self._tail = node.prev
+        else:
+            node.next.prev = node.prev
+        return True
+
+    def range(self, lo=None, hi=None):
+        """Lazily yields the nodes whose sort key lies in [lo, hi].
+
+        When ordering by uid, bounds may be uid strings or ints and are
+        compared numerically. The list must not be modified while the
+        generator is being consumed.
+
+        Args:
+            lo: The smallest sort key to include, or None for no lower bound.
+            hi: The largest sort key to include, or None for no upper bound.
+
+        Yields:
+            PlayerNode: Each matching node in key order.
+        """
+        if lo is None:
+            node = self._head
+        else:
+            position = self._skip.bisect_left(self._bound(lo))
+            node = self._skip.get(position).value if position < len(self._skip) else None
+        if hi is None:
+            while node is not None:
+                yield node
+                node = node.next
+            return
+        hi = self._bound(hi)
+        sort_key = self._sort_key
+        while node is not None and sort_key(node) <= hi:
+            yield node
+            node = node.next
+
+    def rank(self, key) -> int:
+        """Counts the nodes whose sort key is less than key, in O(log n).
+
+        Args:
+            key: The sort key (a uid when ordering by uid).
+
+        Returns:
+            int: The rank of key, which is also the position it would take.
+        """
+        return self._skip.bisect_left(self._bound(key))
+
+    def nearest(self, key) -> PlayerNode | None:
+        """Finds the node whose sort key is numerically closest to key, in O(log n).
+
+        Ties go to the smaller key. Requires numeric sort keys, as with the
+        default uid ordering.
+
+        Args:
+            key: The sort key to approach (a uid when ordering by uid).
+
+        Returns:
+            PlayerNode or None: The closest node, or None if the list is empty.
+        """
+        key = self._bound(key)
+        position = self._skip.bisect_left(key)
+        above = self._skip.get(position) if position < len(self._skip) else None
+        below = self._skip.get(position - 1) if position > 0 else None
+        if above is None or (below is not None and key - below.key <= above.key - key):
+            return None if below is None else below.value
+        return above.value
+
+    # Rendering and queries only depend on iteration and keyed lookups, so
+    # share PlayerList's implementation.
+    display = PlayerList.display
+    render = PlayerList.render
+    query = PlayerList.query
+
+    def __len__(self) -> int:
+        return len(self._skip)
+
+    def __getitem__(self, position: int) -> PlayerNode:
+        """Gets the node at a position in key order, in O(log n).
+
+        Args:
+            position: The position (negative counts from the end).
+
+        Returns:
+            PlayerNode: The node at that position.
+
+        Raises:
+            IndexError: If the position is out of range.
+        """
+        if position < 0:
+            position += len(self._skip)
+        if not 0 <= position < len(self._skip):
+            raise IndexError("list index out of range")
+        return self._skip.get(position).value
+
+    def __contains__(self, key: str) -> bool:
+        """Checks in O(1) whether a node with the given uid is in the list.
+
+        Args:
+            key: The uid to look for.
+
+        Returns:
+            bool: True if a node with the uid is in the list, False otherwise.
+        """
+        return key in self._towers
+
+    def __iter__(self):
+        """Implements iteration in ascending key order.
+
+        Yields:
+            PlayerNode: Each node in the list from head to tail.
+        """
+        current = self._head
+        while current is not None:
+            yield current
+            current = current.next
+
+    def __reversed__(self):
+        """Implements iteration in descending key order.
+
+        Yields:
+            PlayerNode: Each node in the list from tail to head.
+        """
+        current = self._tail
+        while current is not None:
+            yield current
+            current = current.prev
@@ -0,0 +1,54 @@
+"""Compare find_many/delete_many with per-key calls for batches of 1 to 100k keys.
+
+Run from the repository root: python bench/batch_delete_bench.py [size]
+"""
+import gc
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from player import Player
+from player_list import PlayerList
+from player_node import PlayerNode
+
+
+def build(size: int) -> PlayerList:
+    return PlayerList.from_iterable(PlayerNode(Player.from_trusted(str(uid), "P")) for uid in range(1, size + 1))
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"{'k':>7} {'find loop':>10} {'find_many':>10} {'delete loop':>12} {'delete_many':>12}  (ms)")
+    for k in (1, 10, 100, 1_000, 10_000, 100_000):
+        keys = [str(uid) for uid in random.sample(range(1, size + 1), min(k, size))]
+        player_list = build(size)
+        gc.collect()
+
+        start = time.perf_counter()
+        for key in keys:
+            player_list.find_node_with_key(key)
+        find_loop = time.perf_counter() - start
+        start = time.perf_counter()
+        player_list.find_many(keys)
+        find_many = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for key in keys:
+            player_list.delete_node_with_key(key)
+        delete_loop = time.perf_counter() - start
+        player_list = build(size)
+        gc.collect()
+        start = time.perf_counter()
+        player_list.delete_many(keys)
+        delete_many = time.perf_counter() - start
+        assert player_list.length == size - len(keys)
+
+        print(f"{k:>7} {find_loop * 1e3:>10.3f} {find_many * 1e3:>10.3f} "
+              f"{delete_loop * 1e3:>12.3f} {delete_many * 1e3:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Compare bulk loading (from_iterable / extend) with an insert_at_tail loop.
+
+Run from the repository root: python bench/bulk_insert_bench.py [size]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from player import Player
+from player_list import PlayerList
+from player_node import PlayerNode
+
+
+def per_node(nodes) -> PlayerList:
+    player_list = PlayerList()
+    for node in nodes:
+        player_list.insert_at_tail(node)
+    return player_list
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    players = [Player(str(uid), f"Player {uid}") for uid in range(1, size + 1)]
+    for label, load in (("insert_at_tail loop", per_node), ("from_iterable", PlayerList.from_iterable)):
+        nodes = [PlayerNode(player) for player in players]
+        start = time.perf_counter()
+        load(nodes)
+        elapsed = time.perf_counter() - start
+        print(f"{label:>20}: {elapsed:.3f}s ({size / elapsed:,.0f} nodes/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Compare ConcurrentPlayerList with a PlayerList guarded by one global lock.
+
+Run from the repository root: python bench/concurrency_bench.py [threads] [ops]
+
+The workload is read-heavy (90% lookups, 10% insert/delete), matching
+matchmaking workers sharing one roster.
+"""
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from concurrent_player_list import ConcurrentPlayerList
+from player import Player
+from player_list import PlayerList
+from player_node import PlayerNode
+
+ROSTER = 100_000
+
+
+class GlobalLockPlayerList:
+    """The baseline: every call wrapped in one mutex."""
+
+    def __init__(self, nodes) -> None:
+        self._list = PlayerList.from_iterable(nodes)
+        self._lock = threading.Lock()
+
+    def find_node_with_key(self, key):
+        with self._lock:
+            return self._list.find_node_with_key(key)
+
+    def insert_at_tail(self, node):
+        with self._lock:
+            self._list.insert_at_tail(node)
+
+    def delete_node_with_key(self, key):
+        with self._lock:
+            return self._list.delete_node_with_key(key)
+
+
+def worker(player_list, offset: int, ops: int) -> None:
+    rng = random.Random(offset)
+    next_uid = ROSTER + offset * ops + 1
+    for _ in range(ops):
+        if rng.random() < 0.9:
+            player_list.find_node_with_key(str(rng.randint(1, ROSTER)))
+        else:
+            player_list.insert_at_tail(PlayerNode(Player(str(next_uid), "Joiner")))
+            player_list.delete_node_with_key(str(next_uid))
+            next_uid += 1
+
+
+def run(factory, threads_count: int, ops: int) -> float:
+    player_list = factory(PlayerNode(Player(str(uid), f"Player {uid}")) for uid in range(1, ROSTER + 1))
+    threads = [threading.Thread(target=worker, args=(player_list, n, ops)) for n in range(threads_count)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return threads_count * ops / (time.perf_counter() - start)
+
+
+def main() -> None:
+    threads_count = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    ops = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    for label, factory in (("global lock", GlobalLockPlayerList), ("ConcurrentPlayerList", ConcurrentPlayerList)):
+        print(f"{label:>22}: {run(factory, threads_count, ops):>10,.0f} ops/s with {threads_count} threads")
+
+
+if __name__ == "__main__":
+    main()
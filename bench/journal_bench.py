@@ -0,0 +1,64 @@
+"""Measure PlayerList write throughput with each journal durability level.
+
+Run from the repository root: python bench/journal_bench.py [ops] [directory]
+
+Times a mix of inserts and deletes on an unjournaled list, then on a
+journaled one with fsync "never", "batch" (group commit) and "always",
+followed by replay and compaction of the resulting log. Pass a directory
+on the disk you care about; the default is a temporary directory.
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from player import Player
+from player_journal import PlayerJournal
+from player_list import PlayerList
+from player_node import PlayerNode
+
+
+def workload(player_list: PlayerList, ops: int) -> float:
+    """Inserts two players for every one deleted; returns the elapsed seconds."""
+    start = time.perf_counter()
+    for i in range(1, ops + 1):
+        if i % 3 == 0:
+            player_list.delete_head()
+        else:
+            player_list.insert_at_tail(PlayerNode(Player.from_trusted(str(i), f"Player {i}")))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    ops = int(sys.argv[1]) if len(sys.argv) > 1 else 30_000
+    directory = sys.argv[2] if len(sys.argv) > 2 else tempfile.mkdtemp()
+    print(f"{'no journal':>10}: {ops / workload(PlayerList(), ops):12,.0f} ops/s")
+    for policy in ("never", "batch", "always"):
+        count = ops if policy != "always" else max(ops // 30, 1)
+        path = os.path.join(directory, f"bench-{policy}")
+        journal = PlayerJournal(path, fsync=policy)
+        elapsed = workload(journal.player_list, count)
+        start = time.perf_counter()
+        journal.commit()
+        elapsed += time.perf_counter() - start
+        size = journal.log_size
+        journal.close()
+        print(f"{policy:>10}: {count / elapsed:12,.0f} ops/s  ({size / count:.0f} bytes/op)")
+
+    path = os.path.join(directory, "bench-never")
+    start = time.perf_counter()
+    journal = PlayerJournal(path)
+    print(f"replay of {ops:,} records: {(time.perf_counter() - start) * 1e3:.1f} ms")
+    start = time.perf_counter()
+    journal.compact()
+    print(f"compact() in the caller: {(time.perf_counter() - start) * 1e3:.1f} ms")
+    journal.close()
+    start = time.perf_counter()
+    PlayerJournal(path).close()
+    print(f"recovery from the snapshot: {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Benchmark find_node_with_key / delete_node_with_key latency across list sizes.
+
+Run from the repository root: python bench/lookup_bench.py
+"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from player import Player
+from player_list import PlayerList
+from player_node import PlayerNode
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+LOOKUPS = 10_000
+
+
+def build(size: int) -> PlayerList:
+    player_list = PlayerList()
+    for uid in range(1, size + 1):
+        player_list.insert_at_tail(PlayerNode(Player(str(uid), f"Player {uid}")))
+    return player_list
+
+
+def main() -> None:
+    print(f"{'size':>10} {'find ns/op':>12} {'in ns/op':>10} {'delete ns/op':>13}")
+    for size in SIZES:
+        player_list = build(size)
+        keys = [str(random.randint(1, size)) for _ in range(LOOKUPS)]
+        find = timeit.timeit(lambda: [player_list.find_node_with_key(k) for k in keys], number=1)
+        contains = timeit.timeit(lambda: [k in player_list for k in keys], number=1)
+        unique = list(dict.fromkeys(keys))
+        delete = timeit.timeit(lambda: [player_list.delete_node_with_key(k) for k in unique], number=1)
+        print(f"{size:>10} {find / LOOKUPS * 1e9:>12.0f} {contains / LOOKUPS * 1e9:>10.0f} "
+              f"{delete / len(unique) * 1e9:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
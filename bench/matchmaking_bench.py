@@ -0,0 +1,106 @@
+"""Simulate a matchmaking queue holding a steady crowd of waiting players.
+
+Run from the repository root: python bench/matchmaking_bench.py [queued] [seconds]
+
+The queue is filled with queued players (skill ~ N(1500, 300)), then each
+simulated second a fresh 5% of that joins, 0.5% of the waiting players
+cancel and matches are formed for as many players as joined, keeping the
+queue at a steady size. Matches/sec is measured on the time spent in
+dequeue_many; waits are in simulated seconds. The scan row forms groups the
+way a plain PlayerList lobby would: walk from the head for players near the
+oldest one's skill.
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from matchmaking_queue import MatchmakingQueue
+from player import Player
+from player_list import PlayerList
+from player_node import PlayerNode
+
+GROUP_SIZE = 10
+BUCKET_WIDTH = 25
+MAX_SPREAD = 2
+
+
+def percentile(values: list, fraction: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * fraction))] if values else 0.0
+
+
+def simulate(label: str, queue: MatchmakingQueue, queued: int, seconds: int) -> None:
+    rng = random.Random(42)
+    now = [0.0]
+    queue._clock = lambda: now[0]
+    joined = {}
+    next_uid = 1
+
+    def join(count: int) -> None:
+        nonlocal next_uid
+        for uid in range(next_uid, next_uid + count):
+            joined[str(uid)] = now[0]
+            queue.join(Player.from_trusted(str(uid), "P"), rng.gauss(1500, 300))
+        next_uid += count
+
+    join(queued)
+    arrivals = queued // 20
+    waits, groups, spent = [], 0, 0.0
+    for second in range(1, seconds + 1):
+        now[0] = float(second)
+        join(arrivals)
+        for uid in rng.sample(range(max(1, next_uid - queued), next_uid), queued // 200):
+            queue.cancel(str(uid))
+        start = time.perf_counter()
+        formed = queue.dequeue_many(max_groups=arrivals // GROUP_SIZE)
+        spent += time.perf_counter() - start
+        groups += len(formed)
+        waits.extend(now[0] - joined[player.uid] for group in formed for player in group)
+    waits.sort()
+    print(f"{label:<22}{groups / spent:>12,.0f}{percentile(waits, 0.5):>8.1f}{percentile(waits, 0.9):>8.1f}"
+          f"{percentile(waits, 0.99):>8.1f}{len(queue):>10,}")
+
+
+def scan_groups(lobby: PlayerList, skills: dict, count: int) -> int:
+    formed = 0
+    anchor = lobby.head
+    while formed < count and anchor is not None:
+        bucket = skills[anchor.key] // BUCKET_WIDTH
+        group = [anchor]
+        node = anchor.next
+        while node is not None and len(group) < GROUP_SIZE:
+            if abs(skills[node.key] // BUCKET_WIDTH - bucket) <= MAX_SPREAD:
+                group.append(node)
+            node = node.next
+        if len(group) < GROUP_SIZE:
+            anchor = anchor.next
+            continue
+        anchor = anchor.next
+        while anchor is not None and anchor in group:
+            anchor = anchor.next
+        for member in group:
+            lobby.delete_node_with_key(member.key)
+        formed += 1
+    return formed
+
+
+def main() -> None:
+    queued = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    seconds = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    print(f"{queued:,} queued, groups of {GROUP_SIZE}, buckets of {BUCKET_WIDTH} skill, spread {MAX_SPREAD}")
+    print(f"{'queue':<22}{'matches/s':>12}{'p50 s':>8}{'p90 s':>8}{'p99 s':>8}{'left':>10}")
+    simulate("FIFO", MatchmakingQueue(GROUP_SIZE), queued, seconds)
+    simulate("skill buckets", MatchmakingQueue(GROUP_SIZE, BUCKET_WIDTH, MAX_SPREAD), queued, seconds)
+
+    rng = random.Random(42)
+    skills = {str(uid): rng.gauss(1500, 300) for uid in range(1, queued + 1)}
+    lobby = PlayerList.from_iterable(PlayerNode(Player.from_trusted(uid, "P")) for uid in skills)
+    start = time.perf_counter()
+    formed = scan_groups(lobby, skills, queued // 20 // GROUP_SIZE)
+    print(f"{'PlayerList scan':<22}{formed / (time.perf_counter() - start):>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Compare the memory used by PlayerList and CompactPlayerList with tracemalloc.
+
+Run from the repository root: python bench/memory_bench.py [size]
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from compact_player_list import CompactPlayerList
+from player import Player
+from player_list import PlayerList
+from player_node import PlayerNode
+
+
+def measure(factory, size: int) -> int:
+    tracemalloc.start()
+    player_list = factory()
+    for uid in range(1, size + 1):
+        player_list.insert_at_tail(PlayerNode(Player(str(uid), f"Player {uid}")))
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del player_list
+    return current
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"{'mode':>18} {'bytes':>14} {'bytes/player':>13}")
+    for mode, factory in (("PlayerList", PlayerList), ("CompactPlayerList", CompactPlayerList)):
+        used = measure(factory, size)
+        print(f"{mode:>18} {used:>14,} {used / size:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Measure the cost of PlayerList instrumentation, disabled and enabled.
+
+Run from the repository root: python bench/metrics_overhead_bench.py [size]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from player import Player
+from player_list import PlayerList
+from player_list_metrics import instrument, uninstrument
+from player_node import PlayerNode
+
+
+def find_all(player_list: PlayerList, keys) -> float:
+    start = time.perf_counter()
+    for key in keys:
+        player_list.find_node_with_key(key)
+    return (time.perf_counter() - start) / len(keys)
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    player_list = PlayerList.from_iterable(PlayerNode(Player(str(uid), "P")) for uid in range(1, size + 1))
+    keys = [str(uid) for uid in range(1, size + 1)]
+    never = find_all(player_list, keys)
+    instrument(player_list)
+    enabled = find_all(player_list, keys)
+    uninstrument(player_list)
+    disabled = find_all(player_list, keys)
+    print(f"find_node_with_key: never instrumented {never * 1e9:.0f} ns, "
+          f"instrumented {enabled * 1e9:.0f} ns, uninstrumented again {disabled * 1e9:.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Measure friend-search suggestion latency with PlayerNameIndex.
+
+Run from the repository root: python bench/name_search_bench.py [players] [substring_players]
+
+Types "Stephanie" one keystroke at a time and asks for the first 10
+suggestions, comparing a full list walk with the prefix index at [players]
+(1M by default). Then times suggestions interleaved with joins and renames,
+as on a live server where every query follows fresh writes. Substring search
+is measured on a smaller roster, as the n-gram index is much larger than the
+prefix array.
+"""
+import gc
+import os
+import random
+import sys
+import time
+from itertools import islice
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from player import Player
+from player_list import PlayerList
+from player_name_index import PlayerNameIndex
+from player_node import PlayerNode
+
+FIRST = ["Stephen", "Stephanie", "Steve", "Stella", "Ann", "Bob", "Chloe", "Dmitri", "Esther",
+         "Farah", "Gustav", "Hana", "Ivan", "Jun", "Kofi", "Lena", "Mateo", "Nia", "Omar", "Priya"]
+LAST = ["Curry", "Nash", "Stone", "Smith", "Kowalski", "Nguyen", "Okafor", "Silva", "Tanaka",
+        "Muller", "Rossi", "Haddad", "Ivanova", "Kim", "Larsen", "Moreau"]
+
+
+def roster(size: int) -> PlayerList:
+    rng = random.Random(7)
+    return PlayerList.from_iterable(
+        PlayerNode(Player.from_trusted(str(uid), f"{rng.choice(FIRST)} {rng.choice(LAST)}{uid % 997}"))
+        for uid in range(1, size + 1)
+    )
+
+
+def keystrokes(search, word: str, repeats: int = 20) -> list:
+    """Times search(prefix) for every prefix of word; returns ms per prefix."""
+    timings = []
+    for end in range(1, len(word) + 1):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            search(word[:end])
+        timings.append((time.perf_counter() - start) / repeats * 1e3)
+    return timings
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    substring_size = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+    word = "Stephanie Kowalski12"
+    player_list = roster(size)
+    gc.collect()
+
+    def walk(text):
+        text = text.casefold()
+        return list(islice((node for node in player_list if node.name.casefold().startswith(text)), 10))
+
+    start = time.perf_counter()
+    index = PlayerNameIndex(player_list)
+    list(index.prefix("a", limit=1))
+    print(f"prefix index build for {size:,} players: {time.perf_counter() - start:.2f} s")
+    walked = keystrokes(walk, word, repeats=1)
+    indexed = keystrokes(lambda text: list(index.prefix(text, limit=10)), word)
+    print(f"{'typed':<22}{'walk ms':>10}{'index ms':>10}")
+    for end, (slow, fast) in enumerate(zip(walked, indexed), start=1):
+        print(f"{word[:end]!r:<22}{slow:10.3f}{fast:10.4f}")
+
+    rng = random.Random(11)
+    uid = size + 1
+    writes = queries = 0.0
+    rounds = 10_000
+    for round_number in range(rounds):
+        start = time.perf_counter()
+        player_list.insert_at_tail(
+            PlayerNode(Player.from_trusted(str(uid), f"{rng.choice(FIRST)} {rng.choice(LAST)}{uid % 997}"))
+        )
+        if round_number % 10 == 0:
+            player_list.find_node_with_key(str(rng.randint(1, size))).player.name = f"Stephanie R{round_number}"
+        uid += 1
+        middle = time.perf_counter()
+        list(index.prefix(word[:1 + round_number % len(word)], limit=10))
+        end = time.perf_counter()
+        writes += middle - start
+        queries += end - middle
+    print(f"joins (and a rename every 10) with the index attached: {writes / rounds * 1e6:.1f} us")
+    print(f"suggestions interleaved with those writes: {queries / rounds * 1e3:.4f} ms")
+    index.close()
+    del index, player_list
+    gc.collect()
+
+    small = roster(substring_size)
+    start = time.perf_counter()
+    index = PlayerNameIndex(small, substrings=True)
+    print(f"substring index build for {substring_size:,} players: {time.perf_counter() - start:.2f} s")
+    for text in ("ph", "phan", "curry4"):
+        start = time.perf_counter()
+        for _ in range(20):
+            list(index.substring(text, limit=10))
+        print(f"substring({text!r}, limit=10): {(time.perf_counter() - start) / 20 * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Measure join/leave churn on a PlayerList with and without a PlayerNodePool.
+
+Run from the repository root: python bench/node_pool_bench.py [size] [operations]
+
+A lobby of size players sees operations rounds of churn; each round one
+player joins at the tail and one leaves, alternately the longest-waiting
+(delete_head) and a random uid (delete_node_with_key, a no-op when that
+player already left). Node allocations
+count PlayerNode constructions; GC collections and pauses are recorded
+through gc.callbacks.
+"""
+import gc
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from player import Player
+from player_list import PlayerList
+from player_node import PlayerNode
+from player_node_pool import PlayerNodePool
+
+
+class GCTimer:
+    """Counts collections and sums their pauses while installed."""
+
+    def __init__(self) -> None:
+        self.collections = 0
+        self.paused = 0.0
+        self._started = 0.0
+
+    def __call__(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self._started = time.perf_counter()
+        else:
+            self.collections += 1
+            self.paused += time.perf_counter() - self._started
+
+
+def churn(size: int, operations: int, pool: PlayerNodePool | None) -> None:
+    rng = random.Random(7)
+    make = PlayerNode if pool is None else pool.acquire
+    lobby = PlayerList.from_iterable(make(Player.from_trusted(str(uid), "P")) for uid in range(size))
+    if pool is not None:
+        lobby.use_pool(pool)
+    first_miss = 0 if pool is None else pool.misses
+    players = [Player.from_trusted(str(uid), "P") for uid in range(size, size + operations)]
+    gc.collect()
+    timer = GCTimer()
+    gc.callbacks.append(timer)
+    start = time.perf_counter()
+    for round_number, player in enumerate(players):
+        lobby.insert_at_tail(make(player))
+        if round_number % 2:
+            lobby.delete_head()
+        else:
+            lobby.delete_node_with_key(str(rng.randrange(round_number, size + round_number)))
+    elapsed = time.perf_counter() - start
+    gc.callbacks.remove(timer)
+    allocated = operations if pool is None else pool.misses - first_miss
+    label = "no pool" if pool is None else f"pool of {pool.capacity:,}"
+    print(f"{label:<16}{2 * operations / elapsed:>12,.0f}{allocated:>14,}{timer.collections:>12,}"
+          f"{timer.paused * 1e3:>12.2f}")
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    operations = int(sys.argv[2]) if len(sys.argv) > 2 else 500_000
+    print(f"{size:,} players, {operations:,} joins and {operations:,} leaves")
+    print(f"{'run':<16}{'ops/s':>12}{'node allocs':>14}{'GC runs':>12}{'GC ms':>12}")
+    churn(size, operations, None)
+    for capacity in (64, 4096):
+        churn(size, operations, PlayerNodePool(capacity))
+
+
+if __name__ == "__main__":
+    main()
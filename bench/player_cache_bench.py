@@ -0,0 +1,42 @@
+"""Measure LRUPlayerCache hit rate and throughput under Zipfian access.
+
+Run from the repository root: python bench/player_cache_bench.py [players] [requests]
+"""
+import itertools
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from player import Player
+from player_cache import LRUPlayerCache
+
+
+def zipf_uids(players: int, requests: int, exponent: float, seed: int = 1) -> list:
+    """Draws uids where the k-th most popular player has weight 1 / k**exponent."""
+    weights = list(itertools.accumulate(1 / rank ** exponent for rank in range(1, players + 1)))
+    return [str(uid) for uid in random.Random(seed).choices(range(1, players + 1), cum_weights=weights, k=requests)]
+
+
+def main() -> None:
+    players = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 500_000
+    store = {}  # stands in for the profile store behind the cache
+    for exponent in (0.8, 1.0, 1.2):
+        uids = zipf_uids(players, requests, exponent)
+        for capacity in (players // 1000, players // 100, players // 10):
+            cache = LRUPlayerCache(capacity)
+            start = time.perf_counter()
+            for uid in uids:
+                if cache.get(uid) is None:
+                    player = store.get(uid) or store.setdefault(uid, Player(uid, f"Player {uid}"))
+                    cache.put(player)
+            elapsed = time.perf_counter() - start
+            print(f"zipf s={exponent} capacity={capacity:>7}: hit rate {cache.stats()['hit_rate']:.3f}, "
+                  f"{requests / elapsed:,.0f} ops/s")
+
+
+if __name__ == "__main__":
+    main()
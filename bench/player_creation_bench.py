@@ -0,0 +1,31 @@
+"""Microbenchmark Player(), Player.validate_many and Player.from_trusted.
+
+Run from the repository root: python bench/player_creation_bench.py [size]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from player import Player
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    uids = [str(uid) for uid in range(1, size + 1)]
+    names = [f"Player {uid}" for uid in range(1, size + 1)]
+    paths = (
+        ("Player()", lambda: [Player(uid, name) for uid, name in zip(uids, names)]),
+        ("Player.validate_many", lambda: Player.validate_many(uids, names)),
+        ("Player.from_trusted", lambda: list(map(Player.from_trusted, uids, names))),
+    )
+    for label, build in paths:
+        start = time.perf_counter()
+        build()
+        elapsed = time.perf_counter() - start
+        print(f"{label:>22}: {elapsed:.3f}s ({elapsed / size * 1e9:.0f} ns/player)")
+
+
+if __name__ == "__main__":
+    main()
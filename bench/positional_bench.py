@@ -0,0 +1,40 @@
+"""Compare random positional inserts and page reads on PlayerList and IndexedPlayerList.
+
+Run from the repository root: python bench/positional_bench.py [size] [operations]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from indexed_player_list import IndexedPlayerList
+from player import Player
+from player_list import PlayerList
+from player_node import PlayerNode
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    operations = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    for cls in (PlayerList, IndexedPlayerList):
+        rng = random.Random(1)
+        player_list = cls.from_iterable(PlayerNode(Player(str(uid), f"Player {uid}")) for uid in range(1, size + 1))
+        start = time.perf_counter()
+        for uid in range(size + 1, size + operations + 1):
+            player_list.insert_at_position(PlayerNode(Player(str(uid), "New")), rng.randint(0, player_list.length))
+        insert = (time.perf_counter() - start) / operations
+        line = f"{cls.__name__:>18}: insert_at_position {insert * 1e6:>9.1f} us/op"
+        if cls is IndexedPlayerList:
+            start = time.perf_counter()
+            for _ in range(operations):
+                first = rng.randrange(player_list.length - 50)
+                player_list[first:first + 50]
+            page = (time.perf_counter() - start) / operations
+            line += f", 50-player page {page * 1e6:.1f} us/op"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Measure PlayerQuery pipelines against the list comprehensions they replace.
+
+Run from the repository root: python bench/query_bench.py [size]
+
+Each row runs the same lookup both ways over a roster of size players: an
+eager comprehension over the whole list, and the lazy query (which stops at
+its limit and uses an index when one applies).
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from player import Player
+from player_list import PlayerList
+from player_name_index import PlayerNameIndex
+from player_node import PlayerNode
+from sorted_player_list import SortedPlayerList
+
+NAMES = ("Steve", "Alice", "Stella", "Bob", "Stan", "Carol", "Dave", "Erin")
+
+
+def roster(size: int) -> list:
+    return [PlayerNode(Player.from_trusted(str(uid), f"{NAMES[uid % len(NAMES)]}{uid}")) for uid in range(1, size + 1)]
+
+
+def timed(action, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    players = PlayerList.from_iterable(roster(size))
+    PlayerNameIndex(players)
+    by_uid = SortedPlayerList(roster(size))
+    lo, hi = size // 2, size // 2 + 100
+    wanted = [str(uid) for uid in range(1, size, size // 50)]
+    wanted_set = set(wanted)
+    cases = [
+        ("first 10 names",
+         lambda: [node.name for node in players][:10],
+         players.query().select(lambda node: node.name).limit(10)),
+        ("first 10 'Ste' names",
+         lambda: [node.name for node in players if node.name.casefold().startswith("ste")][:10],
+         players.query().where(name_prefix="Ste").select(lambda node: node.name).limit(10)),
+        ("50 uids",
+         lambda: [node for node in players if node.key in wanted_set],
+         players.query().where(uids=wanted)),
+        ("uid range of 100",
+         lambda: [node for node in by_uid if lo <= int(node.key) <= hi],
+         by_uid.query().where(uid_range=(lo, hi))),
+    ]
+    print(f"{'query':<24}{'plan':>18}{'comprehension ms':>18}{'query ms':>10}")
+    for label, eager, query in cases:
+        print(f"{label:<24}{query.explain():>18}{timed(eager):18.2f}{timed(lambda: list(query)):10.3f}")
+
+
+if __name__ == "__main__":
+    main()
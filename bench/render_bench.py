@@ -0,0 +1,45 @@
+"""Compare peak memory of rendering a roster by join-then-print and by render().
+
+Run from the repository root: python bench/render_bench.py [size]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from player import Player
+from player_list import PlayerList
+from player_node import PlayerNode
+
+
+def join_then_write(player_list: PlayerList, stream) -> None:
+    """The old display(): materialise every node, build one string, write it."""
+    nodes = list(player_list)
+    stream.write(" -> ".join(f"{node.key}'{node.name}'" for node in nodes) + "\n")
+
+
+def measure(label: str, action) -> None:
+    start = time.perf_counter()
+    action()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    action()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:>24}: {elapsed:.3f}s, peak {peak / 2 ** 20:,.1f} MiB")
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    player_list = PlayerList.from_iterable(
+        PlayerNode(Player(str(uid), f"Player {uid}")) for uid in range(1, size + 1))
+    with open(os.devnull, "w") as devnull:
+        measure("list + join", lambda: join_then_write(player_list, devnull))
+        measure("render", lambda: player_list.render(devnull))
+        measure("render head=20 tail=20", lambda: player_list.render(devnull, head=20, tail=20))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Measure delta replication against a full resync of a PlayerList replica.
+
+Run from the repository root: python bench/replication_bench.py [size] [churn]
+
+A primary of size players (default 1M) is mirrored to a replica over a
+multiprocessing Pipe. Then churn (default 1%) of the roster changes, split
+evenly between inserts after a random neighbour, deletes and renames. The
+replica catches up once by delta and once by full resync. The table reports
+the bytes sent and the time to fetch and apply each update.
+"""
+import os
+import random
+import sys
+import threading
+import time
+from multiprocessing import Pipe
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from player import Player
+from player_list import PlayerList
+from player_node import PlayerNode
+from player_replication import PlayerChangelog, PlayerReplica
+
+
+def churn(primary: PlayerList, changes: int, first_uid: int) -> None:
+    rng = random.Random(3)
+    for change in range(changes):
+        key = str(rng.randrange(1, first_uid))
+        node = primary.find_node_with_key(key)
+        if node is None:
+            continue
+        if change % 3 == 0:
+            primary.insert_after(node, PlayerNode(Player.from_trusted(str(first_uid + change), "New")))
+        elif change % 3 == 1:
+            primary.delete_node_with_key(key)
+        else:
+            node.player.name = f"Renamed{change}"
+
+
+def timed_sync(replica: PlayerReplica) -> tuple:
+    received = replica.bytes_received
+    start = time.perf_counter()
+    kind = replica.sync()
+    return kind, replica.bytes_received - received, (time.perf_counter() - start) * 1e3
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    fraction = float(sys.argv[2]) if len(sys.argv) > 2 else 0.01
+    primary = PlayerList.from_iterable(PlayerNode(Player.from_trusted(str(uid), f"Player{uid}")) for uid in range(1, size + 1))
+    with PlayerChangelog(primary) as changelog:
+        primary_end, replica_end = Pipe()
+        server = threading.Thread(target=changelog.serve, args=(primary_end,))
+        server.start()
+        replica = PlayerReplica(replica_end)
+        replica.sync()
+
+        churn(primary, int(size * fraction), size + 1)
+        print(f"{size:,} players, {changelog.version:,} changes")
+        print(f"{'update':<10}{'bytes':>14}{'ms':>12}")
+        kind, sent, elapsed = timed_sync(replica)
+        print(f"{kind:<10}{sent:>14,}{elapsed:>12.1f}")
+        replica._epoch = 0  # pretend the replica last synced elsewhere to force a full resync
+        kind, sent, elapsed = timed_sync(replica)
+        print(f"{kind:<10}{sent:>14,}{elapsed:>12.1f}")
+        assert [node.name for node in replica.player_list] == [node.name for node in primary]
+
+        replica.close()
+        server.join()
+
+
+if __name__ == "__main__":
+    main()
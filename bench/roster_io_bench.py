@@ -0,0 +1,49 @@
+"""Measure streaming export/import throughput in records/sec and peak memory.
+
+Run from the repository root: python bench/roster_io_bench.py [size]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from player import Player
+from player_list import PlayerList
+from player_node import PlayerNode
+
+
+def export(player_list: PlayerList, format: str, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        for chunk in player_list.iter_export(format=format):
+            file.write(chunk)
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    player_list = PlayerList.from_iterable(
+        PlayerNode(Player(str(uid), f"Player {uid}")) for uid in range(1, size + 1))
+    with tempfile.TemporaryDirectory() as directory:
+        for format in ("csv", "jsonl"):
+            path = os.path.join(directory, f"roster.{format}")
+            start = time.perf_counter()
+            export(player_list, format, path)
+            export_time = time.perf_counter() - start
+            # Measure peak memory in a second pass: tracemalloc skews timings.
+            tracemalloc.start()
+            export(player_list, format, path)
+            export_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            start = time.perf_counter()
+            with open(path, encoding="utf-8", newline="") as file:
+                PlayerList().import_stream(file, format=format)
+            import_time = time.perf_counter() - start
+            print(f"{format:>5}: export {size / export_time:>10,.0f} rec/s "
+                  f"(peak {export_peak / 1024:,.0f} KiB), import {size / import_time:>10,.0f} rec/s")
+
+
+if __name__ == "__main__":
+    main()
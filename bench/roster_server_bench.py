@@ -0,0 +1,54 @@
+"""Measure p50/p99 request latency of the asyncio roster server.
+
+Run from the repository root: python bench/roster_server_bench.py [clients] [requests]
+
+Starts the server on localhost in the same event loop, preloads a roster and
+has every client issue FIND requests back to back.
+"""
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from async_player_list import AsyncPlayerList
+from player import Player
+from player_node import PlayerNode
+from roster_server import serve
+
+ROSTER = 100_000
+
+
+async def client(port: int, requests: int, latencies: list) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for _ in range(requests):
+        start = time.perf_counter()
+        writer.write(f"FIND {random.randint(1, ROSTER)}\n".encode())
+        await reader.readline()
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+    await writer.wait_closed()
+
+
+async def main(clients: int, requests: int) -> None:
+    player_list = AsyncPlayerList()
+    await player_list.extend(PlayerNode(Player(str(uid), f"Player {uid}")) for uid in range(1, ROSTER + 1))
+    server = await serve(player_list)
+    port = server.sockets[0].getsockname()[1]
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, requests, latencies) for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+    server.close()
+    await server.wait_closed()
+    cuts = statistics.quantiles(latencies, n=100)
+    print(f"{clients} clients x {requests} requests: {len(latencies) / elapsed:,.0f} req/s, "
+          f"p50 {cuts[49] * 1e3:.2f} ms, p99 {cuts[98] * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+                     int(sys.argv[2]) if len(sys.argv) > 2 else 20))
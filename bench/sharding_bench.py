@@ -0,0 +1,74 @@
+"""Measure ShardedPlayerList throughput from 1 shard up to the number of cores.
+
+Run from the repository root: python bench/sharding_bench.py [size] [batch]
+
+Each run inserts size players, then looks up and deletes them in batches,
+so every batch fans out to all shards at once. A single in-process
+PlayerList is timed first as the baseline; sharding only pays off once
+batches are large enough to hide the pipe round trips.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from player import Player
+from player_list import PlayerList
+from player_node import PlayerNode
+from sharded_player_list import ShardedPlayerList
+
+
+def batches(keys, batch):
+    for start in range(0, len(keys), batch):
+        yield keys[start:start + batch]
+
+
+def run(player_list, nodes, keys, batch) -> tuple:
+    start = time.perf_counter()
+    for part in batches(nodes, batch):
+        player_list.insert_many(part)
+    inserted = time.perf_counter() - start
+    start = time.perf_counter()
+    for part in batches(keys, batch):
+        player_list.find_many(part)
+    found = time.perf_counter() - start
+    start = time.perf_counter()
+    for part in batches(keys, batch):
+        player_list.delete_many(part)
+    deleted = time.perf_counter() - start
+    return inserted, found, deleted
+
+
+class LocalPlayerList(PlayerList):
+    """The baseline: the same batched calls on one PlayerList in this process."""
+
+    def insert_many(self, nodes):
+        self.extend(nodes)
+
+    def find_many(self, keys):
+        return {key: self.find_node_with_key(key) for key in keys}
+
+    def delete_many(self, keys):
+        return {key: self.delete_node_with_key(key) for key in keys}
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    batch = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    keys = [str(uid) for uid in range(1, size + 1)]
+    nodes = [PlayerNode(Player(key, f"Player {key}")) for key in keys]
+
+    def report(label, timings):
+        print(f"{label:>12}: " + ", ".join(
+            f"{name} {size / seconds / 1e3:,.0f}k ops/s"
+            for name, seconds in zip(("insert", "find", "delete"), timings)))
+
+    report("in-process", run(LocalPlayerList(), nodes, keys, batch))
+    for shards in range(1, (os.cpu_count() or 1) + 1):
+        with ShardedPlayerList(shards) as sharded:
+            report(f"{shards} shard(s)", run(sharded, nodes, keys, batch))
+
+
+if __name__ == "__main__":
+    main()
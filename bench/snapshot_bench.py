@@ -0,0 +1,44 @@
+"""Compare cold-start time of rebuilding, a full snapshot load and a mapped load.
+
+Run from the repository root: python bench/snapshot_bench.py [size]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from player import Player
+from player_list import PlayerList
+from player_node import PlayerNode
+
+
+def timed(label: str, action):
+    start = time.perf_counter()
+    result = action()
+    print(f"{label:>32}: {time.perf_counter() - start:.4f}s")
+    return result
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    uids = [str(uid) for uid in range(1, size + 1)]
+    names = [f"Player {uid}" for uid in range(1, size + 1)]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "roster.bin")
+        player_list = timed("rebuild from validated records", lambda: PlayerList.from_iterable(
+            PlayerNode(Player(uid, name)) for uid, name in zip(uids, names)))
+        timed("save", lambda: player_list.save(path))
+        print(f"{'snapshot size':>32}: {os.path.getsize(path):,} bytes")
+        timed("load(mmap=False)", lambda: PlayerList.load(path, mmap=False))
+        mapped = timed("load(mmap=True)", lambda: PlayerList.load(path))
+        timed("first 100 nodes of mapped list", lambda: [n for n, _ in zip(mapped, range(100))])
+        keys = random.sample(uids, 1000)
+        timed("1000 lookups on mapped list", lambda: [mapped.find_node_with_key(k) for k in keys])
+        mapped.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Measure PlayerList.snapshot() cost and how much pending views slow writers.
+
+Run from the repository root: python bench/snapshot_view_bench.py [size] [writes]
+
+Compares taking a view with copying every node, times the first write
+after a view is taken and a full read of the view, then times a stream of
+writes with no views, with a view taken before every write (worst case:
+each write saves state for a new generation) and with one view taken every
+1000 writes.
+"""
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from player import Player
+from player_list import PlayerList
+from player_node import PlayerNode
+
+
+def build(size: int) -> PlayerList:
+    return PlayerList.from_iterable(PlayerNode(Player.from_trusted(str(uid), "P")) for uid in range(1, size + 1))
+
+
+def writes(player_list: PlayerList, count: int, snapshot_every: int | None) -> float:
+    """Appends then deletes players, taking a view every snapshot_every writes."""
+    base = player_list.length + 1
+    views = []
+    gc.collect()
+    start = time.perf_counter()
+    for i in range(count):
+        if snapshot_every and i % snapshot_every == 0:
+            views.append(player_list.snapshot())
+        if i % 2:
+            player_list.delete_tail()
+        else:
+            player_list.insert_at_tail(PlayerNode(Player.from_trusted(str(base + i), "P")))
+    elapsed = time.perf_counter() - start
+    for view in views:
+        view.release()
+    return elapsed
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    player_list = build(size)
+
+    start = time.perf_counter()
+    copy = PlayerList.from_iterable(PlayerNode(node.player) for node in player_list)
+    print(f"full copy of {size:,} nodes: {(time.perf_counter() - start) * 1e3:.1f} ms")
+    del copy
+    start = time.perf_counter()
+    for _ in range(10_000):
+        player_list.snapshot().release()
+    print(f"snapshot() + release(): {(time.perf_counter() - start) / 10_000 * 1e6:.2f} us")
+    view = player_list.snapshot()
+    start = time.perf_counter()
+    player_list.delete_tail()
+    print(f"first write after a snapshot of {size:,} nodes: "
+          f"{(time.perf_counter() - start) * 1e6:.1f} us")
+    start = time.perf_counter()
+    for _ in view:
+        pass
+    print(f"reading the view: {(time.perf_counter() - start) * 1e3:.1f} ms")
+    view.release()
+
+    baseline = writes(player_list, count, None)
+    print(f"{count:,} writes, no views:          {baseline / count * 1e6:8.2f} us/write")
+    rare = writes(player_list, count, 1000)
+    print(f"{count:,} writes, view every 1000:   {rare / count * 1e6:8.2f} us/write")
+    small = build(1_000)
+    every = writes(small, count, 1)
+    print(f"{count:,} writes, view every write (1,000-node list): {every / count * 1e6:8.2f} us/write")
+
+
+if __name__ == "__main__":
+    main()
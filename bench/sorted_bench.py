@@ -0,0 +1,45 @@
+"""Compare SortedPlayerList range queries with a full walk plus sort of a PlayerList.
+
+Run from the repository root: python bench/sorted_bench.py [size]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from player import Player
+from player_list import PlayerList
+from player_node import PlayerNode
+from sorted_player_list import SortedPlayerList
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    uids = random.sample(range(1, size * 10), size)
+
+    start = time.perf_counter()
+    sorted_list = SortedPlayerList(PlayerNode(Player(str(uid), "P")) for uid in uids)
+    print(f"SortedPlayerList build: {(time.perf_counter() - start) / size * 1e6:.1f} us/insert")
+    player_list = PlayerList.from_iterable(PlayerNode(Player(str(uid), "P")) for uid in uids)
+
+    lo, hi = size, size + size // 100
+    start = time.perf_counter()
+    walked = sorted((node for node in player_list if lo <= int(node.key) <= hi), key=lambda n: int(n.key))
+    scan = time.perf_counter() - start
+    start = time.perf_counter()
+    ranged = list(sorted_list.range(lo, hi))
+    indexed = time.perf_counter() - start
+    assert [n.key for n in walked] == [n.key for n in ranged]
+    print(f"range({lo}, {hi}) -> {len(ranged)} players: walk+sort {scan * 1e3:.2f} ms, "
+          f"SortedPlayerList.range {indexed * 1e3:.3f} ms")
+
+    start = time.perf_counter()
+    for _ in range(10_000):
+        sorted_list.rank(random.randint(1, size * 10))
+    print(f"rank: {(time.perf_counter() - start) / 10_000 * 1e6:.1f} us/op")
+
+
+if __name__ == "__main__":
+    main()
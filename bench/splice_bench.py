@@ -0,0 +1,66 @@
+"""Measure lobby merge (concat) and split (split_at) against moving nodes one by one.
+
+Run from the repository root: python bench/splice_bench.py [size]
+
+Each lobby holds size players. Merge joins a small lobby (1% of size) and
+an equal one onto a full lobby; split cuts a lobby at 1%, 50% and 99%.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from player import Player
+from player_list import PlayerList
+from player_node import PlayerNode
+
+
+def lobby(first: int, size: int) -> PlayerList:
+    return PlayerList.from_iterable(PlayerNode(Player.from_trusted(str(uid), "P")) for uid in range(first, first + size))
+
+
+def merge_one_by_one(target: PlayerList, other: PlayerList) -> None:
+    while not other.is_empty:
+        node = other.head
+        other.delete_head()
+        target.insert_at_tail(node)
+
+
+def split_one_by_one(source: PlayerList, node: PlayerNode) -> PlayerList:
+    rest = PlayerList()
+    while source.tail is not node:
+        moved = source.tail
+        source.delete_tail()
+        rest.insert_at_head(moved)
+    source.delete_tail()
+    rest.insert_at_head(node)
+    return rest
+
+
+def timed(action) -> float:
+    start = time.perf_counter()
+    action()
+    return (time.perf_counter() - start) * 1e3
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{'operation':<28}{'one by one ms':>14}{'relink ms':>12}")
+    for other_size in (size // 100, size):
+        target, other = lobby(1, size), lobby(size + 1, other_size)
+        slow = timed(lambda: merge_one_by_one(target, other))
+        target, other = lobby(1, size), lobby(size + 1, other_size)
+        fast = timed(lambda: target.concat(other))
+        print(f"{f'merge {size:,} + {other_size:,}':<28}{slow:14.2f}{fast:12.3f}")
+    for fraction in (0.01, 0.5, 0.99):
+        cut = str(int(size * fraction) or 1)
+        source = lobby(1, size)
+        slow = timed(lambda: split_one_by_one(source, source.find_node_with_key(cut)))
+        source = lobby(1, size)
+        fast = timed(lambda: source.split_at(source.find_node_with_key(cut)))
+        print(f"{f'split {size:,} at {fraction:.0%}':<28}{slow:14.2f}{fast:12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+"""Reproducible benchmark suite for the Player / PlayerNode / PlayerList hot paths.
+
+Run from the repository root:
+
+    python bench/suite.py                                # all cases, default sizes
+    python bench/suite.py --sizes 10 1000 --output run.json
+    python bench/suite.py --baseline base.json --threshold 0.15
+    python bench/suite.py --pyperf -o run.json           # if pyperf is installed
+
+Results are written as JSON (to stdout or --output) so runs can be stored and
+compared. With --baseline, every case that got slower than the threshold is
+reported and the exit status is 1.
+
+Each case is a function (size) -> run, where run(loops) performs the timed
+operation loops times and returns the elapsed seconds, excluding setup. That
+is the shape pyperf's Runner.bench_time_func expects, so both modes share
+the case definitions.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from player import Player
+from player_list import PlayerList
+from player_node import PlayerNode
+
+DEFAULT_SIZES = (10, 1_000, 100_000, 1_000_000)
+# Operations that are O(n) per call are timed on a fixed number of calls.
+POSITIONAL_OPS = 100
+
+
+def _players(size: int) -> list:
+    return [Player(str(uid), f"Player {uid}") for uid in range(1, size + 1)]
+
+
+def _list_of(size: int) -> PlayerList:
+    return PlayerList.from_iterable(PlayerNode(player) for player in _players(size))
+
+
+def case_player_construction(size):
+    uids = [str(uid) for uid in range(1, size + 1)]
+    names = [f"Player {uid}" for uid in range(1, size + 1)]
+
+    def run(loops):
+        elapsed = 0.0
+        for _ in range(loops):
+            start = time.perf_counter()
+            for uid, name in zip(uids, names):
+                Player(uid, name)
+            elapsed += time.perf_counter() - start
+        return elapsed
+    return run, size
+
+
+def case_player_validate_many(size):
+    uids = [f" 0{uid} " for uid in range(1, size + 1)]
+    names = [f" Player {uid} " for uid in range(1, size + 1)]
+
+    def run(loops):
+        start = time.perf_counter()
+        for _ in range(loops):
+            Player.validate_many(uids, names)
+        return time.perf_counter() - start
+    return run, size
+
+
+def case_node_linking(size):
+    players = _players(size)
+
+    def run(loops):
+        elapsed = 0.0
+        for _ in range(loops):
+            start = time.perf_counter()
+            previous = None
+            for player in players:
+                node = PlayerNode(player)
+                node.prev = previous
+                if previous is not None:
+                    previous.next = node
+                previous = node
+            elapsed += time.perf_counter() - start
+        return elapsed
+    return run, size
+
+
+def _insert_case(method_name):
+    def case(size):
+        players = _players(size)
+
+        def run(loops):
+            elapsed = 0.0
+            for _ in range(loops):
+                player_list = PlayerList()
+                nodes = [PlayerNode(player) for player in players]
+                insert = getattr(player_list, method_name)
+                start = time.perf_counter()
+                for node in nodes:
+                    insert(node)
+                elapsed += time.perf_counter() - start
+            return elapsed
+        return run, size
+    return case
+
+
+def case_insert_at_position(size):
+    players = _players(size + POSITIONAL_OPS)
+
+    def run(loops):
+        elapsed = 0.0
+        for _ in range(loops):
+            player_list = PlayerList.from_iterable(PlayerNode(player) for player in players[:size])
+            nodes = [PlayerNode(player) for player in players[size:]]
+            start = time.perf_counter()
+            for node in nodes:
+                player_list.insert_at_position(node, player_list.length // 2)
+            elapsed += time.perf_counter() - start
+        return elapsed
+    return run, POSITIONAL_OPS
+
+
+def case_find_node_with_key(size):
+    player_list = _list_of(size)
+    keys = [str(uid) for uid in range(1, size + 1)]
+
+    def run(loops):
+        find = player_list.find_node_with_key
+        start = time.perf_counter()
+        for _ in range(loops):
+            for key in keys:
+                find(key)
+        return time.perf_counter() - start
+    return run, size
+
+
+def case_delete_node_with_key(size):
+    players = _players(size)
+    # Delete from the middle outwards so head/tail shortcuts are not measured.
+    keys = [str(uid) for uid in sorted(range(1, size + 1), key=lambda uid: abs(uid - size // 2))]
+
+    def run(loops):
+        elapsed = 0.0
+        for _ in range(loops):
+            player_list = PlayerList.from_iterable(PlayerNode(player) for player in players)
+            delete = player_list.delete_node_with_key
+            start = time.perf_counter()
+            for key in keys:
+                delete(key)
+            elapsed += time.perf_counter() - start
+        return elapsed
+    return run, size
+
+
+def _iterate_case(backwards):
+    def case(size):
+        player_list = _list_of(size)
+
+        def run(loops):
+            start = time.perf_counter()
+            for _ in range(loops):
+                for _ in (reversed(player_list) if backwards else player_list):
+                    pass
+            return time.perf_counter() - start
+        return run, size
+    return case
+
+
+def case_display(size):
+    player_list = _list_of(size)
+
+    def run(loops):
+        sink = io.StringIO()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(sink):
+            for _ in range(loops):
+                player_list.display()
+                sink.seek(0)
+                sink.truncate()
+        return time.perf_counter() - start
+    return run, size
+
+
+CASES = {
+    "player_construction": case_player_construction,
+    "player_validate_many": case_player_validate_many,
+    "node_linking": case_node_linking,
+    "insert_at_head": _insert_case("insert_at_head"),
+    "insert_at_tail": _insert_case("insert_at_tail"),
+    "insert_at_position": case_insert_at_position,
+    "find_node_with_key": case_find_node_with_key,
+    "delete_node_with_key": case_delete_node_with_key,
+    "iterate_forward": _iterate_case(backwards=False),
+    "iterate_reverse": _iterate_case(backwards=True),
+    "display": case_display,
+}
+
+
+def _loops_for(size: int) -> int:
+    # Aim for roughly 1e5 operations per repeat, at least one loop.
+    return max(1, 100_000 // size)
+
+
+def run_stdlib(cases, sizes, repeats):
+    """Times every case and size, keeping the fastest of several repeats."""
+    results = {}
+    for name in cases:
+        for size in sizes:
+            run, ops = CASES[name](size)
+            loops = _loops_for(size)
+            best = min(run(loops) for _ in range(repeats))
+            results[f"{name}[{size}]"] = {
+                "case": name,
+                "size": size,
+                "ops_per_loop": ops,
+                "loops": loops,
+                "seconds": best,
+                "ns_per_op": best / (loops * ops) * 1e9,
+            }
+            print(f"{name:>22} [{size:>9}] {results[f'{name}[{size}]']['ns_per_op']:>12.1f} ns/op",
+                  file=sys.stderr)
+    return results
+
+
+def run_pyperf():
+    """Hands the same cases to pyperf, which manages processes and statistics."""
+    import pyperf
+
+    def add_cmdline_args(cmd, args):
+        cmd.extend(["--pyperf", "--cases", *args.cases, "--sizes", *map(str, args.sizes)])
+
+    runner = pyperf.Runner(add_cmdline_args=add_cmdline_args)
+    runner.argparser.add_argument("--pyperf", action="store_true")
+    runner.argparser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES))
+    runner.argparser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES))
+    args = runner.parse_args()
+    for name in args.cases:
+        for size in args.sizes:
+            run, ops = CASES[name](size)
+            runner.bench_time_func(f"{name}[{size}]", run, inner_loops=ops)
+
+
+def compare(results, baseline, threshold):
+    """Lists the cases that got slower than the baseline by more than threshold."""
+    regressions = []
+    for key, result in results.items():
+        before = baseline.get("results", {}).get(key)
+        if before is None:
+            continue
+        ratio = result["ns_per_op"] / before["ns_per_op"]
+        if ratio > 1 + threshold:
+            regressions.append((key, before["ns_per_op"], result["ns_per_op"], ratio))
+    return regressions
+
+
+def main(argv=None) -> int:
+    if "--pyperf" in (sys.argv[1:] if argv is None else argv):
+        # pyperf parses its own options (JSON output, comparisons, workers).
+        run_pyperf()
+        return 0
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", help="write JSON results here instead of stdout")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="flag cases more than this fraction slower than the baseline")
+    parser.add_argument("--pyperf", action="store_true",
+                        help="run through pyperf instead; pyperf options then apply (e.g. -o)")
+    args = parser.parse_args(argv)
+
+    results = run_stdlib(args.cases, args.sizes, args.repeats)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "repeats": args.repeats,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        for key, before, after, ratio in regressions:
+            print(f"REGRESSION {key}: {before:.1f} -> {after:.1f} ns/op ({ratio:.2f}x)", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Measure the uid normalisation cache on duplicate-heavy input.
+
+Run from the repository root: python bench/uid_cache_bench.py [events] [players]
+
+The input mimics an event log: each event names one of a smaller set of
+players, skewed towards the most active, and every uid is a freshly parsed
+string. The uncached baseline normalises like PlayerUID did before the cache.
+"""
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from player import IntUIDPlayer, Player, PlayerUID
+from player_list import PlayerList
+from player_node import PlayerNode
+
+
+class UncachedUID(PlayerUID):
+    """The baseline: PlayerUID.__set__ as it was before the cache."""
+
+    def __set__(self, instance, value):
+        if not isinstance(value, str):
+            raise TypeError("Player UID must be a string.")
+        int_value = int(value.strip())
+        if int_value <= 0:
+            raise ValueError("Player UID must be a positive integer")
+        setattr(instance, self.name, str(int_value))
+
+
+class UncachedPlayer(Player):
+    __slots__ = ()
+
+    uid = UncachedUID()
+
+
+def timed_build(make, raws) -> tuple:
+    """Builds one player per raw uid; returns (players, seconds, bytes retained)."""
+    gc.collect()
+    start = time.perf_counter()
+    players = [make(raw, "P") for raw in raws]
+    seconds = time.perf_counter() - start
+    del players
+    gc.collect()
+    tracemalloc.start()
+    players = [make(raw, "P") for raw in raws]
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return players, seconds, retained
+
+
+def main() -> None:
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    population = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    rng = random.Random(1)
+    # Pareto-skewed activity, and a few padded ids as seen in hand-edited files.
+    picks = [min(int(rng.paretovariate(0.4)), population) for _ in range(events)]
+    raws = ["".join([" " if uid % 7 == 0 else "", "0" if uid % 11 == 0 else "", str(uid)])
+            for uid in picks]
+    print(f"{events:,} events over {len(set(picks)):,} distinct players")
+
+    players, seconds, retained = timed_build(UncachedPlayer, raws)
+    print(f"uncached   {seconds * 1e3:8.1f} ms  {retained / 2**20:6.1f} MiB  "
+          f"{len({id(p.uid) for p in players}):,} uid objects")
+
+    Player.uid.cache_clear()
+    players, seconds, retained = timed_build(Player, raws)
+    info = Player.uid.cache_info()["str"]
+    print(f"cached     {seconds * 1e3:8.1f} ms  {retained / 2**20:6.1f} MiB  "
+          f"{len({id(p.uid) for p in players}):,} uid objects  "
+          f"hit rate {info.hits / (info.hits + info.misses):.1%}")
+
+    int_players, seconds, retained = timed_build(IntUIDPlayer, raws)
+    print(f"int uid    {seconds * 1e3:8.1f} ms  {retained / 2**20:6.1f} MiB")
+
+    keys = [str(uid) for uid in range(1, population + 1)]
+    str_list = PlayerList.from_iterable(PlayerNode(Player(key, "P")) for key in keys)
+    int_list = PlayerList.from_iterable(PlayerNode(IntUIDPlayer(key, "P")) for key in keys)
+    lookups = [rng.randint(1, population) for _ in range(200_000)]
+    str_lookups = [str(uid) for uid in lookups]
+    for label, player_list, queries in (("str keys", str_list, str_lookups),
+                                        ("int keys", int_list, lookups)):
+        find = player_list.find_node_with_key
+        start = time.perf_counter()
+        for key in queries:
+            find(key)
+        print(f"find_node_with_key, {label}: {(time.perf_counter() - start) / len(queries) * 1e9:.0f} ns/op")
+
+
+if __name__ == "__main__":
+    main()
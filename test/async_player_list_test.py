@@ -0,0 +1,122 @@
+import asyncio
+import contextlib
+import io
+import unittest
+from async_player_list import AsyncPlayerList
+from roster_server import serve
+from helpers import make_node
+
+
+class TestAsyncPlayerList(unittest.IsolatedAsyncioTestCase):
+    """Tests for the asyncio facade and the roster server."""
+
+    async def test_async_operations(self):
+        """Tests async inserts, lookups, deletes and iteration."""
+        player_list = AsyncPlayerList(yield_every=2)
+        await player_list.extend(make_node(uid) for uid in range(1, 6))
+        await player_list.insert_at_head(make_node(9))
+        await player_list.insert_at_tail(make_node(10))
+        self.assertEqual((await player_list.find_node_with_key("3")).name, "Player 3")
+        self.assertTrue(await player_list.delete_node_with_key("3"))
+        self.assertNotIn("3", player_list)
+        self.assertEqual([node.key async for node in player_list], ["9", "1", "2", "4", "5", "10"])
+        self.assertEqual([node.key async for node in player_list.reversed()],
+                         ["10", "5", "4", "2", "1", "9"])
+
+    async def test_iteration_yields_to_other_tasks(self):
+        """Tests a long iteration lets other coroutines run between batches."""
+        player_list = AsyncPlayerList((make_node(uid) for uid in range(1, 101)), yield_every=10)
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        async for _ in player_list:
+            pass
+        task.cancel()
+        self.assertGreaterEqual(len(ticks), 10)
+
+    async def test_iteration_does_not_block_writers(self):
+        """Tests the loop body may write to the list it iterates."""
+        player_list = AsyncPlayerList((make_node(uid) for uid in range(1, 6)), yield_every=2)
+
+        async def drain():
+            async for node in player_list:
+                await player_list.delete_node_with_key(node.key)
+            async for node in player_list.reversed():
+                pass
+            await player_list.insert_at_tail(make_node(9))
+
+        await asyncio.wait_for(drain(), timeout=1)
+        self.assertEqual([node.key async for node in player_list], ["9"])
+
+    async def test_display_matches_player_list_format(self):
+        """Tests display prints the same line as PlayerList.display."""
+        player_list = AsyncPlayerList((make_node(uid) for uid in range(1, 4)), yield_every=2)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            await player_list.display(forward=False)
+            await AsyncPlayerList().display()
+        self.assertEqual(output.getvalue(),
+                         "3'Player 3' -> 2'Player 2' -> 1'Player 1'\nEmpty list\n")
+
+    async def test_display_yields_to_other_tasks(self):
+        """Tests display hands control back to the loop between pieces of output."""
+        player_list = AsyncPlayerList((make_node(uid) for uid in range(1, 101)), yield_every=10)
+        events = []
+
+        async def ticker():
+            while True:
+                events.append("tick")
+                await asyncio.sleep(0)
+
+        class Recorder(io.StringIO):
+            def write(self, text):
+                events.append("write")
+                return super().write(text)
+
+        output = Recorder()
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        with contextlib.redirect_stdout(output):
+            await player_list.display()
+        task.cancel()
+        self.assertEqual(output.getvalue().count(" -> "), 99)
+        first, last = events.index("write"), len(events) - events[::-1].index("write")
+        self.assertGreaterEqual(events[first:last].count("tick"), 9)
+
+    async def test_iteration_reads_a_released_snapshot(self):
+        """Tests iteration sees the list as it started and drops its view when done."""
+        player_list = AsyncPlayerList((make_node(uid) for uid in range(1, 6)), yield_every=2)
+        seen = []
+        async for node in player_list:
+            if node.key == "1":
+                await player_list.delete_node_with_key("5")
+                await player_list.insert_at_head(make_node(9))
+            seen.append(node.key)
+        self.assertEqual(seen, ["1", "2", "3", "4", "5"])
+        self.assertEqual([node.key async for node in player_list.reversed()], ["4", "3", "2", "1", "9"])
+        await player_list.delete_node_with_key("9")
+        self.assertIsNone(player_list._list._histories)
+
+    async def test_server_round_trip(self):
+        """Tests the line protocol over a localhost connection."""
+        server = await serve(AsyncPlayerList())
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        responses = []
+        for request in ("ADD 7 James Bond", "ADD x Nobody", "FIND 7", "LEN", "DEL 7", "FIND 7", "NOPE"):
+            writer.write(request.encode() + b"\n")
+            responses.append((await reader.readline()).decode().rstrip("\n"))
+        writer.close()
+        await writer.wait_closed()
+        server.close()
+        await server.wait_closed()
+        self.assertEqual(responses[0], "OK")
+        self.assertTrue(responses[1].startswith("ERR"))
+        self.assertEqual(responses[2:6], ["OK 7 James Bond", "OK 1", "OK", "NOT_FOUND"])
+        self.assertTrue(responses[6].startswith("ERR"))
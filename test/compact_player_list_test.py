@@ -0,0 +1,118 @@
+import unittest
+from compact_player_list import CompactPlayerList
+from player_node import PlayerNode
+from player import IntUIDPlayer, Player
+
+
+class TestCompactPlayerList(unittest.TestCase):
+    """Tests for the struct-of-arrays CompactPlayerList."""
+
+    def setUp(self):
+        """Initialize test fixtures before each test method."""
+        self.player_list = CompactPlayerList()
+        self.node1 = PlayerNode(Player("20", "John Smith"))
+        self.node2 = PlayerNode(Player("23", "Stephen Curry"))
+        self.node3 = PlayerNode(Player("42", "Douglas Adams"))
+
+    def test_new_list_is_empty(self):
+        """Tests initialization of an empty list."""
+        self.assertTrue(self.player_list.is_empty)
+        self.assertEqual(self.player_list.length, 0)
+        self.assertIsNone(self.player_list.head)
+        self.assertIsNone(self.player_list.tail)
+
+    def test_inserts_preserve_order(self):
+        """Tests head, tail and positional inserts."""
+        self.player_list.insert_at_tail(self.node1)
+        self.player_list.insert_at_head(self.node2)
+        self.player_list.insert_at_position(self.node3, 1)
+
+        self.assertEqual([node.key for node in self.player_list], ["23", "42", "20"])
+        self.assertEqual([node.key for node in reversed(self.player_list)], ["20", "42", "23"])
+        self.assertEqual(self.player_list.head.name, "Stephen Curry")
+        self.assertEqual(self.player_list.tail.name, "John Smith")
+        self.assertEqual(self.player_list.length, 3)
+
+    def test_deletes_and_slot_reuse(self):
+        """Tests deletes keep links consistent and freed slots are recycled."""
+        self.player_list.insert_at_tail(self.node1)
+        self.player_list.insert_at_tail(self.node2)
+        self.player_list.insert_at_tail(self.node3)
+
+        self.assertTrue(self.player_list.delete_node_with_key("23"))
+        self.assertFalse(self.player_list.delete_node_with_key("23"))
+        self.player_list.delete_head()
+        self.assertEqual([node.key for node in self.player_list], ["42"])
+
+        self.player_list.insert_at_head(PlayerNode(Player("7", "Bond")))
+        self.assertEqual(len(self.player_list._uids), 3)
+        self.player_list.delete_tail()
+        self.assertEqual(self.player_list.head.key, "7")
+        self.assertEqual(self.player_list.tail.key, "7")
+
+    def test_find_and_contains(self):
+        """Tests keyed lookups and duplicate rejection."""
+        self.player_list.insert_at_tail(self.node1)
+        self.assertIn("20", self.player_list)
+        self.assertEqual(self.player_list.find_node_with_key("20").name, "John Smith")
+        self.assertIsNone(self.player_list.find_node_with_key("1"))
+        with self.assertRaises(ValueError):
+            self.player_list.insert_at_tail(PlayerNode(Player("20", "Someone Else")))
+
+    def test_delete_from_empty_list_raises(self):
+        """Tests deleting from an empty list."""
+        with self.assertRaises(IndexError):
+            self.player_list.delete_head()
+        with self.assertRaises(IndexError):
+            self.player_list.delete_tail()
+
+    def test_non_canonical_keys_are_not_found(self):
+        """Tests keys only match the canonical uid string, like PlayerList."""
+        self.player_list.insert_at_tail(self.node1)
+        self.assertNotIn("020", self.player_list)
+        self.assertNotIn(" 20", self.player_list)
+        self.assertFalse(self.player_list.delete_node_with_key("+20"))
+
+    def test_nodes_are_linked_views(self):
+        """Tests handed-out nodes walk the list and go invalid once deleted."""
+        self.player_list.extend([self.node1, self.node2, self.node3])
+        head = self.player_list.head
+        self.assertEqual(head.next.key, "23")
+        self.assertEqual(head.next.next.name, "Douglas Adams")
+        self.assertIsNone(head.prev)
+        self.assertEqual(self.player_list.tail.prev.player.name, "Stephen Curry")
+        self.player_list.delete_node_with_key("23")
+        self.assertEqual(head.next.key, "42")
+        middle = self.player_list.find_node_with_key("42")
+        self.player_list.delete_tail()
+        with self.assertRaises(ValueError):
+            middle.name
+        self.assertEqual(middle.key, "42")
+
+    def test_batch_operations(self):
+        """Tests from_iterable, extend, find_many and delete_many."""
+        player_list = CompactPlayerList.from_iterable([self.node1, self.node2])
+        with self.assertRaises(ValueError):
+            player_list.extend([self.node3, PlayerNode(Player("20", "Clash"))])
+        self.assertEqual(player_list.length, 2)
+        found = player_list.find_many(["20", "99"])
+        self.assertEqual((found["20"].name, found["99"]), ("John Smith", None))
+        self.assertEqual(player_list.delete_many(["20", "20", "99"]), {"20": True, "99": False})
+        self.assertEqual([node.key for node in player_list], ["23"])
+
+    def test_uid_must_fit_in_64_bits(self):
+        """Tests oversized uids raise ValueError instead of OverflowError."""
+        with self.assertRaises(ValueError):
+            self.player_list.insert_at_tail(PlayerNode(Player(str(2 ** 63), "Too Big")))
+        self.player_list.insert_at_tail(PlayerNode(Player(str(2 ** 63 - 1), "Biggest")))
+        self.assertIn(str(2 ** 63 - 1), self.player_list)
+
+    def test_int_keys_are_refused(self):
+        """Tests IntUIDPlayer nodes are refused at insert rather than becoming unfindable."""
+        node = PlayerNode(IntUIDPlayer("7", "Bond"))
+        for insert in (self.player_list.insert_at_head, self.player_list.insert_at_tail,
+                       lambda node: self.player_list.extend([node])):
+            with self.assertRaises(ValueError):
+                insert(node)
+        self.assertTrue(self.player_list.is_empty)
+        self.assertIsNone(self.player_list.find_node_with_key(7))
@@ -0,0 +1,87 @@
+import threading
+import unittest
+from concurrent_player_list import ConcurrentPlayerList
+from helpers import make_node
+
+
+class TestConcurrentPlayerList(unittest.TestCase):
+    """Tests for the thread-safe ConcurrentPlayerList."""
+
+    def test_basic_operations_delegate_to_player_list(self):
+        """Tests the single-threaded behaviour matches PlayerList."""
+        player_list = ConcurrentPlayerList([make_node(1)])
+        player_list.insert_at_tail(make_node(2))
+        player_list.insert_at_head(make_node(3))
+        player_list.insert_at_position(make_node(4), 1)
+        self.assertEqual([node.key for node in player_list], ["3", "4", "1", "2"])
+        self.assertEqual([node.key for node in reversed(player_list)], ["2", "1", "4", "3"])
+        self.assertIn("4", player_list)
+        self.assertTrue(player_list.delete_node_with_key("4"))
+        player_list.delete_head()
+        player_list.delete_tail()
+        self.assertEqual(player_list.head.key, "1")
+        self.assertEqual(player_list.length, 1)
+
+    def test_iteration_is_snapshot_consistent(self):
+        """Tests writes made during iteration do not affect the running iterator."""
+        player_list = ConcurrentPlayerList(make_node(uid) for uid in range(1, 6))
+        seen = []
+        for node in player_list:
+            seen.append(node.key)
+            if node.key == "2":
+                player_list.delete_node_with_key("3")
+                player_list.insert_at_tail(make_node(6))
+        self.assertEqual(seen, ["1", "2", "3", "4", "5"])
+        self.assertEqual([node.key for node in player_list], ["1", "2", "4", "5", "6"])
+
+    def test_iteration_releases_its_snapshot(self):
+        """Tests iterating holds no lock between nodes and drops its view when done."""
+        player_list = ConcurrentPlayerList(make_node(uid) for uid in range(1, 6))
+        for _ in player_list:
+            self.assertFalse(player_list._write_lock.locked())
+        self.assertEqual([node.key for node in reversed(player_list)], ["5", "4", "3", "2", "1"])
+        player_list.delete_head()
+        self.assertIsNone(player_list._list._histories)
+
+    def test_stress_mixed_operations_keep_list_consistent(self):
+        """Tests concurrent inserts, lookups and deletes leave a well-formed list."""
+        player_list = ConcurrentPlayerList()
+        threads_count = 8
+        per_thread = 500
+        errors = []
+
+        def worker(offset: int) -> None:
+            try:
+                for i in range(per_thread):
+                    uid = offset * per_thread + i + 1
+                    if i % 2:
+                        player_list.insert_at_head(make_node(uid))
+                    else:
+                        player_list.insert_at_tail(make_node(uid))
+                    self.assertIsNotNone(player_list.find_node_with_key(str(uid)))
+                    if i % 3 == 0:
+                        self.assertTrue(player_list.delete_node_with_key(str(uid)))
+                    list(player_list)
+            except Exception as error:  # surfaced to the main thread below
+                errors.append(error)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(threads_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        expected = threads_count * (per_thread - len(range(0, per_thread, 3)))
+        forward = [node.key for node in player_list]
+        self.assertEqual(len(forward), expected)
+        self.assertEqual(player_list.length, expected)
+        self.assertEqual(forward[::-1], [node.key for node in reversed(player_list)])
+
+    def test_lookups_do_not_wait_for_writers(self):
+        """Tests lookups proceed while a writer holds the lock."""
+        player_list = ConcurrentPlayerList([make_node(1)])
+        with player_list._write_lock:
+            self.assertEqual(player_list.find_node_with_key("1").key, "1")
+            self.assertIn("1", player_list)
+            self.assertEqual(player_list.length, 1)
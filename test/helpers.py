@@ -0,0 +1,13 @@
+from __future__ import annotations
+from player import Player
+from player_node import PlayerNode
+
+
+def make_player(uid: int, name: str | None = None) -> Player:
+    """Builds a player for tests, named "Player <uid>" unless a name is given."""
+    return Player(str(uid), name or f"Player {uid}")
+
+
+def make_node(uid: int, name: str | None = None) -> PlayerNode:
+    """Builds a node holding make_player(uid, name)."""
+    return PlayerNode(make_player(uid, name))
@@ -0,0 +1,75 @@
+import random
+import unittest
+from indexed_player_list import IndexedPlayerList
+from helpers import make_node
+
+
+class TestIndexedPlayerList(unittest.TestCase):
+    """Tests for the skip list backed IndexedPlayerList."""
+
+    def setUp(self):
+        """Initialize test fixtures before each test method."""
+        self.player_list = IndexedPlayerList.from_iterable(make_node(uid) for uid in range(1, 6))
+
+    def assert_order(self, keys):
+        """Checks keys, links, length and positional access all agree."""
+        self.assertEqual([node.key for node in self.player_list], keys)
+        self.assertEqual([node.key for node in reversed(self.player_list)], keys[::-1])
+        self.assertEqual([node.key for node in self.player_list[:]], keys)
+        self.assertEqual(len(self.player_list), len(keys))
+        for position, key in enumerate(keys):
+            self.assertEqual(self.player_list.index_of(key), position)
+
+    def test_getitem_and_slicing(self):
+        """Tests positional reads."""
+        self.assertEqual(self.player_list[0].key, "1")
+        self.assertEqual(self.player_list[-1].key, "5")
+        self.assertEqual([node.key for node in self.player_list[1:4]], ["2", "3", "4"])
+        self.assertEqual([node.key for node in self.player_list[::-2]], ["5", "3", "1"])
+        self.assertEqual(self.player_list[10:], [])
+        with self.assertRaises(IndexError):
+            self.player_list[5]
+
+    def test_inserts_keep_positions(self):
+        """Tests head, tail and positional inserts."""
+        self.player_list.insert_at_position(make_node(10), 2)
+        self.player_list.insert_at_head(make_node(11))
+        self.player_list.insert_at_tail(make_node(12))
+        self.player_list.extend_left([make_node(13)])
+        self.assert_order(["13", "11", "1", "2", "10", "3", "4", "5", "12"])
+        with self.assertRaises(IndexError):
+            self.player_list.insert_at_position(make_node(14), 100)
+
+    def test_deletes_keep_positions(self):
+        """Tests positional, keyed, head and tail deletes."""
+        del self.player_list[1]
+        self.assertTrue(self.player_list.delete_node_with_key("4"))
+        self.assertFalse(self.player_list.delete_node_with_key("4"))
+        self.assert_order(["1", "3", "5"])
+        del self.player_list[-1]
+        self.player_list.delete_head()
+        self.assert_order(["3"])
+        del self.player_list[:]
+        self.assert_order([])
+        self.assertTrue(self.player_list.is_empty)
+
+    def test_delete_many_keeps_positions(self):
+        """Tests batch deletes keep the skip list in step."""
+        self.assertEqual(self.player_list.delete_many(["2", "9", "5", "2"]),
+                         {"2": True, "9": False, "5": True})
+        self.assert_order(["1", "3", "4"])
+
+    def test_matches_python_list_under_random_operations(self):
+        """Tests random positional inserts and deletes against a plain list."""
+        rng = random.Random(7)
+        expected = [node.key for node in self.player_list]
+        for uid in range(100, 400):
+            if expected and rng.random() < 0.3:
+                position = rng.randrange(len(expected))
+                del self.player_list[position]
+                del expected[position]
+            else:
+                position = rng.randint(0, len(expected))
+                self.player_list.insert_at_position(make_node(uid), position)
+                expected.insert(position, str(uid))
+        self.assert_order(expected)
@@ -0,0 +1,91 @@
+import unittest
+from matchmaking_queue import MatchmakingQueue
+from helpers import make_player
+
+
+def uids(group) -> list:
+    return [player.uid for player in group]
+
+
+class TestMatchmakingQueue(unittest.TestCase):
+    """Tests for the MatchmakingQueue group-forming queue."""
+
+    def test_groups_form_in_arrival_order(self):
+        """Tests an unbucketed queue hands out the longest-waiting players first."""
+        queue = MatchmakingQueue(group_size=2)
+        for uid in range(1, 6):
+            queue.join(make_player(uid))
+        self.assertEqual(uids(queue.dequeue()), ["1", "2"])
+        self.assertEqual([uids(group) for group in queue.dequeue_many()], [["3", "4"]])
+        self.assertIsNone(queue.dequeue())
+        self.assertEqual(len(queue), 1)
+        self.assertIn("5", queue)
+        self.assertEqual(queue.stats(), {"queued": 1, "buckets": 1, "groups": 2, "matched": 4, "cancelled": 0})
+
+    def test_cancel_and_rejoin(self):
+        """Tests cancelling removes a player anywhere in the queue and allows rejoining."""
+        queue = MatchmakingQueue(group_size=3)
+        for uid in range(1, 5):
+            queue.join(make_player(uid))
+        self.assertTrue(queue.cancel("2"))
+        self.assertFalse(queue.cancel("2"))
+        self.assertIsNone(queue.wait_time("2"))
+        with self.assertRaises(ValueError):
+            queue.join(make_player(1))
+        queue.join(make_player(2))
+        self.assertEqual(uids(queue.dequeue()), ["1", "3", "4"])
+        self.assertEqual(queue.dequeue_many(max_groups=5), [])
+        self.assertEqual(queue.stats()["cancelled"], 1)
+
+    def test_buckets_group_nearest_skill(self):
+        """Tests a bucketed queue only groups players within max_spread buckets."""
+        queue = MatchmakingQueue(group_size=2, bucket_width=100, max_spread=1)
+        queue.join(make_player(1), 1000)
+        queue.join(make_player(2), 1500)
+        queue.join(make_player(3), 1280)
+        queue.join(make_player(4), 1050)
+        self.assertEqual(uids(queue.dequeue()), ["1", "4"])
+        # 1500 and 1280 are two buckets apart: no group until someone nearer joins.
+        self.assertIsNone(queue.dequeue())
+        queue.join(make_player(5), 1450)
+        self.assertEqual(uids(queue.dequeue()), ["2", "5"])
+        self.assertEqual(queue.stats()["buckets"], 1)
+        self.assertIn("3", queue)
+
+    def test_nearest_bucket_is_drawn_first(self):
+        """Tests a group fills from the anchor's bucket, then the nearest ones."""
+        queue = MatchmakingQueue(group_size=3, bucket_width=10, max_spread=2)
+        queue.join(make_player(1), 50)
+        queue.join(make_player(2), 70)
+        queue.join(make_player(3), 62)
+        queue.join(make_player(4), 55)
+        self.assertEqual(uids(queue.dequeue()), ["1", "4", "3"])
+
+    def test_longest_waiting_matchable_player_anchors(self):
+        """Tests an unmatchable player does not block groups formed behind them."""
+        queue = MatchmakingQueue(group_size=2, bucket_width=10, max_spread=0)
+        queue.join(make_player(1), 0)
+        queue.join(make_player(2), 50)
+        queue.join(make_player(3), 90)
+        queue.join(make_player(4), 55)
+        queue.join(make_player(5), 95)
+        self.assertEqual([uids(group) for group in queue.dequeue_many()], [["2", "4"], ["3", "5"]])
+        self.assertIn("1", queue)
+
+    def test_wait_time_and_validation(self):
+        """Tests wait times follow the clock and bad arguments are rejected."""
+        now = [10.0]
+        queue = MatchmakingQueue(group_size=2, bucket_width=50, clock=lambda: now[0])
+        queue.join(make_player(1), 20)
+        now[0] = 12.5
+        self.assertEqual(queue.wait_time("1"), 2.5)
+        with self.assertRaises(ValueError):
+            queue.join(make_player(2))
+        for options in ({"group_size": 0}, {"group_size": 2, "bucket_width": 0},
+                        {"group_size": 2, "max_spread": -1}):
+            with self.assertRaises(ValueError):
+                MatchmakingQueue(**options)
+
+
+if __name__ == "__main__":
+    unittest.main()
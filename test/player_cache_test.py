@@ -0,0 +1,76 @@
+import unittest
+from player_cache import LRUPlayerCache
+from player import Player
+
+
+class FakeClock:
+    """A controllable time source for ttl tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUPlayerCache(unittest.TestCase):
+    """Tests for the LRUPlayerCache."""
+
+    def setUp(self):
+        """Initialize test fixtures before each test method."""
+        self.evicted = []
+        self.clock = FakeClock()
+        self.cache = LRUPlayerCache(3, on_evict=lambda player, reason: self.evicted.append((player.uid, reason)))
+        for uid in ("1", "2", "3"):
+            self.cache.put(Player(uid, f"Player {uid}"))
+
+    def test_evicts_least_recently_used(self):
+        """Tests get and touch protect entries from eviction."""
+        self.assertEqual(self.cache.get("1").name, "Player 1")
+        self.assertTrue(self.cache.touch("2"))
+        self.cache.put(Player("4", "Player 4"))
+        self.assertEqual(self.evicted, [("3", "capacity")])
+        self.assertEqual([player.uid for player in self.cache], ["4", "2", "1"])
+        self.assertNotIn("3", self.cache)
+        self.assertEqual(len(self.cache), 3)
+
+    def test_put_replaces_existing_entry(self):
+        """Tests putting a cached uid refreshes it without growing the cache."""
+        self.cache.put(Player("1", "Renamed"))
+        self.assertEqual(len(self.cache), 3)
+        self.assertEqual(self.cache.get("1").name, "Renamed")
+        self.assertEqual(self.evicted, [])
+
+    def test_statistics(self):
+        """Tests hit and miss counting."""
+        self.cache.get("1")
+        self.cache.get("9")
+        "2" in self.cache
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["hit_rate"]), (1, 1, 0.5))
+        self.assertTrue(self.cache.invalidate("2"))
+        self.assertFalse(self.cache.invalidate("2"))
+        self.assertEqual(self.cache.stats()["size"], 2)
+
+    def test_ttl_expiry(self):
+        """Tests entries expire lazily and through purge_expired."""
+        cache = LRUPlayerCache(10, ttl=5, clock=self.clock,
+                               on_evict=lambda player, reason: self.evicted.append((player.uid, reason)))
+        cache.put(Player("1", "Amy"))
+        self.clock.now = 3
+        cache.put(Player("2", "Ben"))
+        self.clock.now = 6
+        self.assertNotIn("1", cache)
+        self.assertIsNone(cache.get("1"))
+        self.assertEqual(cache.get("2").name, "Ben")
+        self.clock.now = 9
+        self.assertEqual(cache.purge_expired(), 1)
+        self.assertEqual(self.evicted, [("1", "expired"), ("2", "expired")])
+        self.assertEqual(cache.stats()["expirations"], 2)
+
+    def test_rejects_bad_configuration(self):
+        """Tests capacity and ttl validation."""
+        with self.assertRaises(ValueError):
+            LRUPlayerCache(0)
+        with self.assertRaises(ValueError):
+            LRUPlayerCache(1, ttl=0)
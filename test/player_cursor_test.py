@@ -0,0 +1,60 @@
+import unittest
+from player_list import PlayerList
+from helpers import make_node
+
+
+class TestPlayerCursor(unittest.TestCase):
+    """Tests for the PlayerCursor O(1) editing API."""
+
+    def setUp(self):
+        """Initialize test fixtures before each test method."""
+        self.player_list = PlayerList.from_iterable(make_node(uid) for uid in range(1, 4))
+
+    def keys(self):
+        keys = [node.key for node in self.player_list]
+        self.assertEqual([node.key for node in reversed(self.player_list)], keys[::-1])
+        self.assertEqual(self.player_list.length, len(keys))
+        return keys
+
+    def test_moves_and_inserts_around_cursor(self):
+        """Tests movement and inserts on both sides keep the cursor in place."""
+        cursor = self.player_list.cursor()
+        self.assertFalse(cursor.move_prev())
+        cursor.insert_before(make_node(10))
+        self.assertTrue(cursor.move_next())
+        cursor.insert_after(make_node(11))
+        cursor.insert_before(make_node(12))
+        self.assertEqual(cursor.node.key, "2")
+        self.assertEqual(self.keys(), ["10", "1", "12", "2", "11", "3"])
+        self.assertEqual(self.player_list.head.key, "10")
+        with self.assertRaises(ValueError):
+            cursor.insert_after(make_node(1))
+
+    def test_remove_moves_to_neighbour(self):
+        """Tests removal lands on the next node, or the previous at the tail."""
+        cursor = self.player_list.cursor(self.player_list.find_node_with_key("2"))
+        self.assertEqual(cursor.remove().key, "2")
+        self.assertEqual(cursor.node.key, "3")
+        cursor.remove()
+        self.assertEqual(cursor.node.key, "1")
+        cursor.remove()
+        self.assertIsNone(cursor.node)
+        self.assertTrue(self.player_list.is_empty)
+        cursor.insert_after(make_node(5))
+        self.assertEqual((cursor.node.key, self.keys()), ("5", ["5"]))
+
+    def test_cursor_invalidated_by_outside_delete(self):
+        """Tests a cursor whose node was deleted elsewhere refuses to edit."""
+        cursor = self.player_list.cursor(self.player_list.tail)
+        self.player_list.delete_tail()
+        self.assertFalse(cursor.is_valid)
+        with self.assertRaises(ValueError):
+            cursor.remove()
+        cursor.move_to(self.player_list.head)
+        self.assertTrue(cursor.is_valid)
+        with self.assertRaises(ValueError):
+            cursor.move_to(make_node(1))
+
+
+if __name__ == '__main__':
+    unittest.main()
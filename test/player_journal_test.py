@@ -0,0 +1,148 @@
+import glob
+import os
+import tempfile
+import unittest
+from indexed_player_list import IndexedPlayerList
+from player import IntUIDPlayer, Player
+from player_journal import PlayerJournal
+from player_list import PlayerList
+from player_node import PlayerNode
+from player_snapshot import MappedPlayerList
+from helpers import make_node
+
+
+class TestPlayerJournal(unittest.TestCase):
+    """Tests for the PlayerList write-ahead journal."""
+
+    def setUp(self):
+        """Initialize test fixtures before each test method."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "roster.journal")
+
+    def keys(self, player_list):
+        return [node.key for node in player_list]
+
+    def mutate(self, player_list):
+        """Applies one of every journaled operation."""
+        player_list.extend([make_node(uid) for uid in range(1, 6)])
+        player_list.extend_left([make_node(10), make_node(11)])
+        player_list.insert_at_head(make_node(20))
+        player_list.insert_at_tail(make_node(21))
+        player_list.insert_at_position(make_node(22), 4)
+        player_list.insert_after(player_list.find_node_with_key("3"), make_node(23))
+        player_list.delete_head()
+        player_list.delete_tail()
+        player_list.delete_node_with_key("2")
+        player_list.delete_many(["4", "99"])
+
+    def test_replay_restores_every_operation(self):
+        """Tests a reopened journal rebuilds the same list, for each fsync policy."""
+        for policy in ("always", "batch", "never"):
+            path = f"{self.path}.{policy}"
+            with PlayerList.open_journal(path, fsync=policy, group_size=3) as journal:
+                self.mutate(journal.player_list)
+                expected = self.keys(journal.player_list)
+            with PlayerList.open_journal(path) as journal:
+                self.assertEqual(self.keys(journal.player_list), expected)
+                self.assertEqual(journal.player_list.find_node_with_key("23").name, "Player 23")
+
+    def test_torn_tail_is_discarded(self):
+        """Tests a record cut short by a crash is dropped and the log stays appendable."""
+        with PlayerJournal(self.path, fsync="always") as journal:
+            journal.player_list.extend([make_node(1), make_node(2)])
+            log = f"{self.path}.{journal.generation}.log"
+        with open(log, "r+b") as file:
+            file.truncate(os.path.getsize(log) - 3)
+        with PlayerJournal(self.path) as journal:
+            self.assertEqual(self.keys(journal.player_list), ["1"])
+            journal.player_list.insert_at_tail(make_node(3))
+        with PlayerJournal(self.path) as journal:
+            self.assertEqual(self.keys(journal.player_list), ["1", "3"])
+
+    def test_compaction(self):
+        """Tests compaction folds the log into a snapshot without losing later writes."""
+        with PlayerJournal(self.path) as journal:
+            self.mutate(journal.player_list)
+            journal.compact()
+            journal.player_list.insert_at_head(make_node(30))
+            expected = self.keys(journal.player_list)
+            journal.wait_for_compaction()
+            self.assertEqual(journal.generation, 2)
+        self.assertEqual(sorted(os.path.basename(name) for name in glob.glob(f"{self.path}.*")),
+                         ["roster.journal.2.log", "roster.journal.2.snapshot"])
+        with PlayerJournal(self.path, player_list_class=IndexedPlayerList) as journal:
+            self.assertIsInstance(journal.player_list, IndexedPlayerList)
+            self.assertEqual(self.keys(journal.player_list), expected)
+            self.assertEqual(journal.player_list.index_of("30"), 0)
+
+    def test_compaction_captures_values_not_nodes(self):
+        """Tests writes made while a snapshot is written in the background do not reach it."""
+        with PlayerJournal(self.path) as journal:
+            journal.player_list.extend([make_node(uid) for uid in range(1, 4)])
+            journal.compact()
+            node = journal.player_list.find_node_with_key("2")
+            node.player.name = "Renamed"
+            journal.player_list.delete_node_with_key("1")
+            journal.wait_for_compaction()
+            snapshot = f"{self.path}.{journal.generation}.snapshot"
+        with MappedPlayerList(snapshot) as saved:
+            self.assertEqual([(node.key, node.name) for node in saved],
+                             [("1", "Player 1"), ("2", "Player 2"), ("3", "Player 3")])
+
+    def test_uids_that_do_not_fit_are_refused_before_the_list_changes(self):
+        """Tests an unjournalable uid leaves the list and the journal in step."""
+        with PlayerJournal(self.path, fsync="always") as journal:
+            player_list = journal.player_list
+            player_list.insert_at_tail(make_node(1))
+            huge = PlayerNode(Player(str(2 ** 64), "Huge"))
+            for insert in (player_list.insert_at_tail, player_list.insert_at_head,
+                           lambda node: player_list.extend([make_node(2), node]),
+                           lambda node: player_list.insert_after(player_list.head, node)):
+                with self.assertRaises(ValueError):
+                    insert(huge)
+            other = PlayerList.from_iterable([make_node(3), huge])
+            with self.assertRaises(ValueError):
+                player_list.concat(other)
+            self.assertEqual(self.keys(player_list), ["1"])
+            self.assertEqual(self.keys(other), ["3", str(2 ** 64)])
+            player_list.insert_at_tail(make_node(2))
+        with PlayerJournal(self.path) as journal:
+            self.assertEqual(self.keys(journal.player_list), ["1", "2"])
+
+    def test_renames_survive_recovery(self):
+        """Tests renames of listed players are journaled, before and after compaction."""
+        with PlayerJournal(self.path) as journal:
+            journal.player_list.extend([make_node(1), make_node(2)])
+            journal.player_list.find_node_with_key("1").player.name = "Renamed"
+            journal.compact(wait=True)
+            journal.player_list.find_node_with_key("2").player.name = "Later"
+            Player("3", "Unlisted").name = "Ignored"
+        with PlayerJournal(self.path) as journal:
+            self.assertEqual([(node.key, node.name) for node in journal.player_list],
+                             [("1", "Renamed"), ("2", "Later")])
+
+    def test_int_uid_players_keep_int_keys(self):
+        """Tests a journal of IntUIDPlayer nodes recovers a list keyed by int."""
+        def int_node(uid):
+            return PlayerNode(IntUIDPlayer(str(uid), f"Player {uid}"))
+
+        with PlayerJournal(self.path, player_class=IntUIDPlayer) as journal:
+            journal.player_list.extend([int_node(1), int_node(2)])
+            journal.compact(wait=True)
+            journal.player_list.insert_at_tail(int_node(3))
+            journal.player_list.delete_node_with_key(1)
+            journal.player_list.find_node_with_key(3).player.name = "Three"
+        with PlayerList.open_journal(self.path, player_class=IntUIDPlayer) as journal:
+            self.assertEqual(self.keys(journal.player_list), [2, 3])
+            self.assertIsInstance(journal.player_list.head.player, IntUIDPlayer)
+            self.assertEqual(journal.player_list.find_node_with_key(3).name, "Three")
+
+    def test_rejects_unknown_policy(self):
+        """Tests the fsync policy is validated."""
+        with self.assertRaises(ValueError):
+            PlayerJournal(self.path, fsync="sometimes")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+import urllib.request
+from indexed_player_list import IndexedPlayerList
+from player_list import PlayerList
+from player_list_metrics import instrument, uninstrument
+from helpers import make_node
+
+
+class TestPlayerListMetrics(unittest.TestCase):
+    """Tests for the opt-in PlayerList instrumentation."""
+
+    def setUp(self):
+        """Initialize test fixtures before each test method."""
+        self.player_list = PlayerList.from_iterable(make_node(uid) for uid in range(1, 11))
+        self.metrics = instrument(self.player_list)
+
+    def test_counts_outermost_operations_only(self):
+        """Tests counters, traversal lengths and the length gauge."""
+        self.player_list.find_node_with_key("3")
+        self.player_list.delete_node_with_key("1")
+        self.player_list.insert_at_position(make_node(11), position=5)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.player_list.display()
+
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot["counters"], {
+            "find_node_with_key": 1, "delete_node_with_key": 1,
+            "insert_at_position": 1, "display": 1,
+        })
+        self.assertEqual(snapshot["traversed_nodes"]["insert_at_position"]["sum"], 4)
+        self.assertEqual(snapshot["traversed_nodes"]["display"]["sum"], 10)
+        self.assertEqual(snapshot["latency_seconds"]["display"]["count"], 1)
+        self.assertEqual(snapshot["length"], 10)
+
+    def test_uninstrument_restores_class_and_subclasses_keep_behaviour(self):
+        """Tests the class swap is reversible and works on PlayerList subclasses."""
+        uninstrument(self.player_list)
+        self.assertIs(type(self.player_list), PlayerList)
+        self.player_list.delete_head()
+        self.assertEqual(self.metrics.snapshot()["counters"], {})
+
+        indexed = IndexedPlayerList.from_iterable(make_node(uid) for uid in range(1, 4))
+        metrics = instrument(indexed)
+        self.assertIsInstance(indexed, IndexedPlayerList)
+        self.assertEqual(indexed[1].key, "2")
+        indexed.delete_node_with_key("2")
+        self.assertEqual(metrics.snapshot()["counters"], {"delete_node_with_key": 1})
+
+    def test_lists_built_by_an_instrumented_list_work(self):
+        """Tests split_at and from_iterable results start unrecorded and can be instrumented."""
+        rest = self.player_list.split_at(self.player_list.find_node_with_key("6"))
+        rest.delete_head()
+        self.assertEqual([node.key for node in rest], ["7", "8", "9", "10"])
+        built = type(self.player_list).from_iterable([make_node(20)])
+        built.insert_at_tail(make_node(21))
+        self.assertEqual(self.metrics.snapshot()["counters"], {"find_node_with_key": 1})
+        metrics = instrument(rest)
+        rest.delete_tail()
+        self.assertEqual(metrics.snapshot()["counters"], {"delete_tail": 1})
+        uninstrument(built)
+        self.assertIs(type(built), PlayerList)
+
+    def test_prometheus_exports(self):
+        """Tests the text format, the file writer and the HTTP endpoint."""
+        self.player_list.find_node_with_key("3")
+        text = self.metrics.to_prometheus()
+        self.assertIn('player_list_operations_total{operation="find_node_with_key"} 1', text)
+        self.assertIn('player_list_latency_seconds_bucket{operation="find_node_with_key",le="+Inf"} 1', text)
+        self.assertIn("player_list_length 10", text)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "roster.prom")
+            self.metrics.write_prometheus(path)
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(file.read(), text)
+
+        server = self.metrics.serve_prometheus()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.server_port}/metrics") as response:
+            self.assertIn("player_list_length 10", response.read().decode())
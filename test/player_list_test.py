@@ -1,4 +1,7 @@
+import contextlib
+import io
 import unittest
+from indexed_player_list import IndexedPlayerList
 from player_list import PlayerList
 from player_node import PlayerNode
 from player import Player
@@ -122,4 +125,198 @@ class TestPlayerList(unittest.TestCase):
         self.player_list.insert_at_tail(self.node3)
 
         self.player_list.display(False)
-        # Visually inspect printed output. (difficult to test)
\ No newline at end of file
+        # Visually inspect printed output. (difficult to test)
+
+    def test_render_streams_in_chunks_and_truncates(self):
+        """Tests render output, chunking, truncation and reverse order."""
+        self.player_list.extend(PlayerNode(Player(str(uid), f"P{uid}")) for uid in range(1, 8))
+
+        writes = []
+
+        class Recorder:
+            def write(self, text):
+                writes.append(text)
+
+        self.player_list.render(Recorder(), chunk_size=3)
+        self.assertEqual("".join(writes),
+                         "1'P1' -> 2'P2' -> 3'P3' -> 4'P4' -> 5'P5' -> 6'P6' -> 7'P7'\n")
+        self.assertEqual(len(writes), 3)
+
+        output = io.StringIO()
+        self.player_list.render(output, head=2, tail=2)
+        self.player_list.render(output, forward=False, head=1)
+        self.player_list.render(output, tail=1)
+        self.player_list.render(output, head=5, tail=5)
+        self.player_list.render(output, head=100, tail=3)
+        self.player_list.render(output, head=0, tail=100)
+        PlayerList().render(output)
+        self.assertEqual(output.getvalue().splitlines(), [
+            "1'P1' -> 2'P2' -> ...(3 more) -> 6'P6' -> 7'P7'",
+            "7'P7' -> ...(6 more)",
+            "...(6 more) -> 7'P7'",
+            "1'P1' -> 2'P2' -> 3'P3' -> 4'P4' -> 5'P5' -> 6'P6' -> 7'P7'",
+            "1'P1' -> 2'P2' -> 3'P3' -> 4'P4' -> 5'P5' -> 6'P6' -> 7'P7'",
+            "1'P1' -> 2'P2' -> 3'P3' -> 4'P4' -> 5'P5' -> 6'P6' -> 7'P7'",
+            "Empty list",
+        ])
+
+    def test_display_prints_render_output(self):
+        """Tests display keeps its original output format."""
+        self.player_list.insert_at_tail(self.node1)
+        self.player_list.insert_at_tail(self.node2)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.player_list.display(False)
+            PlayerList().display()
+        self.assertEqual(output.getvalue(), "23'Stephen Curry' -> 20'John Smith'\nEmpty list\n")
+
+    def test_find_by_key_uses_index_after_mutations(self):
+        """Tests find_node_with_key and membership stay in sync with inserts and deletes."""
+        self.player_list.insert_at_tail(self.node1)
+        self.player_list.insert_at_head(self.node2)
+        self.player_list.insert_at_position(self.node3, 1)
+
+        self.assertIs(self.player_list.find_node_with_key("42"), self.node3)
+        self.assertIn("20", self.player_list)
+        self.assertNotIn("1", self.player_list)
+        self.assertIsNone(self.player_list.find_node_with_key("1"))
+
+        self.player_list.delete_head()
+        self.player_list.delete_tail()
+        self.assertNotIn("23", self.player_list)
+        self.assertNotIn("20", self.player_list)
+        self.assertIs(self.player_list.find_node_with_key("42"), self.node3)
+
+    def test_uid_change_keeps_node_under_original_key(self):
+        """Tests reassigning a listed player's uid does not corrupt the index."""
+        self.player_list.extend([self.node1, self.node2, self.node3])
+        self.node1.player.uid = "99"
+        self.node3.player.uid = "98"
+        self.assertIs(self.player_list.find_node_with_key("20"), self.node1)
+        self.assertIsNone(self.player_list.find_node_with_key("99"))
+        self.player_list.delete_head()
+        self.player_list.delete_tail()
+        self.assertTrue(self.player_list.delete_node_with_key("23"))
+        self.assertTrue(self.player_list.is_empty)
+
+    def test_find_many_and_delete_many(self):
+        """Tests batch lookups and deletes report per key and keep the links intact."""
+        self.player_list.extend([self.node1, self.node2, self.node3])
+        found = self.player_list.find_many(["23", "1"])
+        self.assertEqual(found, {"23": self.node2, "1": None})
+
+        deleted = self.player_list.delete_many(["20", "1", "42", "20"])
+        self.assertEqual(deleted, {"20": True, "1": False, "42": True})
+        self.assertEqual(self.player_list.length, 1)
+        self.assertIs(self.player_list.head, self.node2)
+        self.assertIs(self.player_list.tail, self.node2)
+        self.assertIsNone(self.node2.prev)
+        self.assertIsNone(self.node2.next)
+        self.assertNotIn("20", self.player_list)
+
+        self.assertEqual(self.player_list.delete_many(["23"]), {"23": True})
+        self.assertTrue(self.player_list.is_empty)
+        self.assertIsNone(self.player_list.tail)
+
+    def test_listeners_and_insert_after(self):
+        """Tests listeners hear each change in list order, with prev already linked."""
+        events = []
+
+        class Recorder:
+            def on_insert(self, node):
+                events.append(("insert", node.key, node.prev.key if node.prev else None))
+
+            def on_delete(self, node):
+                events.append(("delete", node.key))
+
+        recorder = Recorder()
+        self.player_list.add_listener(recorder)
+        self.player_list.extend_left([self.node1, self.node2])
+        self.player_list.insert_after(self.node2, self.node3)
+        self.player_list.delete_many(["20"])
+        self.player_list.remove_listener(recorder)
+        self.player_list.delete_head()
+        self.assertEqual(events, [("insert", "23", None), ("insert", "20", "23"),
+                                  ("insert", "42", "23"), ("delete", "20")])
+        self.assertEqual([node.key for node in self.player_list], ["42"])
+        with self.assertRaises(ValueError):
+            self.player_list.insert_after(self.node1, PlayerNode(Player("7", "Bond")))
+
+    def test_concat_moves_other_list(self):
+        """Tests concat relinks the ends, merges the index and empties the other list."""
+        self.player_list.extend([self.node1])
+        other = PlayerList.from_iterable([self.node2, self.node3])
+        self.player_list.concat(other)
+        self.assertEqual([node.key for node in self.player_list], ["20", "23", "42"])
+        self.assertEqual([node.key for node in reversed(self.player_list)], ["42", "23", "20"])
+        self.assertEqual(self.player_list.length, 3)
+        self.assertIs(self.player_list.find_node_with_key("42"), self.node3)
+        self.assertTrue(other.is_empty)
+        self.assertNotIn("42", other)
+        with self.assertRaises(ValueError):
+            self.player_list.concat(PlayerList.from_iterable([PlayerNode(Player("20", "Again"))]))
+        empty = PlayerList()
+        empty.concat(self.player_list)
+        self.assertEqual([node.key for node in empty], ["20", "23", "42"])
+
+    def test_split_at_either_side(self):
+        """Tests split_at near the tail and near the head, and on an IndexedPlayerList."""
+        for cls in (PlayerList, IndexedPlayerList):
+            for cut, expected in ((8, 8), (2, 2), (1, 1)):
+                player_list = cls.from_iterable(PlayerNode(Player(str(uid), "P")) for uid in range(1, 11))
+                rest = player_list.split_at(player_list.find_node_with_key(str(cut)))
+                self.assertIsInstance(rest, cls)
+                self.assertEqual([node.key for node in player_list], [str(uid) for uid in range(1, expected)])
+                self.assertEqual([node.key for node in reversed(rest)], [str(uid) for uid in range(10, expected - 1, -1)])
+                self.assertEqual((player_list.length, rest.length), (expected - 1, 11 - expected))
+                self.assertNotIn(str(cut), player_list)
+                self.assertIn(str(cut), rest)
+                self.assertIn("10", rest)
+        with self.assertRaises(ValueError):
+            rest.split_at(self.node1)
+
+    def test_insert_at_position_links_and_counts_node(self):
+        """Tests insert_at_position in the middle of the list."""
+        self.player_list.insert_at_tail(self.node1)
+        self.player_list.insert_at_tail(self.node2)
+        self.player_list.insert_at_position(self.node3, 1)
+
+        self.assertEqual(self.player_list.length, 3)
+        self.assertEqual([node.key for node in self.player_list], ["20", "42", "23"])
+        self.assertEqual([node.key for node in reversed(self.player_list)], ["23", "42", "20"])
+
+    def test_insert_duplicate_key_raises(self):
+        """Tests that a uid can only be held once by the list."""
+        self.player_list.insert_at_tail(self.node1)
+        with self.assertRaises(ValueError):
+            self.player_list.insert_at_head(PlayerNode(Player("20", "Someone Else")))
+        self.assertEqual(self.player_list.length, 1)
+
+    def test_from_iterable_links_nodes_in_order(self):
+        """Tests bulk construction of a list."""
+        player_list = PlayerList.from_iterable([self.node1, self.node2, self.node3])
+        self.assertEqual(player_list.length, 3)
+        self.assertEqual([node.key for node in player_list], ["20", "23", "42"])
+        self.assertEqual([node.key for node in reversed(player_list)], ["42", "23", "20"])
+        self.assertIs(player_list.find_node_with_key("23"), self.node2)
+
+    def test_extend_and_extend_left_match_single_inserts(self):
+        """Tests extend behaves like insert_at_tail and extend_left like insert_at_head."""
+        self.player_list.insert_at_tail(self.node1)
+        self.player_list.extend([self.node2])
+        self.player_list.extend_left([self.node3, PlayerNode(Player("7", "James Bond"))])
+        self.assertEqual([node.key for node in self.player_list], ["7", "42", "20", "23"])
+        self.assertEqual([node.key for node in reversed(self.player_list)], ["23", "20", "42", "7"])
+        self.assertEqual(self.player_list.length, 4)
+        self.assertIsNone(self.player_list.head.prev)
+        self.assertIsNone(self.player_list.tail.next)
+
+    def test_extend_with_clashing_key_inserts_nothing(self):
+        """Tests a batch with a duplicate key leaves the list untouched."""
+        self.player_list.insert_at_tail(self.node1)
+        with self.assertRaises(ValueError):
+            self.player_list.extend([self.node2, PlayerNode(Player("20", "Someone Else"))])
+        with self.assertRaises(ValueError):
+            self.player_list.extend_left([self.node2, PlayerNode(Player("23", "Someone Else"))])
+        self.assertEqual([node.key for node in self.player_list], ["20"])
+        self.assertNotIn("23", self.player_list)
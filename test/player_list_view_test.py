@@ -0,0 +1,184 @@
+import gc
+import io
+import random
+import unittest
+from concurrent_player_list import ConcurrentPlayerList
+from indexed_player_list import IndexedPlayerList
+from player_list import PlayerList
+from helpers import make_node
+
+
+class TestPlayerListView(unittest.TestCase):
+    """Tests for PlayerList.snapshot() and the PlayerListView it returns."""
+
+    def setUp(self):
+        """Initialize test fixtures before each test method."""
+        self.player_list = PlayerList.from_iterable(make_node(uid) for uid in range(1, 6))
+
+    def keys(self, nodes):
+        return [node.key for node in nodes]
+
+    def test_view_is_unaffected_by_later_writes(self):
+        """Tests every kind of write leaves an earlier view unchanged."""
+        view = self.player_list.snapshot()
+        self.player_list.insert_at_head(make_node(6))
+        self.player_list.insert_at_position(make_node(7), 3)
+        self.player_list.delete_node_with_key("3")
+        self.player_list.delete_tail()
+        self.player_list.delete_many(["1"])
+        self.player_list.extend([make_node(8)])
+        self.assertEqual(self.keys(view), ["1", "2", "3", "4", "5"])
+        self.assertEqual(self.keys(reversed(view)), ["5", "4", "3", "2", "1"])
+        self.assertEqual((len(view), view.head.key, view.tail.key), (5, "1", "5"))
+        self.assertIn("3", view)
+        self.assertIsNone(view.find_node_with_key("8"))
+        self.assertEqual(self.keys(self.player_list), ["6", "2", "7", "4", "8"])
+
+    def test_views_share_one_generation_and_later_views_see_new_state(self):
+        """Tests views taken between the same writes share their saved state."""
+        first = self.player_list.snapshot()
+        second = self.player_list.snapshot()
+        self.player_list.delete_head()
+        third = self.player_list.snapshot()
+        self.assertIs(first._generation, second._generation)
+        self.assertIsNot(first._generation, third._generation)
+        self.assertEqual(self.keys(third), ["2", "3", "4", "5"])
+        self.player_list.delete_head()
+        self.assertEqual(self.keys(third), ["2", "3", "4", "5"])
+        self.assertEqual(self.keys(first), ["1", "2", "3", "4", "5"])
+
+    def test_writes_save_only_the_nodes_they_relink(self):
+        """Tests a write after a snapshot costs O(1), not a copy of the list."""
+        player_list = PlayerList.from_iterable(make_node(uid) for uid in range(1, 10_001))
+        view = player_list.snapshot()
+        player_list.delete_node_with_key("5000")
+        player_list.insert_at_tail(make_node(20_000))
+        self.assertEqual(len(view._generation.history.links), 4)
+        self.assertEqual(len(view), 10_000)
+        self.assertEqual(self.keys(view)[4998:5001], ["4999", "5000", "5001"])
+
+    def test_view_freezes_names(self):
+        """Tests renames after the snapshot do not show through the view."""
+        node = self.player_list.find_node_with_key("2")
+        node.player.name = "Before"
+        view = self.player_list.snapshot()
+        node.player.name = "After"
+        node.player.name = "Later"
+        self.player_list.delete_node_with_key("2")
+        node.player.name = "Deleted"
+        self.assertEqual(view.find_node_with_key("2").name, "Before")
+        self.assertEqual([node.name for node in view][:2], ["Player 1", "Before"])
+        self.assertEqual(self.player_list.snapshot().find_node_with_key("3").name, "Player 3")
+
+    def test_view_yields_detached_copies(self):
+        """Tests the view never hands out the list's own nodes."""
+        view = self.player_list.snapshot()
+        head = view.head
+        self.assertIsNot(head, self.player_list.head)
+        self.assertIsNone(head.next)
+        self.assertEqual((head.key, head.player.uid, view.tail.key), ("1", "1", "5"))
+
+    def test_concat_and_split_keep_views(self):
+        """Tests views survive their nodes moving to another list."""
+        other = PlayerList.from_iterable(make_node(uid) for uid in range(6, 9))
+        view, other_view = self.player_list.snapshot(), other.snapshot()
+        self.player_list.concat(other)
+        self.player_list.delete_node_with_key("7")
+        rest = self.player_list.split_at(self.player_list.find_node_with_key("3"))
+        rest.delete_node_with_key("6")
+        rest.insert_at_head(make_node(9))
+        self.assertEqual(self.keys(view), ["1", "2", "3", "4", "5"])
+        self.assertEqual(self.keys(other_view), ["6", "7", "8"])
+        self.assertEqual(self.keys(reversed(other_view)), ["8", "7", "6"])
+        self.assertEqual(self.keys(rest), ["9", "3", "4", "5", "8"])
+
+    def test_many_overlapping_views_under_random_writes(self):
+        """Tests every pending view keeps its state through mixed writes, renames and compaction."""
+        rng = random.Random(7)
+        player_list = PlayerList.from_iterable(make_node(uid) for uid in range(1, 201))
+        next_uid = 201
+        views = []
+
+        def state(nodes):
+            return [(node.key, node.name) for node in nodes]
+
+        for step in range(4000):
+            if rng.random() < 0.05:
+                views.append((player_list.snapshot(), state(player_list)))
+            if views and rng.random() < 0.02:
+                views.pop(rng.randrange(len(views)))[0].release()
+            keys = list(player_list._index)
+            action = rng.randrange(6)
+            if action == 0 or len(keys) < 50:
+                player_list.insert_at_position(make_node(next_uid), rng.randint(0, len(keys)))
+                next_uid += 1
+            elif action == 1:
+                player_list.insert_after(player_list.find_node_with_key(rng.choice(keys)), make_node(next_uid))
+                next_uid += 1
+            elif action == 2:
+                player_list.delete_node_with_key(rng.choice(keys))
+            elif action == 3:
+                player_list.delete_many(rng.sample(keys, 3))
+            elif action == 4:
+                player_list.find_node_with_key(rng.choice(keys)).player.name = f"Step {step}"
+            else:
+                player_list.delete_head() if step % 2 else player_list.delete_tail()
+        self.assertGreater(len(views), 5)
+        for view, expected in views:
+            self.assertEqual(state(view), expected)
+            self.assertEqual(state(reversed(view)), expected[::-1])
+        history = views[0][0]._generation.history
+        self.assertLessEqual(history.saved, history.compact_at)
+
+    def test_release(self):
+        """Tests released and dropped views stop costing the writers anything."""
+        with self.player_list.snapshot() as view:
+            pass
+        with self.assertRaises(ValueError):
+            list(view)
+        self.player_list.delete_head()
+        self.assertIsNone(self.player_list._histories)
+        self.player_list.snapshot()
+        gc.collect()
+        self.player_list.delete_head()
+        self.assertIsNone(self.player_list._histories)
+
+    def test_render(self):
+        """Tests a view renders like the list it was taken from."""
+        view = self.player_list.snapshot()
+        self.player_list.delete_head()
+        output = io.StringIO()
+        view.render(output, head=1, tail=1)
+        self.assertEqual(output.getvalue(), "1'Player 1' -> ...(3 more) -> 5'Player 5'\n")
+        empty = PlayerList().snapshot()
+        self.assertTrue(empty.is_empty)
+        self.assertIsNone(empty.head)
+
+    def test_indexed_and_concurrent_lists(self):
+        """Tests subclass and wrapper writes also preserve views."""
+        indexed = IndexedPlayerList.from_iterable(make_node(uid) for uid in range(1, 6))
+        view = indexed.snapshot()
+        del indexed[2]
+        indexed.insert_at_position(make_node(9), 1)
+        self.assertEqual(self.keys(view), ["1", "2", "3", "4", "5"])
+
+        concurrent = ConcurrentPlayerList(make_node(uid) for uid in range(1, 4))
+        view = concurrent.snapshot()
+        concurrent.delete_node_with_key("2")
+        self.assertEqual(self.keys(view), ["1", "2", "3"])
+        view.release()
+
+    def test_concurrent_view_reads_in_chunks(self):
+        """Tests a reader only holds the writers' lock while reading a chunk."""
+        concurrent = ConcurrentPlayerList(make_node(uid) for uid in range(1, 2501))
+        with concurrent.snapshot() as view:
+            nodes = iter(view)
+            next(nodes)
+            self.assertFalse(concurrent._write_lock.locked())
+            concurrent.delete_node_with_key("1500")
+            concurrent.insert_at_tail(make_node(3000))
+            self.assertEqual(len(list(nodes)), 2499)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+from unittest import mock
+import player_name_index
+from indexed_player_list import IndexedPlayerList
+from player import Player
+from player_list import PlayerList
+from player_name_index import PlayerNameIndex
+from player_node import PlayerNode
+
+NAMES = ["Stephen Curry", "steve Nash", "Stella Artois", "Kevin Steel", "Ann Stone", "Bob"]
+
+
+class TestPlayerNameIndex(unittest.TestCase):
+    """Tests for the PlayerNameIndex prefix and substring search."""
+
+    def setUp(self):
+        """Initialize test fixtures before each test method."""
+        self.player_list = PlayerList.from_iterable(
+            PlayerNode(Player(str(uid), name)) for uid, name in enumerate(NAMES, start=1)
+        )
+        self.index = PlayerNameIndex(self.player_list, substrings=True)
+
+    def names(self, nodes):
+        return [node.name for node in nodes]
+
+    def test_prefix_is_case_insensitive_sorted_and_limited(self):
+        """Tests prefix queries match any case, in name order, lazily."""
+        self.assertEqual(self.names(self.index.prefix("STE")),
+                         ["Stella Artois", "Stephen Curry", "steve Nash"])
+        self.assertEqual(self.names(self.index.prefix("ste", limit=2)), ["Stella Artois", "Stephen Curry"])
+        self.assertEqual(self.names(self.index.prefix("zz")), [])
+
+    def test_case_sensitive(self):
+        """Tests ignore_case=False keeps case significant."""
+        index = PlayerNameIndex(self.player_list, ignore_case=False)
+        self.assertEqual(self.names(index.prefix("ste")), ["steve Nash"])
+        with self.assertRaises(ValueError):
+            list(index.substring("ste"))
+
+    def test_substring(self):
+        """Tests n-gram and short substring queries."""
+        self.assertEqual(sorted(self.names(self.index.substring("STE"))),
+                         ["Kevin Steel", "Stella Artois", "Stephen Curry", "steve Nash"])
+        self.assertEqual(self.names(self.index.substring("ob")), ["Bob"])
+        self.assertEqual(len(list(self.index.substring("e", limit=2))), 2)
+
+    def test_follows_every_write_path(self):
+        """Tests inserts, deletes and re-inserts keep the index consistent."""
+        self.player_list.delete_node_with_key("1")
+        self.player_list.delete_many(["2"])
+        self.player_list.insert_at_head(PlayerNode(Player("7", "Stefan")))
+        self.player_list.insert_after(self.player_list.head, PlayerNode(Player("1", "Stephen Curry")))
+        self.player_list.delete_tail()
+        self.assertEqual(self.names(self.index.prefix("ste")), ["Stefan", "Stella Artois", "Stephen Curry"])
+        self.assertEqual(self.names(self.index.substring("bob")), [])
+        self.assertEqual(sorted(self.names(self.index.substring("phen"))), ["Stephen Curry"])
+        self.assertEqual(len(self.index), 5)
+        self.index.close()
+        self.player_list.delete_head()
+        self.assertEqual(len(self.index), 5)
+
+    def test_stale_entries_are_dropped(self):
+        """Tests heavy deletes are compacted and the index tracks subclasses too."""
+        player_list = IndexedPlayerList.from_iterable(
+            PlayerNode(Player(str(uid), f"Name {uid}")) for uid in range(1, 101)
+        )
+        index = PlayerNameIndex(player_list)
+        del player_list[:90]
+        self.assertEqual(len(list(index.prefix("name"))), 10)
+        self.assertEqual(sum(map(len, index._chunks)), 10)
+
+    def test_follows_renames(self):
+        """Tests renaming a listed player re-files it and renaming a stranger does nothing."""
+        self.player_list.find_node_with_key("6").player.name = "Steph Bob"
+        self.player_list.find_node_with_key("1").player.name = "Wardell Curry"
+        Player("3", "Stranger").name = "Stevie"
+        self.assertEqual(self.names(self.index.prefix("ste")), ["Stella Artois", "Steph Bob", "steve Nash"])
+        self.assertEqual(self.names(self.index.prefix("ward")), ["Wardell Curry"])
+        self.assertEqual(self.names(self.index.substring("bob")), ["Steph Bob"])
+        self.index.close()
+        self.player_list.find_node_with_key("6").player.name = "Bob"
+        self.assertEqual([node.key for node in self.index.prefix("steph")], ["6"])
+
+    def test_chunks_split_and_queries_survive_writes(self):
+        """Tests inserts keep the chunks sorted and a running query resumes after writes."""
+        with mock.patch.object(player_name_index, "CHUNK_SIZE", 4):
+            player_list = PlayerList.from_iterable(
+                PlayerNode(Player(str(uid), f"Name {uid:03}")) for uid in range(1, 31, 2)
+            )
+            index = PlayerNameIndex(player_list)
+            query = index.prefix("name")
+            first = [next(query).name for _ in range(3)]
+            for uid in range(2, 31, 2):
+                player_list.insert_at_tail(PlayerNode(Player(str(uid), f"Name {uid:03}")))
+            player_list.delete_node_with_key("9")
+            rest = [node.name for node in query]
+        self.assertEqual(first, ["Name 001", "Name 003", "Name 005"])
+        self.assertEqual(rest, [f"Name {uid:03}" for uid in range(6, 31) if uid != 9])
+        self.assertTrue(all(len(chunk) <= 8 for chunk in index._chunks))
+        self.assertEqual([entry for chunk in index._chunks for entry in chunk],
+                         sorted((f"name {uid:03}", str(uid)) for uid in range(1, 31) if uid != 9))
+        self.assertEqual(index._maxes, [chunk[-1] for chunk in index._chunks])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+from indexed_player_list import IndexedPlayerList
+from player_list import PlayerList
+from player_node_pool import PlayerNodePool
+from helpers import make_player
+
+
+class TestPlayerNodePool(unittest.TestCase):
+    """Tests for PlayerNodePool and pooled PlayerList deletes."""
+
+    def setUp(self):
+        """Initialize test fixtures before each test method."""
+        self.pool = PlayerNodePool(capacity=3)
+        self.player_list = PlayerList()
+        self.player_list.use_pool(self.pool)
+        for uid in range(1, 6):
+            self.player_list.insert_at_tail(self.pool.acquire(make_player(uid)))
+
+    def test_deleted_nodes_are_reset_and_reused(self):
+        """Tests every delete path returns its node to the pool with its links cleared."""
+        head, tail, middle = self.player_list.head, self.player_list.tail, self.player_list.find_node_with_key("3")
+        self.player_list.delete_head()
+        self.player_list.delete_tail()
+        self.player_list.delete_node_with_key("3")
+        self.assertEqual(len(self.pool), 3)
+        for node in (head, tail, middle):
+            self.assertIsNone(node.player)
+            self.assertIsNone(node.next)
+            self.assertIsNone(node.prev)
+        node = self.pool.acquire(make_player(9))
+        self.assertIs(node, middle)
+        self.assertEqual(node.key, "9")
+        self.player_list.insert_at_head(node)
+        self.assertEqual([node.key for node in self.player_list], ["9", "2", "4"])
+        self.assertEqual([node.key for node in reversed(self.player_list)], ["4", "2", "9"])
+
+    def test_capacity_and_stats(self):
+        """Tests a full pool discards nodes and the statistics add up."""
+        self.player_list.delete_many(["1", "2", "3", "4", "5"])
+        self.assertTrue(self.player_list.is_empty)
+        self.assertEqual(len(self.pool), 3)
+        self.pool.acquire(make_player(6))
+        self.assertEqual(self.pool.stats(), {
+            "hits": 1, "misses": 5, "hit_rate": 1 / 6, "released": 3,
+            "discarded": 2, "size": 2, "capacity": 3,
+        })
+        self.pool.clear()
+        self.assertEqual(len(self.pool), 0)
+        with self.assertRaises(ValueError):
+            PlayerNodePool(capacity=-1)
+
+    def test_double_release_is_ignored(self):
+        """Tests a node released twice is only pooled once."""
+        node = self.player_list.head
+        self.player_list.delete_head()
+        self.assertFalse(self.pool.release(node))
+        self.assertEqual(len(self.pool), 1)
+
+    def test_moved_nodes_are_not_pooled(self):
+        """Tests split_at and concat on a pooled IndexedPlayerList keep the moved nodes out of the pool."""
+        player_list = IndexedPlayerList()
+        player_list.use_pool(self.pool)
+        for uid in range(1, 6):
+            player_list.insert_at_tail(self.pool.acquire(make_player(uid)))
+        released = self.pool.stats()["released"]
+        rest = player_list.split_at(player_list.find_node_with_key("3"))
+        self.assertEqual([node.name for node in rest], ["Player 3", "Player 4", "Player 5"])
+        player_list.concat(rest)
+        self.assertEqual([node.name for node in player_list],
+                         [f"Player {uid}" for uid in range(1, 6)])
+        self.assertEqual(self.pool.stats()["released"], released)
+        self.assertNotIn(self.pool.acquire(make_player(9)), list(player_list))
+
+    def test_listeners_and_pooling_exclude_each_other(self):
+        """Tests a pooled list refuses listeners and a list with listeners refuses a pool."""
+        class Recorder:
+            def on_insert(self, node):
+                pass
+
+            def on_delete(self, node):
+                pass
+
+        recorder = Recorder()
+        with self.assertRaises(ValueError):
+            self.player_list.add_listener(recorder)
+        self.player_list.use_pool(None)
+        self.player_list.add_listener(recorder)
+        with self.assertRaises(ValueError):
+            self.player_list.use_pool(self.pool)
+        self.player_list.remove_listener(recorder)
+        self.player_list.use_pool(self.pool)
+
+    def test_snapshots_and_pooling_exclude_each_other(self):
+        """Tests a pooled list refuses snapshots and a snapshotted list refuses a pool."""
+        with self.assertRaises(ValueError):
+            self.player_list.snapshot()
+        self.player_list.use_pool(None)
+        view = self.player_list.snapshot()
+        with self.assertRaises(ValueError):
+            self.player_list.use_pool(self.pool)
+        view.release()
+        self.player_list.use_pool(self.pool)
+
+    def test_indexed_list_releases_positional_deletes(self):
+        """Tests IndexedPlayerList returns nodes deleted by position to the pool."""
+        indexed = IndexedPlayerList()
+        indexed.use_pool(self.pool)
+        for uid in range(10, 15):
+            indexed.insert_at_tail(PlayerNodePool(0).acquire(make_player(uid)))
+        del indexed[2]
+        indexed.delete_node_with_key("11")
+        indexed.delete_head()
+        self.assertEqual([node.key for node in indexed], ["13", "14"])
+        self.assertEqual(len(self.pool), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+from player import PlayerName
+from player_list import PlayerList
+from player_name_index import PlayerNameIndex
+from player_node import PlayerNode
+from sorted_player_list import SortedPlayerList
+from helpers import make_node
+
+
+NAMES = ["Steve", "alice", "stella", "Bob", "Stan", "carol"]
+
+
+def named_node(uid: int) -> PlayerNode:
+    return make_node(uid, NAMES[(uid - 1) % len(NAMES)])
+
+
+class TestPlayerQuery(unittest.TestCase):
+    """Tests for the lazy PlayerQuery pipeline."""
+
+    def setUp(self):
+        """Initialize test fixtures before each test method."""
+        self.player_list = PlayerList.from_iterable(named_node(uid) for uid in range(1, 13))
+
+    def test_where_select_limit_reverse(self):
+        """Tests the steps compose and match an eager comprehension."""
+        query = self.player_list.query().where(lambda node: int(node.key) % 2 == 0).select(lambda node: node.key)
+        self.assertEqual(list(query), [str(uid) for uid in range(2, 13, 2)])
+        self.assertEqual(list(query.limit(2)), ["2", "4"])
+        self.assertEqual(list(query.reverse().limit(2)), ["12", "10"])
+        self.assertEqual(list(query.limit(3).limit(5)), ["2", "4", "6"])
+        self.assertEqual(query.first(), "2")
+        self.assertIsNone(query.where(lambda key: key == "99").first())
+        self.assertEqual(query.explain(), "scan")
+
+    def test_query_is_lazy(self):
+        """Tests nothing runs before iteration and limit() stops the walk early."""
+        seen = []
+        query = self.player_list.query().where(lambda node: seen.append(node.key) or True).limit(3)
+        self.assertEqual(seen, [])
+        self.assertEqual(len(list(query)), 3)
+        self.assertEqual(seen, ["1", "2", "3"])
+
+    def test_uid_conditions_use_the_index(self):
+        """Tests uid and uids are answered by the uid index, in the order given."""
+        query = self.player_list.query().where(uids=["7", "99", "3", "7"])
+        self.assertEqual(query.explain(), "uid index")
+        self.assertEqual([node.key for node in query], ["7", "3"])
+        self.assertEqual([node.key for node in query.reverse()], ["3", "7"])
+        self.assertEqual([node.key for node in query.where(uid="3")], ["3"])
+        self.assertEqual(self.player_list.query().where(uid="99").first(), None)
+
+    def test_keyword_conditions_scan_without_an_index(self):
+        """Tests uid_range and name_prefix filter by scanning when no index applies."""
+        query = self.player_list.query().where(uid_range=("4", 9))
+        self.assertEqual(query.explain(), "scan")
+        self.assertEqual([node.key for node in query], ["4", "5", "6", "7", "8", "9"])
+        query = self.player_list.query().where(name_prefix="ST")
+        self.assertEqual([node.key for node in query], ["1", "3", "5", "7", "9", "11"])
+
+    def test_sorted_list_answers_uid_ranges(self):
+        """Tests a SortedPlayerList ordered by uid serves uid_range from its ordering."""
+        sorted_list = SortedPlayerList(named_node(uid) for uid in range(12, 0, -1))
+        query = sorted_list.query().where(uid_range=(4, "9"), predicate=lambda node: node.key != "5")
+        self.assertEqual(query.explain(), "sorted uid index")
+        self.assertEqual([node.key for node in query], ["4", "6", "7", "8", "9"])
+        self.assertEqual(query.reverse().explain(), "scan")
+        self.assertEqual([node.key for node in query.reverse()], ["9", "8", "7", "6", "4"])
+
+    def test_uid_range_with_an_open_bound(self):
+        """Tests a None bound of uid_range is unbounded on both the scan and the indexed plan."""
+        sorted_list = SortedPlayerList(named_node(uid) for uid in range(12, 0, -1))
+        for source, plan in ((self.player_list, "scan"), (sorted_list, "sorted uid index")):
+            above = source.query().where(uid_range=(10, None))
+            below = source.query().where(uid_range=(None, "3"))
+            self.assertEqual((above.explain(), below.explain()), (plan, plan))
+            self.assertEqual([node.key for node in above], ["10", "11", "12"])
+            self.assertEqual([node.key for node in below], ["1", "2", "3"])
+            self.assertEqual(len(list(source.query().where(uid_range=(None, None)))), 12)
+
+    def test_name_index_answers_prefixes(self):
+        """Tests an attached PlayerNameIndex serves name_prefix and tracks changes."""
+        index = PlayerNameIndex(self.player_list)
+        query = self.player_list.query().where(name_prefix="ste")
+        self.assertEqual(query.explain(), "name index")
+        self.assertEqual(sorted(node.key for node in query), ["1", "3", "7", "9"])
+        self.player_list.delete_node_with_key("1")
+        self.assertEqual(sorted(node.key for node in query), ["3", "7", "9"])
+        index.close()
+        self.assertEqual(query.explain(), "scan")
+        self.assertEqual([node.key for node in query], ["3", "7", "9"])
+
+    def test_index_candidates_are_rechecked(self):
+        """Tests rows an index proposes still have to match every condition, in index order."""
+        index = PlayerNameIndex(self.player_list)
+        self.addCleanup(index.close)
+        # Stop the index hearing renames, so it falls behind.
+        PlayerName.remove_listener(index)
+        self.addCleanup(PlayerName.add_listener, index)
+        self.player_list.find_node_with_key("3").player.name = "Zed"
+        query = self.player_list.query().where(name_prefix="ste")
+        self.assertEqual(query.explain(), "name index")
+        self.assertEqual([node.key for node in query], ["9", "1", "7"])
+        self.assertEqual([node.key for node in query.limit(2)], ["9", "1"])
+        scan = self.player_list.query().where(lambda node: node.name.casefold().startswith("ste"))
+        self.assertEqual([node.key for node in scan.limit(2)], ["1", "7"])
+
+    def test_keyword_after_select_is_rejected(self):
+        """Tests index conditions cannot follow a select()."""
+        query = self.player_list.query().select(lambda node: node.name)
+        with self.assertRaises(ValueError):
+            query.where(uid="1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import gc
+import threading
+import unittest
+import weakref
+from multiprocessing import Pipe
+from multiprocessing.connection import Client, Listener
+from player import Player, PlayerName
+from player_list import PlayerList
+from player_replication import PlayerChangelog, PlayerReplica
+from helpers import make_node
+
+
+class TestPlayerReplication(unittest.TestCase):
+    """Tests for PlayerChangelog and PlayerReplica delta replication."""
+
+    def setUp(self):
+        """Initialize test fixtures before each test method."""
+        self.primary = PlayerList.from_iterable(make_node(uid) for uid in range(1, 6))
+        self.changelog = PlayerChangelog(self.primary, capacity=8)
+        self.addCleanup(self.changelog.close)
+        primary_end, replica_end = Pipe()
+        server = threading.Thread(target=self.changelog.serve, args=(primary_end,))
+        server.start()
+        self.replica = PlayerReplica(replica_end)
+
+        def stop():
+            self.replica.close()
+            server.join()
+            primary_end.close()
+        self.addCleanup(stop)
+
+    def assertInSync(self):
+        self.assertEqual([(node.key, node.name) for node in self.replica.player_list],
+                         [(node.key, node.name) for node in self.primary])
+        self.assertEqual(self.replica.version, self.changelog.version)
+
+    def test_first_sync_is_full_then_deltas(self):
+        """Tests the replica loads everything once, then only the changes."""
+        self.assertIsNone(self.replica.version)
+        self.assertEqual(self.replica.sync(), "full")
+        self.assertInSync()
+        self.primary.insert_at_head(make_node(10))
+        self.primary.insert_after(self.primary.find_node_with_key("3"), make_node(11))
+        self.primary.delete_node_with_key("2")
+        self.primary.delete_tail()
+        self.primary.find_node_with_key("4").player.name = "Renamed"
+        self.assertEqual(self.changelog.version, 5)
+        received = self.replica.bytes_received
+        self.assertEqual(self.replica.sync(), "delta")
+        self.assertInSync()
+        self.assertEqual(self.replica.player_list.find_node_with_key("4").name, "Renamed")
+        self.assertEqual(self.replica.sync(), "delta")
+        self.assertLess(self.replica.bytes_received - received, 200)
+        self.assertEqual((self.replica.deltas, self.replica.full_resyncs), (2, 1))
+
+    def test_renames_outside_the_list_are_ignored(self):
+        """Tests only players held by the followed list are recorded."""
+        stranger = Player("99", "Stranger")
+        stranger.name = "Someone"
+        copy = Player("1", "Copy")
+        copy.name = "Other"
+        self.assertEqual(self.changelog.version, 0)
+
+    def test_dropped_changelog_stops_listening_to_renames(self):
+        """Tests a changelog that is never closed does not outlive its list."""
+        player_list = PlayerList.from_iterable([make_node(1)])
+        changelog = PlayerChangelog(player_list)
+        self.assertIn(changelog, PlayerName._listeners)
+        collected = weakref.ref(changelog)
+        del player_list, changelog
+        gc.collect()
+        self.assertIsNone(collected())
+        self.assertNotIn(None, [listener for listener in PlayerName._listeners])
+
+    def test_falls_back_to_full_resync_when_behind(self):
+        """Tests a replica further behind than the changelog keeps is reloaded."""
+        self.replica.sync()
+        for uid in range(20, 30):
+            self.primary.insert_at_tail(make_node(uid))
+        self.assertIsNone(self.changelog.delta_since(0))
+        self.assertEqual(self.replica.sync(), "full")
+        self.assertInSync()
+
+    def test_new_changelog_forces_full_resync(self):
+        """Tests a replica synced against another changelog epoch is reloaded."""
+        self.replica.sync()
+        self.changelog.epoch += 1
+        self.primary.delete_head()
+        self.assertEqual(self.replica.sync(), "full")
+        self.assertInSync()
+
+
+class TestPlayerReplicationOverSocket(unittest.TestCase):
+    """Tests replication over a local socket connection."""
+
+    def test_sync_over_socket(self):
+        """Tests a replica connected through a multiprocessing Listener stays in sync."""
+        primary = PlayerList.from_iterable(make_node(uid) for uid in range(1, 4))
+        with PlayerChangelog(primary) as changelog, Listener(("127.0.0.1", 0)) as listener:
+            def accept():
+                with listener.accept() as connection:
+                    changelog.serve(connection)
+            server = threading.Thread(target=accept)
+            server.start()
+            with PlayerReplica(Client(listener.address)) as replica:
+                replica.sync()
+                primary.delete_node_with_key("2")
+                self.assertEqual(replica.sync(), "delta")
+                self.assertEqual([node.key for node in replica.player_list], ["1", "3"])
+            server.join()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import os
+import sys
+import tempfile
+import unittest
+from player_list import PlayerList
+from player_node import PlayerNode
+from player_snapshot import MappedPlayerList
+from player import Player
+
+
+class TestPlayerSnapshot(unittest.TestCase):
+    """Tests for saving and loading PlayerList binary snapshots."""
+
+    def setUp(self):
+        """Initialize test fixtures before each test method."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "roster.bin")
+        self.player_list = PlayerList.from_iterable([
+            PlayerNode(Player("20", "John Smith")),
+            PlayerNode(Player("23", "Stéphane Curry")),
+            PlayerNode(Player("42", "Douglas Adams")),
+        ])
+
+    def test_load_without_mmap_returns_player_list(self):
+        """Tests a full load restores order and the uid index."""
+        self.player_list.save(self.path)
+        loaded = PlayerList.load(self.path, mmap=False)
+        self.assertIsInstance(loaded, PlayerList)
+        self.assertEqual([node.key for node in loaded], ["20", "23", "42"])
+        self.assertEqual(loaded.find_node_with_key("23").name, "Stéphane Curry")
+
+    def test_mapped_load_materialises_lazily(self):
+        """Tests the memory-mapped view builds nodes on access and keeps none of them."""
+        self.player_list.save(self.path)
+        with PlayerList.load(self.path) as loaded:
+            self.assertIsInstance(loaded, MappedPlayerList)
+            self.assertEqual(loaded.length, 3)
+
+            node = loaded.find_node_with_key("42")
+            self.assertEqual(node.name, "Douglas Adams")
+            self.assertEqual((loaded.tail.key, loaded.tail.name), ("42", "Douglas Adams"))
+            # Only this test's name and getrefcount's argument refer to it.
+            self.assertEqual(sys.getrefcount(node), 2)
+            self.assertIn("20", loaded)
+            self.assertNotIn("020", loaded)
+
+            self.assertEqual([node.key for node in reversed(loaded)], ["42", "23", "20"])
+            self.assertEqual(loaded.to_player_list().head.key, "20")
+
+    def test_keyed_lookups_binary_search_the_file(self):
+        """Tests lookups use the saved by-uid section instead of building an index."""
+        player_list = PlayerList.from_iterable(PlayerNode(Player(str(uid), "P")) for uid in (50, 7, 900, 31, 8))
+        player_list.save(self.path)
+        with PlayerList.load(self.path) as loaded:
+            for position, uid in enumerate((50, 7, 900, 31, 8)):
+                self.assertEqual(loaded.find_node_with_key(str(uid)).key, list(loaded)[position].key)
+            for missing in ("1", "9", "49", "901"):
+                self.assertNotIn(missing, loaded)
+            self.assertIsNone(loaded._index)
+
+    def test_empty_list_round_trips(self):
+        """Tests an empty list can be saved and loaded."""
+        PlayerList().save(self.path)
+        with PlayerList.load(self.path) as loaded:
+            self.assertTrue(loaded.is_empty)
+            self.assertIsNone(loaded.head)
+        self.assertTrue(PlayerList.load(self.path, mmap=False).is_empty)
+
+    def test_rejects_other_files(self):
+        """Tests loading a file that is not a snapshot."""
+        with open(self.path, "wb") as file:
+            file.write(b"not a snapshot at all")
+        with self.assertRaises(ValueError):
+            PlayerList.load(self.path)
+
+    def test_rejects_truncated_files(self):
+        """Tests a snapshot cut short anywhere raises ValueError rather than a decoding error."""
+        self.player_list.save(self.path)
+        with open(self.path, "rb") as file:
+            data = file.read()
+        for size in (0, 5, 20, 40, 100, len(data) - 1):
+            with open(self.path, "wb") as file:
+                file.write(data[:size])
+            for use_mmap in (True, False):
+                with self.assertRaises(ValueError):
+                    MappedPlayerList(self.path, use_mmap=use_mmap)
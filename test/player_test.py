@@ -1,5 +1,8 @@
+import gc
 import unittest
-from player import Player
+from player import IntUIDPlayer, Player, PlayerName
+from player_list import PlayerList
+from player_node import PlayerNode
 
 
 class TestPlayerClass(unittest.TestCase):
@@ -84,6 +87,115 @@ class TestPlayerClass(unittest.TestCase):
         player = Player("1", "Alice")
         self.assertEqual(repr(player), "Player(uid='1', name='Alice')")
 
+    def test_player_has_no_instance_dict(self):
+        """Test that players store their attributes in slots"""
+        player = Player("1", "Alice")
+        self.assertFalse(hasattr(player, "__dict__"))
+        with self.assertRaises(AttributeError):
+            player.score = 10
+
+    def test_from_trusted_skips_validation(self):
+        """Test that trusted construction stores the values as given"""
+        player = Player.from_trusted("7", "Bond")
+        self.assertEqual(player.uid, "7")
+        self.assertEqual(player.name, "Bond")
+        self.assertEqual(repr(player), "Player(uid='7', name='Bond')")
+
+    def test_validate_many_normalises_like_descriptors(self):
+        """Test that batched validation applies the descriptor rules"""
+        players = Player.validate_many(["007", " 12 ", "3"], [" Bond ", "Ann", "Zed"])
+        self.assertEqual([p.uid for p in players], ["7", "12", "3"])
+        self.assertEqual([p.name for p in players], ["Bond", "Ann", "Zed"])
+        self.assertEqual(Player.validate_many([], []), [])
+
+    def test_validate_many_rejects_bad_rows(self):
+        """Test that batched validation rejects the same inputs as Player()"""
+        with self.assertRaises(ValueError) as context:
+            Player.validate_many(["1", "nope"], ["Amy", "Ben"])
+        self.assertIn("row 1", str(context.exception))
+        with self.assertRaises(TypeError):
+            Player.validate_many(["1", 2], ["Amy", "Ben"])
+        with self.assertRaises(ValueError):
+            Player.validate_many(["1", "-10"], ["Amy", "Ben"])
+        with self.assertRaises(ValueError):
+            Player.validate_many(["1", "2"], ["Amy", "   "])
+        with self.assertRaises(ValueError):
+            Player.validate_many(["1", "2"], ["Amy", 5])
+        with self.assertRaises(ValueError):
+            Player.validate_many(["1"], ["Amy", "Ben"])
+
+    def test_uid_cache_shares_canonical_strings(self):
+        """Test that equal uids share one interned string and repeats hit the cache"""
+        Player.uid.cache_clear()
+        first = Player(" 0042", "Amy")
+        second = Player(" 0042", "Ben")
+        third = Player("42", "Cat")
+        self.assertIs(first.uid, second.uid)
+        self.assertIs(first.uid, third.uid)
+        info = Player.uid.cache_info()
+        self.assertEqual((info["str"].hits, info["str"].misses), (1, 2))
+        IntUIDPlayer("042", "Dan")
+        IntUIDPlayer("42", "Eve")
+        IntUIDPlayer("42", "Fay")
+        info = IntUIDPlayer.uid.cache_info()
+        self.assertEqual((info["int"].hits, info["int"].misses), (1, 2))
+        # Each int cache miss goes through the string cache.
+        self.assertEqual((info["str"].hits, info["str"].misses), (2, 3))
+        # Invalid input is still rejected on every attempt.
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                Player("-1", "Amy")
+
+    def test_int_uid_player(self):
+        """Test that IntUIDPlayer validates like Player but keeps an int uid"""
+        player = IntUIDPlayer(" 007 ", "Bond")
+        self.assertEqual(player.uid, 7)
+        self.assertEqual(Player("007", "Bond").uid, "7")
+        with self.assertRaises(TypeError):
+            IntUIDPlayer(7, "Bond")
+        self.assertEqual([p.uid for p in IntUIDPlayer.validate_many(["01", "2"], ["A", "B"])], [1, 2])
+        player_list = PlayerList.from_iterable([PlayerNode(player)])
+        self.assertIs(player_list.find_node_with_key(7).player, player)
+
+
+    def test_rename_listeners(self):
+        """Test that PlayerName listeners hear renames but not first names"""
+        renames = []
+
+        class Recorder:
+            def on_rename(self, player, old_name):
+                renames.append((player.uid, old_name, player.name))
+
+        recorder = Recorder()
+        PlayerName.add_listener(recorder)
+        try:
+            player = Player("1", "Amy")
+            player.name = " Amy "
+            player.name = "Ben"
+            del player.name
+        finally:
+            PlayerName.remove_listener(recorder)
+        player.name = "Cat"
+        self.assertEqual(renames, [("1", "Amy", "Ben"), ("1", "Ben", "Anonymous")])
+        with self.assertRaises(ValueError):
+            PlayerName.remove_listener(recorder)
+
+    def test_rename_listeners_are_held_weakly(self):
+        """Test that a listener dropped without remove_listener() is forgotten"""
+        renames = []
+
+        class Recorder:
+            def on_rename(self, player, old_name):
+                renames.append(old_name)
+
+        recorder = Recorder()
+        PlayerName.add_listener(recorder)
+        player = Player("1", "Amy")
+        player.name = "Ben"
+        del recorder
+        gc.collect()
+        player.name = "Cat"
+        self.assertEqual(renames, ["Amy"])
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
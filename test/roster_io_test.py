@@ -0,0 +1,78 @@
+import io
+import unittest
+from player_list import PlayerList
+from player_node import PlayerNode
+from player import Player
+
+
+class TestRosterIO(unittest.TestCase):
+    """Tests for streaming roster import and export."""
+
+    def setUp(self):
+        """Initialize test fixtures before each test method."""
+        self.player_list = PlayerList.from_iterable([
+            PlayerNode(Player("20", "Smith, John")),
+            PlayerNode(Player("23", "Stéphane \"Steph\" Curry")),
+            PlayerNode(Player("42", "Douglas Adams")),
+        ])
+
+    def test_export_yields_bounded_chunks(self):
+        """Tests export chunks hold at most chunk_size records."""
+        chunks = list(self.player_list.iter_export(format="jsonl", chunk_size=2))
+        self.assertEqual([chunk.count("\n") for chunk in chunks], [2, 1])
+        self.assertEqual(list(PlayerList().iter_export()), ["uid,name\n"])
+
+    def test_round_trip_in_both_formats(self):
+        """Tests exported rosters import back unchanged."""
+        for format in ("csv", "jsonl"):
+            text = "".join(self.player_list.iter_export(format=format, chunk_size=2))
+            imported = PlayerList()
+            count = imported.import_stream(io.StringIO(text), format=format, chunk_size=2)
+            self.assertEqual(count, 3)
+            self.assertEqual([(n.key, n.name) for n in imported],
+                             [(n.key, n.name) for n in self.player_list])
+
+    def test_import_applies_player_validation(self):
+        """Tests imported rows are normalised and bad rows raise by default."""
+        imported = PlayerList()
+        imported.import_stream(io.StringIO("uid,name\n007, Bond \n"))
+        self.assertEqual(imported.head.key, "7")
+        self.assertEqual(imported.head.name, "Bond")
+        with self.assertRaises(ValueError):
+            imported.import_stream(io.StringIO("uid,name\n8,Ok\n-1,Bad\n"))
+        self.assertEqual(imported.length, 1)
+
+    def test_skip_policy_reports_bad_records(self):
+        """Tests the skip policy drops bad rows and reports them."""
+        text = ('{"uid": "1", "name": "Amy"}\n'
+                'not json\n'
+                '{"uid": 2, "name": "Ben"}\n'
+                '\n'
+                '{"uid": "3", "name": " "}\n'
+                '{"uid": "1", "name": "Amy Again"}\n'
+                '{"uid": "4", "name": "Dan"}\n')
+        skipped = []
+        imported = PlayerList()
+        count = imported.import_stream(io.StringIO(text), format="jsonl", errors="skip",
+                                       chunk_size=2, on_error=lambda n, e: skipped.append(n))
+        self.assertEqual(count, 2)
+        self.assertEqual([node.key for node in imported], ["1", "4"])
+        self.assertEqual(skipped, [2, 3, 4, 5])
+
+    def test_blank_lines_are_ignored_in_both_formats(self):
+        """Tests blank lines are skipped rather than reported as malformed records."""
+        texts = {"csv": "uid,name\n1,Amy\n\n  \n2,Ben\n\n",
+                 "jsonl": '{"uid": "1", "name": "Amy"}\n\n  \n{"uid": "2", "name": "Ben"}\n\n'}
+        for format, text in texts.items():
+            imported = PlayerList()
+            self.assertEqual(imported.import_stream(io.StringIO(text), format=format), 2)
+            self.assertEqual([node.key for node in imported], ["1", "2"])
+
+    def test_rejects_unknown_options(self):
+        """Tests invalid format and policy arguments."""
+        with self.assertRaises(ValueError):
+            list(self.player_list.iter_export(format="xml"))
+        with self.assertRaises(ValueError):
+            PlayerList().import_stream(io.StringIO(""), errors="ignore")
+        with self.assertRaises(ValueError):
+            PlayerList().import_stream(io.StringIO("id,nick\n"))
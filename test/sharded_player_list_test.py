@@ -0,0 +1,80 @@
+import unittest
+from player import IntUIDPlayer, Player
+from player_node import PlayerNode
+from sharded_player_list import ShardedPlayerList
+
+
+class TestShardedPlayerList(unittest.TestCase):
+    """Tests for the ShardedPlayerList."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start one set of shard workers for all tests, as they are slow to spawn."""
+        cls.sharded = ShardedPlayerList(shards=3, chunk_size=4)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.sharded.close()
+
+    def setUp(self):
+        """Fill the shards with players 1 to 20."""
+        self.sharded.delete_many(str(uid) for uid in range(1, 100))
+        self.sharded.insert_many(PlayerNode(Player(str(uid), f"Player {uid}")) for uid in range(1, 21))
+
+    def test_routes_single_key_operations(self):
+        """Tests insert, find and delete reach the owning shard."""
+        self.sharded.insert(PlayerNode(Player("42", "Answer")))
+        node = self.sharded.find_node_with_key("42")
+        self.assertEqual((node.key, node.name), ("42", "Answer"))
+        self.assertIsNone(node.next)
+        self.assertIn("42", self.sharded)
+        self.assertTrue(self.sharded.delete_node_with_key("42"))
+        self.assertFalse(self.sharded.delete_node_with_key("42"))
+        self.assertIsNone(self.sharded.find_node_with_key("42"))
+        self.assertIsNone(self.sharded.find_node_with_key("007"))
+
+    def test_batched_operations(self):
+        """Tests find_many and delete_many report every key."""
+        found = self.sharded.find_many(["1", "5", "99"])
+        self.assertEqual(found["5"].name, "Player 5")
+        self.assertIsNone(found["99"])
+        self.assertEqual(self.sharded.delete_many(["2", "3", "99", "abc"]),
+                         {"2": True, "3": True, "99": False, "abc": False})
+        self.assertEqual(self.sharded.length, 18)
+
+    def test_int_uid_players(self):
+        """Tests IntUIDPlayer nodes are routed by their int key and come back keyed by int."""
+        self.sharded.insert_many(PlayerNode(IntUIDPlayer(str(uid), f"Int {uid}")) for uid in (31, 32, 33))
+        node = self.sharded.find_node_with_key(32)
+        self.assertEqual((node.key, node.name), (32, "Int 32"))
+        self.assertIsInstance(node.player, IntUIDPlayer)
+        self.assertIn(31, self.sharded)
+        self.assertNotIn(-31, self.sharded)
+        self.assertEqual(self.sharded.delete_many([31, 32, 33, 34]), {31: True, 32: True, 33: True, 34: False})
+        self.assertEqual(self.sharded.length, 20)
+
+    def test_duplicate_insert_raises(self):
+        """Tests a shard's ValueError reaches the caller."""
+        with self.assertRaises(ValueError):
+            self.sharded.insert(PlayerNode(Player("7", "Again")))
+        self.assertEqual(self.sharded.find_node_with_key("7").name, "Player 7")
+
+    def test_iteration_merges_all_shards(self):
+        """Tests iteration yields every player once, in order within each shard."""
+        keys = [node.key for node in self.sharded]
+        self.assertEqual(sorted(keys, key=int), [str(uid) for uid in range(1, 21)])
+        for shard in range(3):
+            owned = [int(key) for key in keys if int(key) % 3 == shard]
+            self.assertEqual(owned, sorted(owned))
+
+    def test_abandoned_iteration(self):
+        """Tests a partly consumed iteration does not disturb later calls."""
+        iterator = iter(self.sharded)
+        next(iterator)
+        iterator.close()
+        self.assertEqual(self.sharded.length, 20)
+        self.assertEqual(len(list(self.sharded)), 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
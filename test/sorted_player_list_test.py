@@ -0,0 +1,84 @@
+import random
+import unittest
+from sorted_player_list import SortedPlayerList
+from helpers import make_node
+
+
+class TestSortedPlayerList(unittest.TestCase):
+    """Tests for the key-ordered SortedPlayerList."""
+
+    def setUp(self):
+        """Initialize test fixtures before each test method."""
+        self.player_list = SortedPlayerList(make_node(uid) for uid in (40, 9, 100, 10, 25))
+
+    def keys(self, nodes):
+        return [node.key for node in nodes]
+
+    def test_uids_sort_numerically(self):
+        """Tests iteration order and links follow numeric uid order."""
+        self.assertEqual(self.keys(self.player_list), ["9", "10", "25", "40", "100"])
+        self.assertEqual(self.keys(reversed(self.player_list)), ["100", "40", "25", "10", "9"])
+        self.assertEqual(self.player_list.head.key, "9")
+        self.assertEqual(self.player_list.tail.key, "100")
+        self.assertEqual(self.player_list[2].key, "25")
+        with self.assertRaises(ValueError):
+            self.player_list.insert(make_node(9))
+
+    def test_range_is_inclusive_and_lazy(self):
+        """Tests range bounds, open ends and normalised uid strings."""
+        self.assertEqual(self.keys(self.player_list.range("10", "40")), ["10", "25", "40"])
+        self.assertEqual(self.keys(self.player_list.range(" 011", 99)), ["25", "40"])
+        self.assertEqual(self.keys(self.player_list.range(hi=10)), ["9", "10"])
+        self.assertEqual(self.keys(self.player_list.range(41)), ["100"])
+        self.assertEqual(self.keys(self.player_list.range(101)), [])
+        generator = self.player_list.range()
+        self.assertEqual(next(generator).key, "9")
+
+    def test_rank_and_nearest(self):
+        """Tests rank counts smaller keys and nearest picks the closest uid."""
+        self.assertEqual(self.player_list.rank("9"), 0)
+        self.assertEqual(self.player_list.rank("26"), 3)
+        self.assertEqual(self.player_list.rank("1000"), 5)
+        self.assertEqual(self.player_list.nearest("30").key, "25")
+        self.assertEqual(self.player_list.nearest("33").key, "40")
+        self.assertEqual(self.player_list.nearest("1").key, "9")
+        self.assertEqual(self.player_list.nearest("5000").key, "100")
+        self.assertIsNone(SortedPlayerList().nearest("1"))
+
+    def test_delete_keeps_order_and_links(self):
+        """Tests deleting head, tail and interior nodes."""
+        for key in ("9", "100", "25"):
+            self.assertTrue(self.player_list.delete_node_with_key(key))
+        self.assertFalse(self.player_list.delete_node_with_key("25"))
+        self.assertEqual(self.keys(self.player_list), ["10", "40"])
+        self.assertEqual(self.keys(reversed(self.player_list)), ["40", "10"])
+        self.assertEqual(self.player_list.rank("40"), 1)
+        self.assertNotIn("25", self.player_list)
+        self.assertEqual(self.player_list.length, 2)
+
+    def test_custom_key_orders_by_name(self):
+        """Tests ordering by another key, with ties kept in insertion order."""
+        player_list = SortedPlayerList(
+            [make_node(1, "Cat"), make_node(2, "Amy"), make_node(3, "Cat"), make_node(4, "Bob")],
+            key=lambda node: node.name)
+        self.assertEqual(self.keys(player_list), ["2", "4", "1", "3"])
+        self.assertEqual(self.keys(player_list.range("B", "Bz")), ["4"])
+        self.assertEqual(player_list.rank("Cat"), 2)
+
+    def test_matches_sorted_under_random_operations(self):
+        """Tests random inserts and deletes against sorted()."""
+        rng = random.Random(3)
+        player_list = SortedPlayerList()
+        expected = set()
+        for _ in range(500):
+            uid = rng.randint(1, 300)
+            if uid in expected:
+                player_list.delete_node_with_key(str(uid))
+                expected.discard(uid)
+            else:
+                player_list.insert(make_node(uid))
+                expected.add(uid)
+        ordered = sorted(expected)
+        self.assertEqual([int(key) for key in self.keys(player_list)], ordered)
+        self.assertEqual([int(key) for key in self.keys(player_list.range(100, 200))],
+                         [uid for uid in ordered if 100 <= uid <= 200])